@@ -1,7 +1,36 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
-from beeai_framework.adapters.beeai.backend.document_processor import LLMDocumentReranker
-from beeai_framework.adapters.beeai.backend.vector_store import TemporalVectorStore
+from beeai_framework.adapters.beeai.backend.document_processor import (
+    BM25Reranker,
+    LLMDocumentReranker,
+    LLMReranker,
+    MMRReranker,
+)
+from beeai_framework.adapters.beeai.backend.lexical_index import BM25Index
+from beeai_framework.adapters.beeai.backend.vector_index import (
+    ExactVectorIndex,
+    IVFVectorIndex,
+    VectorIndex,
+    VectorIndexHits,
+)
+from beeai_framework.adapters.beeai.backend.vector_store import (
+    HybridRetriever,
+    LocalVectorStore,
+    TemporalVectorStore,
+)
 
-__all__ = ["LLMDocumentReranker", "TemporalVectorStore"]
+__all__ = [
+    "BM25Index",
+    "BM25Reranker",
+    "ExactVectorIndex",
+    "HybridRetriever",
+    "IVFVectorIndex",
+    "LLMDocumentReranker",
+    "LLMReranker",
+    "LocalVectorStore",
+    "MMRReranker",
+    "TemporalVectorStore",
+    "VectorIndex",
+    "VectorIndexHits",
+]
@@ -3,24 +3,34 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC
+from collections.abc import Mapping
 from typing import Any
 
-from beeai_framework.adapters.llama_index.mappers.chat import LlamaIndexChatModel
-from beeai_framework.adapters.llama_index.mappers.documents import (
-    doc_with_score_to_li_doc_with_score,
-    li_doc_with_score_to_doc_with_score,
-)
+from pydantic import BaseModel, Field
+
+from beeai_framework.adapters.beeai.backend.lexical_index import BM25Index
 from beeai_framework.backend.chat import ChatModel
-from beeai_framework.backend.document_processor import DocumentProcessor
-from beeai_framework.backend.types import DocumentWithScore
+from beeai_framework.backend.document_processor import DocumentProcessor, Reranker
+from beeai_framework.backend.embedding import EmbeddingModel
+from beeai_framework.backend.message import SystemMessage, UserMessage
+from beeai_framework.backend.types import Document, DocumentWithScore
+from beeai_framework.utils.vectors import import_numpy, normalize
 
+# optional modules are only required by the classes which use them
 try:
     from llama_index.core.postprocessor.llm_rerank import LLMRerank
+
+    from beeai_framework.adapters.llama_index.mappers.chat import LlamaIndexChatModel
+    from beeai_framework.adapters.llama_index.mappers.documents import (
+        doc_with_score_to_li_doc_with_score,
+        li_doc_with_score_to_doc_with_score,
+    )
 except ModuleNotFoundError as e:
-    raise ModuleNotFoundError(
-        "Optional module [rag] not found.\nRun 'pip install \"beeai-framework[rag]\"' to install."
-    ) from e
+    _rag_import_error: ModuleNotFoundError | None = e
+else:
+    _rag_import_error = None
 
 
 class BeeAIDocumentProcessor(DocumentProcessor, ABC):
@@ -44,6 +54,11 @@ class BeeAIDocumentProcessor(DocumentProcessor, ABC):
 
 class LLMDocumentReranker(DocumentProcessor):
     def __init__(self, llm: ChatModel, *, choice_batch_size: int = 5, top_n: int = 5) -> None:
+        if _rag_import_error is not None:
+            raise ModuleNotFoundError(
+                "Optional module [rag] not found.\nRun 'pip install \"beeai-framework[rag]\"' to install."
+            ) from _rag_import_error
+
         self.llm = llm
         self.reranker = LLMRerank(
             choice_batch_size=choice_batch_size, top_n=top_n, llm=LlamaIndexChatModel(llm=self.llm)
@@ -59,3 +74,170 @@ class LLMDocumentReranker(DocumentProcessor):
         processed_nodes = await self.reranker.apostprocess_nodes(li_documents_with_score, query_str=query)
         documents_with_score = [li_doc_with_score_to_doc_with_score(node) for node in processed_nodes]
         return documents_with_score
+
+
+_MAX_RELEVANCE = 10
+
+_RELEVANCE_PROMPT = (
+    "You rate how relevant documents are for answering a query. Rate every document on a scale "
+    f"from 0 (irrelevant) to {_MAX_RELEVANCE} (answers the query), refer to documents by their numbers."
+)
+
+
+class _RelevanceScore(BaseModel):
+    document: int = Field(description="Number of the document.")
+    relevance: int = Field(ge=0, le=_MAX_RELEVANCE)
+
+
+class _RelevanceScores(BaseModel):
+    scores: list[_RelevanceScore]
+
+
+class LLMReranker(Reranker):
+    """
+    Reranks documents by relevance scores which are assigned by a chat model (does not require llama-index).
+
+    Documents are sent in batches of `batch_size` and up to `max_concurrency` batches are scored at the same time.
+    Batches are started in the order of retrieval scores, once `top_n` documents got the maximal relevance,
+    no further batches are started, because no other document could outrank them.
+    Returned scores are relevances scaled to the range from 0 to 1.
+    """
+
+    def __init__(
+        self,
+        llm: ChatModel,
+        *,
+        batch_size: int = 5,
+        max_concurrency: int = 4,
+        top_n: int | None = 5,
+        separation: float | None = None,
+    ) -> None:
+        super().__init__(top_n=top_n, separation=separation)
+        if batch_size <= 0 or max_concurrency <= 0:
+            raise ValueError("'batch_size' and 'max_concurrency' must be positive numbers.")
+
+        self.llm = llm
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+
+    async def _rerank(self, query: str, documents: list[DocumentWithScore], top_n: int) -> list[DocumentWithScore]:
+        candidates = sorted(documents, key=lambda document: document.score, reverse=True)
+        relevances: dict[int, int] = {}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def score(offset: int) -> None:
+            async with semaphore:
+                if sum(relevance == _MAX_RELEVANCE for relevance in relevances.values()) >= top_n:
+                    return
+                batch = candidates[offset : offset + self.batch_size]
+                for position, relevance in (await self._score(query, batch)).items():
+                    relevances[offset + position] = relevance
+
+        await asyncio.gather(*(score(offset) for offset in range(0, len(candidates), self.batch_size)))
+
+        # documents which were not scored (skipped batches) keep their order after the scored ones
+        order = sorted(range(len(candidates)), key=lambda i: (i not in relevances, -relevances.get(i, 0), i))
+        return [
+            DocumentWithScore(document=candidates[i].document, score=relevances.get(i, 0) / _MAX_RELEVANCE)
+            for i in order
+        ]
+
+    async def _score(self, query: str, batch: list[DocumentWithScore]) -> dict[int, int]:
+        numbered = "\n\n".join(
+            f"Document {number}:\n{document.document.content}" for number, document in enumerate(batch, 1)
+        )
+        response = await self.llm.create_structure(
+            schema=_RelevanceScores,
+            messages=[SystemMessage(_RELEVANCE_PROMPT), UserMessage(f"Query: {query}\n\n{numbered}")],
+        )
+        scores = _RelevanceScores.model_validate(response.object)
+        return {item.document - 1: item.relevance for item in scores.scores if 1 <= item.document <= len(batch)}
+
+
+class BM25Reranker(Reranker):
+    """
+    Reranks documents by BM25 computed over the retrieved documents, without calling any model.
+
+    Besides the content (`"content"`), metadata fields can be matched too (e.g. a title), `fields` maps them
+    to weights of their scores, which are summed. Documents without any query term are placed
+    after the matching ones, in the order of their retrieval scores.
+    """
+
+    def __init__(
+        self,
+        *,
+        fields: Mapping[str, float] | None = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+        top_n: int | None = None,
+        separation: float | None = None,
+    ) -> None:
+        super().__init__(top_n=top_n, separation=separation)
+        self.fields = dict(fields or {"content": 1.0})
+        self.k1 = k1
+        self.b = b
+
+    async def _rerank(self, query: str, documents: list[DocumentWithScore], top_n: int) -> list[DocumentWithScore]:
+        scores = [0.0] * len(documents)
+        ids = [str(row) for row in range(len(documents))]
+        for field, weight in self.fields.items():
+            index = BM25Index(k1=self.k1, b=self.b)
+            index.add([Document(content=_get_field(item.document, field), metadata={}) for item in documents], ids)
+            for row, score in index.rank(query, len(documents)):
+                scores[row] += weight * score
+
+        order = sorted(range(len(documents)), key=lambda row: (-scores[row], -documents[row].score))
+        return [DocumentWithScore(document=documents[row].document, score=scores[row]) for row in order]
+
+
+class MMRReranker(Reranker):
+    """
+    Reranks documents by maximal marginal relevance, requires numpy.
+
+    Documents similar to the query but dissimilar to the already selected ones are preferred, so the context
+    is not filled by near-duplicates. Similarities are cosine similarities of embeddings (the query and documents
+    are embedded in a single request), `lambda_mult` weighs the relevance against the diversity
+    (`1` means relevance only). Returned scores are the marginal relevances at the time of selection.
+    """
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModel,
+        *,
+        lambda_mult: float = 0.5,
+        top_n: int | None = None,
+        separation: float | None = None,
+    ) -> None:
+        super().__init__(top_n=top_n, separation=separation)
+        if not 0 <= lambda_mult <= 1:
+            raise ValueError("'lambda_mult' must be between 0 and 1.")
+
+        self.embedding_model = embedding_model
+        self.lambda_mult = lambda_mult
+
+    async def _rerank(self, query: str, documents: list[DocumentWithScore], top_n: int) -> list[DocumentWithScore]:
+        np = import_numpy()
+        response = await self.embedding_model.create(
+            [query, *(document.document.content for document in documents)], dtype="float32"
+        )
+        vectors = normalize(response.to_array())
+        relevance = vectors[1:] @ vectors[0]
+        similarity = vectors[1:] @ vectors[1:].T
+
+        results: list[DocumentWithScore] = []
+        redundancy = np.zeros(len(documents), dtype=np.float32)
+        available = np.ones(len(documents), dtype=bool)
+        for _ in range(min(top_n, len(documents))):
+            scores = np.where(available, self.lambda_mult * relevance - (1 - self.lambda_mult) * redundancy, -np.inf)
+            row = int(np.argmax(scores))
+            results.append(DocumentWithScore(document=documents[row].document, score=float(scores[row])))
+            available[row] = False
+            redundancy = np.maximum(redundancy, similarity[row])
+        return results
+
+
+def _get_field(document: Document, field: str) -> str:
+    if field == "content":
+        return document.content
+    value = document.metadata.get(field)
+    return "" if value is None else str(value)
@@ -0,0 +1,177 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import heapq
+import math
+import re
+from collections import Counter
+from collections.abc import Sequence
+
+from beeai_framework.backend.metadata_filter import MetadataFilter
+from beeai_framework.backend.types import Document, DocumentWithScore
+
+__all__ = ["BM25Index", "tokenize"]
+
+_WORD_PATTERN = re.compile(r"\w+")
+_COMPOUND_PATTERN = re.compile(r"\w+(?:[-./:]\w+)+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Splits text into lowercase words.
+
+    Identifiers such as `ERR-404` or `os.path.join` are kept as a whole in addition to their parts,
+    so they are matched exactly but also partially.
+    """
+    text = text.lower()
+    return _WORD_PATTERN.findall(text) + _COMPOUND_PATTERN.findall(text)
+
+
+class BM25Index:
+    """
+    In-memory inverted index ranking documents by Okapi BM25.
+
+    Complements dense retrieval for queries containing exact terms (identifiers, error codes, names)
+    which embeddings tend to blur. Documents are identified by ids, adding a document with a known id replaces
+    the previous one (unless it is equal). Like in `LocalVectorStore`, deleted and replaced documents are only marked
+    until their share exceeds `compaction_threshold`, then the index gets compacted.
+    """
+
+    def __init__(self, *, k1: float = 1.2, b: float = 0.75, compaction_threshold: float | None = 0.3) -> None:
+        self.k1 = k1
+        self.b = b
+        self.compaction_threshold = compaction_threshold
+        self._postings: dict[str, dict[int, int]] = {}
+        self._lengths: list[int] = []
+        self._total_length = 0
+        self._documents: list[Document] = []
+        self._ids: list[str] = []
+        self._rows_by_id: dict[str, int] = {}
+        self._deleted: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._documents) - len(self._deleted)
+
+    def add(self, documents: Sequence[Document], ids: Sequence[str]) -> None:
+        if len(documents) != len(ids):
+            raise ValueError("Expected exactly one id per document.")
+
+        for document, id in zip(documents, ids, strict=True):
+            previous = self._rows_by_id.get(id)
+            if previous is not None:
+                if self._documents[previous] == document:
+                    continue
+                self._remove(previous)
+
+            row = len(self._documents)
+            terms = Counter(tokenize(document.content))
+            for term, frequency in terms.items():
+                self._postings.setdefault(term, {})[row] = frequency
+
+            length = sum(terms.values())
+            self._lengths.append(length)
+            self._total_length += length
+            self._documents.append(document)
+            self._ids.append(id)
+            self._rows_by_id[id] = row
+        self._compact_if_needed()
+
+    def delete(self, ids: Sequence[str] | None = None, *, filter: MetadataFilter | None = None) -> None:
+        """Deletes documents with the given ids or documents matching the filter, see `VectorStore.delete`."""
+        if ids is None and filter is None:
+            raise ValueError("Either 'ids' or 'filter' must be provided.")
+
+        rows = (
+            [self._rows_by_id[id] for id in ids if id in self._rows_by_id]
+            if ids is not None
+            else list(self._rows_by_id.values())
+        )
+        for row in rows:
+            if filter is None or filter.matches(self._documents[row].metadata):
+                self._remove(row)
+        self._compact_if_needed()
+
+    def search(self, query: str, k: int = 4, *, filter: MetadataFilter | None = None) -> list[DocumentWithScore]:
+        """Returns up to `k` documents containing at least one query term (and matching the filter), the best first."""
+        return [
+            DocumentWithScore(document=self._documents[row], score=score)
+            for row, score in self.rank(query, k, filter=filter)
+        ]
+
+    def compact(self) -> None:
+        """Drops deleted documents for good, rows of the remaining ones get renumbered."""
+        if not self._deleted:
+            return
+
+        live = [row for row in range(len(self._documents)) if row not in self._deleted]
+        rows = {row: new_row for new_row, row in enumerate(live)}
+        # postings contain only rows of remaining documents
+        self._postings = {
+            term: {rows[row]: frequency for row, frequency in postings.items()}
+            for term, postings in self._postings.items()
+        }
+        self._lengths = [self._lengths[row] for row in live]
+        self._documents = [self._documents[row] for row in live]
+        self._ids = [self._ids[row] for row in live]
+        self._rows_by_id = {id: rows[row] for id, row in self._rows_by_id.items()}
+        self._deleted.clear()
+
+    def reset(self) -> None:
+        self._postings.clear()
+        self._lengths.clear()
+        self._total_length = 0
+        self._documents.clear()
+        self._ids.clear()
+        self._rows_by_id.clear()
+        self._deleted.clear()
+
+    def _compact_if_needed(self) -> None:
+        threshold = self.compaction_threshold
+        if threshold is not None and len(self._deleted) > threshold * len(self._documents):
+            self.compact()
+
+    def _remove(self, row: int) -> None:
+        # removed documents are dropped from postings, so they do not count into term statistics anymore
+        for term in set(tokenize(self._documents[row].content)):
+            postings = self._postings[term]
+            del postings[row]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._lengths[row]
+        self._deleted.add(row)
+        del self._rows_by_id[self._ids[row]]
+
+    def rank(self, query: str, k: int = 4, *, filter: MetadataFilter | None = None) -> list[tuple[int, float]]:
+        """
+        Like `search`, but returns rows of the documents with their scores.
+
+        Rows count the documents from zero in the order of their addition (a replaced document gets a new row),
+        they get renumbered when the index is compacted.
+        """
+        if not len(self) or k <= 0:
+            return []
+
+        # rows are checked once, before they get scored
+        allowed: dict[int, bool] = {}
+
+        def is_allowed(row: int) -> bool:
+            if row not in allowed:
+                allowed[row] = filter is None or filter.matches(self._documents[row].metadata)
+            return allowed[row]
+
+        size = len(self)
+        average_length = self._total_length / size or 1
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+
+            idf = math.log(1 + (size - len(postings) + 0.5) / (len(postings) + 0.5))
+            for row, frequency in postings.items():
+                if not is_allowed(row):
+                    continue
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[row] / average_length)
+                scores[row] = scores.get(row, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
@@ -0,0 +1,106 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import operator
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from beeai_framework.backend.metadata_filter import (
+    AndFilter,
+    EqFilter,
+    InFilter,
+    MetadataFilter,
+    MetadataValue,
+    OrFilter,
+    RangeFilter,
+)
+from beeai_framework.utils.vectors import import_numpy
+
+__all__ = ["MetadataIndex"]
+
+_OPERATORS = {"gt": operator.gt, "gte": operator.ge, "lt": operator.lt, "lte": operator.le}
+
+
+class MetadataIndex:
+    """
+    Per-field inverted indexes of document metadata (value → rows), used by in-process vector stores.
+
+    Filters are evaluated to boolean masks over all rows (one entry per document), so that only the matching
+    documents get scored. Equality and membership cost is proportional to the number of matching rows,
+    ranges additionally to the number of distinct values of the field.
+    """
+
+    def __init__(self) -> None:
+        self._np = import_numpy()
+        self._postings: dict[str, dict[MetadataValue, list[Any]]] = {}
+        self._numeric_values: dict[str, tuple[Any, list[MetadataValue]]] = {}
+
+    def add(self, metadata: Sequence[Mapping[str, MetadataValue]], start: int) -> None:
+        """Indexes metadata of rows `start`, `start + 1`, … (one mapping per row)."""
+        groups: dict[str, dict[MetadataValue, list[int]]] = {}
+        for row, item in enumerate(metadata, start):
+            for field, value in item.items():
+                groups.setdefault(field, {}).setdefault(value, []).append(row)
+
+        for field, values in groups.items():
+            postings = self._postings.setdefault(field, {})
+            if any(value not in postings for value in values):
+                self._numeric_values.pop(field, None)
+            for value, rows in values.items():
+                postings.setdefault(value, []).append(self._np.asarray(rows, dtype=self._np.intp))
+
+    def mask(self, filter: MetadataFilter, size: int) -> Any:
+        """Returns a boolean array of the given size, `True` for rows which match the filter."""
+        np = self._np
+        if isinstance(filter, AndFilter | OrFilter):
+            masks = [self.mask(item, size) for item in filter.filters]
+            reduce = np.logical_and if isinstance(filter, AndFilter) else np.logical_or
+            return reduce.reduce(masks) if masks else np.ones(size, dtype=bool)
+
+        mask = np.zeros(size, dtype=bool)
+        if isinstance(filter, EqFilter):
+            values: Sequence[MetadataValue] = [filter.value]
+        elif isinstance(filter, InFilter):
+            values = filter.values
+        elif isinstance(filter, RangeFilter):
+            values = self._find_in_range(filter)
+        else:
+            raise ValueError(f"Unsupported filter type '{type(filter).__name__}'.")
+
+        for value in values:
+            mask[self._get_rows(filter.field, value)] = True
+        return mask
+
+    def reset(self) -> None:
+        self._postings.clear()
+        self._numeric_values.clear()
+
+    def _get_rows(self, field: str, value: MetadataValue) -> Any:
+        chunks = self._postings.get(field, {}).get(value)
+        if not chunks:
+            return self._np.empty(0, dtype=self._np.intp)
+        if len(chunks) > 1:
+            chunks[:] = [self._np.concatenate(chunks)]
+        return chunks[0]
+
+    def _find_in_range(self, filter: RangeFilter) -> list[MetadataValue]:
+        np = self._np
+        values = list(self._postings.get(filter.field, {}))
+        numeric = all(
+            isinstance(bound, int | float) and not isinstance(bound, bool) for bound in filter.bounds.values()
+        )
+        if not numeric:
+            return [value for value in values if filter.matches({filter.field: value})]
+
+        # numeric values of the field are compared at once, they are cached until a new value appears
+        if filter.field not in self._numeric_values:
+            candidates: list[MetadataValue] = [
+                value for value in values if isinstance(value, int | float) and not isinstance(value, bool)
+            ]
+            self._numeric_values[filter.field] = (np.asarray(candidates, dtype=np.float64), candidates)
+
+        array, candidates = self._numeric_values[filter.field]
+        selected = np.ones(len(candidates), dtype=bool)
+        for op, bound in filter.bounds.items():
+            selected &= _OPERATORS[op](array, bound)
+        return [candidates[i] for i in np.flatnonzero(selected)]
@@ -0,0 +1,294 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import contextlib
+import json
+import os
+import sqlite3
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from beeai_framework.backend.types import Document
+from beeai_framework.utils.vectors import EmbeddingArray, EmbeddingDType, import_numpy
+
+__all__ = [
+    "DocumentStore",
+    "InMemoryDocumentStore",
+    "SQLiteDocumentStore",
+    "VectorStoreFiles",
+    "VectorStoreManifest",
+]
+
+
+class DocumentStore(ABC):
+    """
+    Keeps documents of a vector store, their ids and hashes, addressed by the row of their embedding.
+
+    Rows are never reused, deleted rows are only marked (tombstones) until the vector store is compacted.
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Returns the number of rows, including deleted ones."""
+        pass
+
+    @abstractmethod
+    def add(self, ids: Sequence[str], documents: Sequence[Document], hashes: Sequence[str]) -> None:
+        pass
+
+    @abstractmethod
+    def get(self, rows: Sequence[int]) -> list[Document]:
+        pass
+
+    @abstractmethod
+    def get_keys(self, rows: Sequence[int]) -> list[tuple[str, str]]:
+        """Returns ids and hashes of the given rows."""
+        pass
+
+    @abstractmethod
+    def iter_keys(self, start: int = 0) -> Iterator[tuple[str, str]]:
+        """Yields ids and hashes of rows from `start` to the end, in order."""
+        pass
+
+    @abstractmethod
+    def iter_metadata(self, start: int = 0) -> Iterator[Mapping[str, Any]]:
+        """Yields metadata of rows from `start` to the end, in order."""
+        pass
+
+    @abstractmethod
+    def delete(self, rows: Sequence[int]) -> None:
+        """Marks the rows as deleted."""
+        pass
+
+    @abstractmethod
+    def deleted_rows(self) -> list[int]:
+        pass
+
+
+class InMemoryDocumentStore(DocumentStore):
+    def __init__(self) -> None:
+        self._documents: list[Document] = []
+        self._ids: list[str] = []
+        self._hashes: list[str] = []
+        self._deleted: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, ids: Sequence[str], documents: Sequence[Document], hashes: Sequence[str]) -> None:
+        self._ids.extend(ids)
+        self._documents.extend(documents)
+        self._hashes.extend(hashes)
+
+    def get(self, rows: Sequence[int]) -> list[Document]:
+        return [self._documents[row] for row in rows]
+
+    def get_keys(self, rows: Sequence[int]) -> list[tuple[str, str]]:
+        return [(self._ids[row], self._hashes[row]) for row in rows]
+
+    def iter_keys(self, start: int = 0) -> Iterator[tuple[str, str]]:
+        return zip(self._ids[start:], self._hashes[start:], strict=True)
+
+    def iter_metadata(self, start: int = 0) -> Iterator[Mapping[str, Any]]:
+        return (document.metadata for document in self._documents[start:])
+
+    def delete(self, rows: Sequence[int]) -> None:
+        self._deleted.update(rows)
+
+    def deleted_rows(self) -> list[int]:
+        return sorted(self._deleted)
+
+
+class SQLiteDocumentStore(DocumentStore):
+    """Documents in a SQLite database, they are read only when they are returned by a search."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS documents (row INTEGER PRIMARY KEY, id TEXT NOT NULL, hash TEXT NOT NULL, "
+                "content TEXT NOT NULL, metadata TEXT NOT NULL, deleted INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS deleted_rows ON documents (row) WHERE deleted = 1")
+        self._size: int = self._connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, ids: Sequence[str], documents: Sequence[Document], hashes: Sequence[str]) -> None:
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO documents (row, id, hash, content, metadata) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (self._size + offset, id, hash, document.content, json.dumps(document.metadata))
+                    for offset, (id, document, hash) in enumerate(zip(ids, documents, hashes, strict=True))
+                ],
+            )
+        self._size += len(documents)
+
+    def get(self, rows: Sequence[int]) -> list[Document]:
+        found = {
+            row: Document(content=content, metadata=json.loads(metadata))
+            for row, content, metadata in self._select("row, content, metadata", rows)
+        }
+        return [found[row] for row in rows]
+
+    def get_keys(self, rows: Sequence[int]) -> list[tuple[str, str]]:
+        found = {row: (id, hash) for row, id, hash in self._select("row, id, hash", rows)}
+        return [found[row] for row in rows]
+
+    def iter_keys(self, start: int = 0) -> Iterator[tuple[str, str]]:
+        return iter(self._connection.execute("SELECT id, hash FROM documents WHERE row >= ? ORDER BY row", (start,)))
+
+    def iter_metadata(self, start: int = 0) -> Iterator[Mapping[str, Any]]:
+        cursor = self._connection.execute("SELECT metadata FROM documents WHERE row >= ? ORDER BY row", (start,))
+        return (json.loads(metadata) for (metadata,) in cursor)
+
+    def delete(self, rows: Sequence[int]) -> None:
+        with self._connection:
+            for batch in _batches(list(rows)):
+                placeholders = ",".join("?" * len(batch))
+                self._connection.execute(f"UPDATE documents SET deleted = 1 WHERE row IN ({placeholders})", batch)
+
+    def deleted_rows(self) -> list[int]:
+        return [row for (row,) in self._connection.execute("SELECT row FROM documents WHERE deleted = 1 ORDER BY row")]
+
+    def truncate(self, size: int) -> None:
+        """Removes rows from `size` on, e.g. documents whose embeddings were not written before a crash."""
+        with self._connection:
+            self._connection.execute("DELETE FROM documents WHERE row >= ?", (size,))
+        self._size = min(self._size, size)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _select(self, columns: str, rows: Sequence[int]) -> list[Any]:
+        results: list[Any] = []
+        for batch in _batches(list(dict.fromkeys(rows))):
+            placeholders = ",".join("?" * len(batch))
+            results.extend(
+                self._connection.execute(f"SELECT {columns} FROM documents WHERE row IN ({placeholders})", batch)
+            )
+        return results
+
+
+def _batches(rows: list[int], size: int = 500) -> Iterator[list[int]]:
+    # stays below the SQLite limit of query parameters
+    return (rows[i : i + size] for i in range(0, len(rows), size))
+
+
+class VectorStoreManifest(BaseModel):
+    version: int = 1
+    dimension: int
+    dtype: EmbeddingDType
+    matrix: str
+    documents: str
+
+
+class VectorStoreFiles:
+    """
+    Directory layout of a persisted vector store.
+
+    - `manifest.json` describes the embeddings and names the current matrix and database.
+    - `embeddings-<key>.npy` holds the normalized embeddings, it is memory-mapped when loaded.
+    - `embeddings-<key>.wal` is an append-only segment of raw rows added after its matrix was written.
+    - `documents-<key>.sqlite` holds the documents, their ids, hashes and tombstones.
+
+    Rewritten files get a new name and become current once the manifest is replaced (atomically),
+    so a crash in the middle of a rewrite leaves the previous state intact. Files which are not current
+    are removed by `commit`.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.manifest: VectorStoreManifest | None = None
+        self._np = import_numpy()
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.path / "manifest.json"
+
+    @property
+    def matrix_path(self) -> Path:
+        return self.path / self.get_manifest().matrix
+
+    @property
+    def segment_path(self) -> Path:
+        return self.matrix_path.with_suffix(".wal")
+
+    @property
+    def documents_path(self) -> Path:
+        return self.path / self.get_manifest().documents
+
+    def new_path(self, kind: Literal["embeddings", "documents"]) -> Path:
+        self.path.mkdir(parents=True, exist_ok=True)
+        suffix = ".npy" if kind == "embeddings" else ".sqlite"
+        return self.path / f"{kind}-{uuid.uuid4().hex[:12]}{suffix}"
+
+    def get_manifest(self) -> VectorStoreManifest:
+        """Returns the current manifest, it is read from the directory only once."""
+        if self.manifest is None:
+            return self.read_manifest()
+        return self.manifest
+
+    def read_manifest(self) -> VectorStoreManifest:
+        self.manifest = VectorStoreManifest.model_validate_json(self.manifest_path.read_text(encoding="utf-8"))
+        return self.manifest
+
+    def commit(self, manifest: VectorStoreManifest) -> None:
+        """Makes the files named by the manifest current and removes the previous ones."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        temporary = self.manifest_path.with_suffix(".json.tmp")
+        temporary.write_text(manifest.model_dump_json(), encoding="utf-8")
+        os.replace(temporary, self.manifest_path)
+        self.manifest = manifest
+
+        current = (Path(manifest.matrix).stem, Path(manifest.documents).stem)
+        for path in [*self.path.glob("embeddings-*"), *self.path.glob("documents-*")]:
+            if not path.name.startswith(current):
+                with contextlib.suppress(OSError):  # e.g. a file still mapped on Windows, it is removed next time
+                    path.unlink()
+
+    def write_matrix(self, matrix: EmbeddingArray, dtype: EmbeddingDType) -> str:
+        """Writes the matrix into a new file and returns its name, the file is current once committed."""
+        path = self.new_path("embeddings")
+        self._np.save(path, self._np.asarray(matrix, dtype=dtype))
+        return path.name
+
+    def read_matrix(self, *, mmap: bool = True) -> EmbeddingArray:
+        matrix: EmbeddingArray = self._np.load(self.matrix_path, mmap_mode="r" if mmap else None)
+        return matrix
+
+    def append_segment(self, rows: EmbeddingArray, dtype: EmbeddingDType) -> None:
+        data = self._np.ascontiguousarray(rows, dtype=self._np.dtype(dtype).newbyteorder("<"))
+        with self.segment_path.open("ab") as file:
+            file.write(data.tobytes())
+            file.flush()
+            os.fsync(file.fileno())
+
+    def read_segment(self) -> EmbeddingArray:
+        """Returns complete rows of the segment, a partially written last row (after a crash) is ignored."""
+        np = self._np
+        manifest = self.get_manifest()
+        segment: EmbeddingArray
+        if not self.segment_path.exists() or not manifest.dimension:
+            segment = np.empty((0, manifest.dimension), dtype=manifest.dtype)
+            return segment
+
+        dtype = np.dtype(manifest.dtype).newbyteorder("<")
+        data = self.segment_path.read_bytes()
+        rows = len(data) // (dtype.itemsize * manifest.dimension)
+        segment = np.frombuffer(data, dtype=dtype, count=rows * manifest.dimension)
+        return segment.reshape(rows, manifest.dimension).astype(manifest.dtype)
+
+    def truncate_segment(self, rows: int) -> None:
+        manifest = self.get_manifest()
+        if self.segment_path.exists():
+            with self.segment_path.open("r+b") as file:
+                file.truncate(max(rows, 0) * self._np.dtype(manifest.dtype).itemsize * manifest.dimension)
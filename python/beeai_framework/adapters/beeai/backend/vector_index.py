@@ -0,0 +1,180 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from abc import ABC, abstractmethod
+from math import isqrt
+from typing import Any
+
+from beeai_framework.logger import Logger
+from beeai_framework.utils.vectors import EmbeddingArray, dot, import_numpy, normalize, top_k
+
+__all__ = ["ExactVectorIndex", "IVFVectorIndex", "VectorIndex", "VectorIndexHits"]
+
+logger = Logger(__name__)
+
+VectorIndexHits = list[list[tuple[int, float]]]
+
+
+class VectorIndex(ABC):
+    """
+    Finds the most similar rows of a matrix of normalized vectors owned by a vector store.
+
+    The index only keeps row numbers, the vectors themselves are always passed in by the store.
+    """
+
+    @abstractmethod
+    def add(self, matrix: EmbeddingArray, start: int) -> None:
+        """Indexes rows from `start` to the end of the matrix, the matrix contains all vectors of the store."""
+        pass
+
+    @abstractmethod
+    def search(self, matrix: EmbeddingArray, queries: EmbeddingArray, k: int, mask: Any = None) -> VectorIndexHits:
+        """
+        Returns up to `k` pairs (row, similarity) for every (normalized) query, the most similar first.
+
+        When a boolean `mask` (one entry per row) is given, only rows where it is `True` are scored.
+        """
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        pass
+
+
+class ExactVectorIndex(VectorIndex):
+    """Scores every vector, the results are exact."""
+
+    def add(self, matrix: EmbeddingArray, start: int) -> None:
+        pass
+
+    def search(self, matrix: EmbeddingArray, queries: EmbeddingArray, k: int, mask: Any = None) -> VectorIndexHits:
+        if mask is None:
+            rows, scores = top_k(dot(queries, matrix), k)
+            return [list(zip(r, s, strict=True)) for r, s in zip(rows.tolist(), scores.tolist(), strict=True)]
+
+        allowed = import_numpy().flatnonzero(mask)
+        rows, scores = top_k(dot(queries, matrix[allowed]), k)
+        return [list(zip(allowed[r].tolist(), s, strict=True)) for r, s in zip(rows, scores.tolist(), strict=True)]
+
+    def reset(self) -> None:
+        pass
+
+
+class IVFVectorIndex(VectorIndex):
+    """
+    Inverted file index for approximate search.
+
+    Vectors are clustered by (spherical) k-means into `n_lists` lists and a query only scores vectors
+    in the `n_probe` lists whose centroids are the most similar to it. Increasing `n_probe` improves recall
+    at the cost of latency, `n_probe == n_lists` is equivalent to exact search.
+
+    The index gets trained once it holds `train_threshold` vectors (exact search is used until then),
+    later insertions are assigned to the nearest existing centroid. Call `train` to re-cluster after the data
+    has changed significantly.
+    """
+
+    def __init__(
+        self,
+        *,
+        n_lists: int | None = None,
+        n_probe: int = 8,
+        train_threshold: int = 10_000,
+        iterations: int = 10,
+        sample_size: int = 64,
+        seed: int = 0,
+    ) -> None:
+        if n_probe < 1:
+            raise ValueError("'n_probe' must be a positive number")
+
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.train_threshold = train_threshold
+        self.iterations = iterations
+        self.sample_size = sample_size
+        self.seed = seed
+        self._np = import_numpy()
+        self._centroids: EmbeddingArray | None = None
+        self._lists: list[list[Any]] = []
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def add(self, matrix: EmbeddingArray, start: int) -> None:
+        if self._centroids is None:
+            if len(matrix) >= self.train_threshold:
+                self.train(matrix)
+            return
+
+        self._assign(matrix, start)
+
+    def train(self, matrix: EmbeddingArray) -> None:
+        """Clusters the vectors and rebuilds the lists."""
+        np = self._np
+        size = len(matrix)
+        n_lists = min(self.n_lists or max(4 * isqrt(size), 1), size)
+        rng = np.random.default_rng(self.seed)
+
+        # centroids are trained on a sample, `sample_size` vectors per list are plenty
+        sample = matrix[np.sort(rng.choice(size, size=min(size, n_lists * self.sample_size), replace=False))]
+        sample = np.asarray(sample, dtype=np.float32)
+        centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+        for _ in range(self.iterations):
+            assignments = np.argmax(dot(sample, centroids), axis=1)
+            order = np.argsort(assignments, kind="stable")
+            lists, bounds = np.unique(assignments[order], return_index=True)
+            sums = np.zeros_like(centroids)
+            sums[lists] = np.add.reduceat(sample[order], bounds, axis=0)
+            counts = np.bincount(assignments, minlength=n_lists)
+
+            # empty clusters get a random vector, otherwise they would stay empty forever
+            empty = np.flatnonzero(counts == 0)
+            sums[empty] = sample[rng.choice(len(sample), size=len(empty))]
+            centroids = normalize(sums)
+
+        logger.debug(f"IVF index has been trained on {len(sample)} vectors, {n_lists} lists.")
+        self._centroids = centroids
+        self._lists = [[] for _ in range(n_lists)]
+        self._assign(matrix, 0)
+
+    def search(self, matrix: EmbeddingArray, queries: EmbeddingArray, k: int, mask: Any = None) -> VectorIndexHits:
+        if self._centroids is None:
+            return ExactVectorIndex().search(matrix, queries, k, mask)
+
+        np = self._np
+        # selective filters leave fewer rows than the probed lists contain, scoring all of them is cheaper and exact
+        if mask is not None and np.count_nonzero(mask) <= len(matrix) * self.n_probe / len(self._centroids):
+            return ExactVectorIndex().search(matrix, queries, k, mask)
+
+        probes, _ = top_k(dot(queries, self._centroids), self.n_probe)
+        hits: VectorIndexHits = []
+        for query, lists in zip(queries, probes, strict=True):
+            candidates = np.concatenate([self._get_list(index) for index in lists])
+            if mask is not None:
+                candidates = candidates[mask[candidates]]
+            rows, scores = top_k(dot(query[None, :], matrix[candidates]), k)
+            hits.append(list(zip(candidates[rows[0]].tolist(), scores[0].tolist(), strict=True)))
+        return hits
+
+    def reset(self) -> None:
+        self._centroids = None
+        self._lists = []
+
+    def _assign(self, matrix: EmbeddingArray, start: int, block_size: int = 16384) -> None:
+        np = self._np
+        assert self._centroids is not None
+        for offset in range(start, len(matrix), block_size):
+            block = matrix[offset : offset + block_size]
+            assignments = np.argmax(dot(block, self._centroids), axis=1)
+            order = np.argsort(assignments, kind="stable")
+            lists, bounds = np.unique(assignments[order], return_index=True)
+            for index, rows in zip(lists.tolist(), np.split(order + offset, bounds[1:]), strict=True):
+                self._lists[index].append(rows)
+
+    def _get_list(self, index: int) -> Any:
+        chunks = self._lists[index]
+        if not chunks:
+            return self._np.empty(0, dtype=self._np.intp)
+        if len(chunks) > 1:
+            chunks[:] = [self._np.concatenate(chunks)]
+        return chunks[0]
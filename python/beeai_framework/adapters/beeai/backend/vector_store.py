@@ -3,13 +3,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import uuid
 from abc import ABC
-from typing import Any
+from collections.abc import Hashable, Sequence
+from pathlib import Path
+from typing import Any, Literal
 
+from beeai_framework.adapters.beeai.backend.lexical_index import BM25Index
+from beeai_framework.adapters.beeai.backend.metadata_index import MetadataIndex
+from beeai_framework.adapters.beeai.backend.storage import (
+    DocumentStore,
+    InMemoryDocumentStore,
+    SQLiteDocumentStore,
+    VectorStoreFiles,
+    VectorStoreManifest,
+)
+from beeai_framework.adapters.beeai.backend.vector_index import ExactVectorIndex, VectorIndex
 from beeai_framework.backend.embedding import EmbeddingModel
+from beeai_framework.backend.metadata_filter import MetadataFilterLike, to_metadata_filter
 from beeai_framework.backend.types import Document, DocumentWithScore
-from beeai_framework.backend.vector_store import QueryLike, VectorStore
+from beeai_framework.backend.vector_store import QueryLike, VectorStore, hash_document
+from beeai_framework.utils.vectors import EmbeddingArray, EmbeddingDType, import_numpy, normalize
 
+# optional modules are only required by the classes which use them
 try:
     from langchain_core.documents import Document as LCDocument
     from langchain_core.vectorstores import InMemoryVectorStore as LCInMemoryVectorStore
@@ -17,9 +34,9 @@ try:
     from beeai_framework.adapters.langchain.mappers.documents import document_to_lc_document, lc_document_to_document
     from beeai_framework.adapters.langchain.mappers.embedding import LangChainBeeAIEmbeddingModel
 except ModuleNotFoundError as e:
-    raise ModuleNotFoundError(
-        "Optional module [rag] not found.\nRun 'pip install \"beeai-framework[rag]\"' to install."
-    ) from e
+    _rag_import_error: ModuleNotFoundError | None = e
+else:
+    _rag_import_error = None
 
 
 class BeeAIVectorStore(VectorStore, ABC):
@@ -45,6 +62,11 @@ class TemporalVectorStore(BeeAIVectorStore):
     """In-memory vector store implementation using LangChain's InMemoryVectorStore."""
 
     def __init__(self, embedding_model: EmbeddingModel) -> None:
+        if _rag_import_error is not None:
+            raise ModuleNotFoundError(
+                "Optional module [rag] not found.\nRun 'pip install \"beeai-framework[rag]\"' to install."
+            ) from _rag_import_error
+
         self.embedding_model = embedding_model
         self.vector_store = LCInMemoryVectorStore(embedding=LangChainBeeAIEmbeddingModel(self.embedding_model))
 
@@ -53,11 +75,46 @@ class TemporalVectorStore(BeeAIVectorStore):
         lc_documents = [document_to_lc_document(document) for document in documents]
         return await self.vector_store.aadd_documents(lc_documents)
 
-    async def search(self, query: QueryLike, k: int = 4, **kwargs: Any) -> list[DocumentWithScore]:
+    async def upsert(self, documents: list[Document], ids: Sequence[str] | None = None) -> list[str]:
+        """Add or replace documents, unchanged documents are not embedded again."""
+        ids = list(ids) if ids is not None else [hash_document(document) for document in documents]
+        stored = self.vector_store.store
+        changed = {
+            id: document
+            for id, document in zip(ids, documents, strict=True)
+            if id not in stored or stored[id]["text"] != document.content or stored[id]["metadata"] != document.metadata
+        }
+        if changed:
+            lc_documents = [document_to_lc_document(document) for document in changed.values()]
+            await self.vector_store.aadd_documents(lc_documents, ids=list(changed))
+        return ids
+
+    async def delete(self, ids: Sequence[str] | None = None, *, filter: MetadataFilterLike | None = None) -> None:
+        """Delete documents by ids or by a metadata filter."""
+        if ids is None and filter is None:
+            raise ValueError("Either 'ids' or 'filter' must be provided.")
+
+        stored = self.vector_store.store
+        metadata_filter = to_metadata_filter(filter)
+        selected = [
+            id
+            for id in (ids if ids is not None else list(stored))
+            if id in stored and (metadata_filter is None or metadata_filter.matches(stored[id]["metadata"]))
+        ]
+        if selected:
+            await self.vector_store.adelete(selected)
+
+    async def search(
+        self, query: QueryLike, k: int = 4, *, filter: MetadataFilterLike | None = None, **kwargs: Any
+    ) -> list[DocumentWithScore]:
         """Search for similar documents."""
         if self.vector_store is None:
             raise ValueError("Vector store must be set before searching for documents")
 
+        metadata_filter = to_metadata_filter(filter)
+        if metadata_filter is not None:
+            kwargs["filter"] = lambda document: metadata_filter.matches(document.metadata)
+
         query_str = str(query)
         lc_documents_with_scores: list[
             tuple[LCDocument, float]
@@ -80,3 +137,574 @@ class TemporalVectorStore(BeeAIVectorStore):
             path=path, embedding=LangChainBeeAIEmbeddingModel(embedding_model)
         )
         return new_vector_store
+
+
+class LocalVectorStore(BeeAIVectorStore):
+    """
+    In-process vector store, requires numpy.
+
+    Embeddings are normalized on insert and kept in a single preallocated matrix (grown by doubling).
+    By default, a query is one matrix-vector product followed by a partial sort of the scores (exact search),
+    pass an approximate `index` (e.g. `IVFVectorIndex`) for large collections.
+    Metadata filters are evaluated by per-field inverted indexes before scoring, only matching documents get scored.
+    Scores are cosine similarities. Storing embeddings as `float16` halves the memory, scoring is done in `float32`.
+
+    Documents are deduplicated by their hash (see `hash_document`), which is also their id unless given.
+    Adding a stored document again returns its id without computing its embedding (unless `deduplicate=False`,
+    duplicates then get their hash with a random suffix). Deleted and replaced documents are only marked
+    (tombstones) and skipped by searches, the store gets compacted once their share exceeds `compaction_threshold`.
+
+    Use `dump` and `load` to persist the store in a binary format (see `VectorStoreFiles`).
+    Asynchronous methods of a persisted store write its files in a worker thread, one write at a time.
+    """
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModel,
+        *,
+        dtype: EmbeddingDType = "float32",
+        index: VectorIndex | None = None,
+        initial_capacity: int = 1024,
+        deduplicate: bool = True,
+        compaction_threshold: float | None = 0.3,
+    ) -> None:
+        self.embedding_model = embedding_model
+        self.dtype = dtype
+        self.index = index or ExactVectorIndex()
+        self.deduplicate = deduplicate
+        self.compaction_threshold = compaction_threshold
+        self._np = import_numpy()
+        self._capacity = max(initial_capacity, 1)
+        self._matrix: EmbeddingArray | None = None
+        self._documents: DocumentStore = InMemoryDocumentStore()
+        self._metadata_index = MetadataIndex()
+        self._metadata_indexed = 0
+        self._deleted: set[int] = set()
+        self._live_mask: Any = None
+        self._rows_by_id: dict[str, int] = {}
+        self._ids_by_hash: dict[str, str] = {}
+        self._keyed = 0
+        self._files: VectorStoreFiles | None = None
+        self._write_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return self._size - len(self._deleted)
+
+    @property
+    def _size(self) -> int:
+        return len(self._documents)
+
+    @property
+    def embeddings(self) -> EmbeddingArray:
+        """
+        Normalized embeddings, one row per document (a view, not a copy).
+
+        Rows of deleted documents are kept until the store is compacted.
+        """
+        matrix: EmbeddingArray = (
+            self._np.empty((0, 0), dtype=self.dtype) if self._matrix is None else self._matrix[: self._size]
+        )
+        return matrix
+
+    async def add_documents(self, documents: list[Document]) -> list[str]:
+        return await self._add(documents, None, deduplicate=self.deduplicate)
+
+    async def upsert(self, documents: list[Document], ids: Sequence[str] | None = None) -> list[str]:
+        """
+        Adds documents or replaces the stored documents with the same ids.
+
+        Unchanged documents are skipped and documents whose content is already stored (e.g. when only metadata
+        changed) reuse the stored embedding, only new content gets embedded. Without `ids`, documents are
+        matched by their hashes.
+        """
+        if ids is not None and len(ids) != len(documents):
+            raise ValueError("Expected exactly one id per document.")
+        return await self._add(documents, ids, deduplicate=True)
+
+    def add_embeddings(
+        self, documents: Sequence[Document], embeddings: EmbeddingArray, ids: Sequence[str] | None = None
+    ) -> list[str]:
+        """
+        Adds (or replaces, when `ids` are given) documents with precomputed embeddings, one row per document.
+
+        Files of a persisted store are written by the calling thread, use `aadd_embeddings` in asynchronous code.
+        """
+        vectors = self._to_vectors(documents, embeddings, ids)
+        if self._write_lock.locked():
+            raise RuntimeError("Another write is in progress, await it before adding embeddings.")
+
+        hashes = [hash_document(document) for document in documents]
+        result, added, replaced = self._assign_ids(vectors, hashes, ids, self.deduplicate)
+        if added:
+            positions = list(added.values())
+            size = self._reserve_rows(vectors, positions)
+            self._append(size, list(added), [documents[i] for i in positions], [hashes[i] for i in positions])
+            self.index.add(self.embeddings, size)
+        self._replace(replaced)
+        return result
+
+    async def aadd_embeddings(
+        self, documents: Sequence[Document], embeddings: EmbeddingArray, ids: Sequence[str] | None = None
+    ) -> list[str]:
+        """Like `add_embeddings`, but files of a persisted store are written in a worker thread."""
+        vectors = self._to_vectors(documents, embeddings, ids)
+        hashes = [hash_document(document) for document in documents]
+        return await self._write(documents, vectors, hashes, ids, self.deduplicate)
+
+    def lookup(self, documents: Sequence[Document]) -> list[str | None]:
+        """Returns ids of stored documents equal to the given ones (by their hashes), `None` for unknown documents."""
+        _, ids_by_hash = self._get_keys()
+        return [ids_by_hash.get(hash_document(document)) for document in documents]
+
+    async def delete(self, ids: Sequence[str] | None = None, *, filter: MetadataFilterLike | None = None) -> None:
+        if ids is None and filter is None:
+            raise ValueError("Either 'ids' or 'filter' must be provided.")
+
+        async with self._write_lock:
+            rows_by_id, _ = self._get_keys()
+            rows = {rows_by_id[id] for id in ids if id in rows_by_id} if ids is not None else None
+            metadata_filter = to_metadata_filter(filter)
+            if metadata_filter is not None:
+                mask = self._get_metadata_index().mask(metadata_filter, self._size)
+                matching = {int(row) for row in self._np.flatnonzero(mask)} - self._deleted
+                rows = matching if rows is None else rows & matching
+
+            if rows:
+                self._replace(sorted(rows))
+
+    def compact(self) -> None:
+        """
+        Removes deleted documents for good, rows get renumbered and indexes rebuilt.
+
+        The matrix and the database of a persisted store are rewritten and replace the previous files atomically.
+        """
+        if not self._deleted:
+            return
+
+        live = [int(row) for row in self._np.flatnonzero(self._get_live_mask())]
+        matrix = self._np.array(self.embeddings[live])
+        documents: DocumentStore = (
+            InMemoryDocumentStore() if self._files is None else SQLiteDocumentStore(self._files.new_path("documents"))
+        )
+        self._copy_documents(documents, live)
+        self._close_documents()
+        if self._files is not None:
+            assert isinstance(documents, SQLiteDocumentStore)
+            self._commit_files(self._files, matrix, documents)
+
+        self._matrix = matrix
+        self._documents = documents
+        self._deleted.clear()
+        self._live_mask = None
+        self._rows_by_id.clear()
+        self._ids_by_hash.clear()
+        self._keyed = 0
+        self._metadata_index.reset()
+        self._metadata_indexed = 0
+        self.index.reset()
+        self.index.add(self.embeddings, 0)
+
+    async def search(
+        self, query: QueryLike, k: int = 4, *, filter: MetadataFilterLike | None = None, **kwargs: Any
+    ) -> list[DocumentWithScore]:
+        results = await self.search_many([query], k=k, filter=filter)
+        return results[0]
+
+    async def search_many(
+        self, queries: Sequence[QueryLike], k: int = 4, *, filter: MetadataFilterLike | None = None
+    ) -> list[list[DocumentWithScore]]:
+        """Searches for multiple queries at once, their embeddings are computed in a single request."""
+        if not queries:
+            return []
+        if not len(self) or k <= 0:
+            return [[] for _ in queries]
+
+        response = await self.embedding_model.create([str(query) for query in queries], dtype="float32")
+        return self.search_by_vectors(response.to_array(), k=k, filter=filter)
+
+    def search_by_vectors(
+        self, queries: EmbeddingArray, k: int = 4, *, filter: MetadataFilterLike | None = None
+    ) -> list[list[DocumentWithScore]]:
+        """Returns the `k` most similar documents for every query embedding (one per row)."""
+        queries = normalize(self._np.atleast_2d(self._np.asarray(queries, dtype=self._np.float32)))
+        if not len(self) or k <= 0:
+            return [[] for _ in queries]
+
+        metadata_filter = to_metadata_filter(filter)
+        mask = None if metadata_filter is None else self._get_metadata_index().mask(metadata_filter, self._size)
+        if self._deleted:
+            mask = self._get_live_mask() if mask is None else mask & self._get_live_mask()
+
+        results: list[list[DocumentWithScore]] = []
+        for hits in self.index.search(self.embeddings, queries, k, mask):
+            documents = self._documents.get([row for row, _ in hits])
+            results.append(
+                [
+                    DocumentWithScore(document=document, score=score)
+                    for document, (_, score) in zip(documents, hits, strict=True)
+                ]
+            )
+        return results
+
+    def dump(self, path: str | Path) -> None:
+        """
+        Saves the store into a directory, which is then used for persisting further changes.
+
+        Embeddings are written as a single matrix, documents into a SQLite database. Documents added later
+        are appended to the database and their embeddings to a write-ahead segment, calling `dump` again
+        merges the segment into the matrix.
+        """
+        files = VectorStoreFiles(path)
+        if self._files is not None and self._files.path.resolve() == files.path.resolve():
+            assert isinstance(self._documents, SQLiteDocumentStore)
+            self._commit_files(self._files, self.embeddings, self._documents)
+            return
+
+        documents = SQLiteDocumentStore(files.new_path("documents"))
+        self._copy_documents(documents, range(self._size))
+        documents.delete(sorted(self._deleted))
+        self._close_documents()
+        self._commit_files(files, self.embeddings, documents)
+        self._documents = documents
+        self._files = files
+
+    @classmethod
+    def load(
+        cls,
+        path: str | Path,
+        embedding_model: EmbeddingModel,
+        *,
+        index: VectorIndex | None = None,
+        mmap: bool = True,
+        **kwargs: Any,
+    ) -> LocalVectorStore:
+        """
+        Loads a store saved by `dump`, further changes are persisted into the same directory.
+
+        The matrix is memory-mapped (unless `mmap=False`), so the store is ready without reading it,
+        documents are read from the database only when they are returned. The matrix gets copied into memory
+        once the store is modified or if the directory contains a write-ahead segment.
+        Other keyword arguments are passed to the constructor.
+        """
+        files = VectorStoreFiles(path)
+        manifest = files.read_manifest()
+        store = cls(embedding_model, dtype=manifest.dtype, index=index, **kwargs)
+        matrix = files.read_matrix(mmap=mmap)
+        segment = files.read_segment()
+        documents = SQLiteDocumentStore(files.documents_path)
+
+        # rows written only partially before a crash (an embedding without its document or vice versa) are dropped
+        size = min(len(matrix) + len(segment), len(documents))
+        documents.truncate(size)
+        files.truncate_segment(size - len(matrix))
+        if not len(segment):
+            store._matrix = matrix[:size]
+        elif not len(matrix):
+            store._matrix = segment[:size]
+        else:
+            store._matrix = store._np.concatenate([matrix, segment[: size - len(matrix)]])
+        store._documents = documents
+        store._deleted = set(documents.deleted_rows())
+        store._files = files
+        store.index.add(store.embeddings, 0)
+        return store
+
+    async def _add(self, documents: list[Document], ids: Sequence[str] | None, deduplicate: bool) -> list[str]:
+        if not documents:
+            return []
+
+        hashes = [hash_document(document) for document in documents]
+        rows_by_id, ids_by_hash = self._get_keys()
+
+        # embeddings of stored content are reused, either from an equal document or from the replaced one
+        sources: list[int | None] = [None] * len(documents)
+        replaced: dict[int, int] = {}
+        for i, hash in enumerate(hashes):
+            if (deduplicate or ids is not None) and hash in ids_by_hash:
+                sources[i] = rows_by_id[ids_by_hash[hash]]
+            elif ids is not None and ids[i] in rows_by_id:
+                replaced[i] = rows_by_id[ids[i]]
+        previous = self._documents.get(list(replaced.values()))
+        for (i, row), document in zip(replaced.items(), previous, strict=True):
+            if document.content == documents[i].content:
+                sources[i] = row
+
+        # rows get renumbered when the store is compacted while embedding, reused embeddings are copied beforehand
+        # and the ids are resolved again once the write lock is held
+        reused = {i: source for i, source in enumerate(sources) if source is not None}
+        reused_vectors = self._np.array(self.embeddings[list(reused.values())], dtype=self._np.float32)
+        missing = [i for i, source in enumerate(sources) if source is None]
+        embeddings = None
+        if missing:
+            response = await self.embedding_model.create([documents[i].content for i in missing], dtype="float32")
+            embeddings = normalize(response.to_array())
+
+        dimension = embeddings.shape[1] if embeddings is not None else reused_vectors.shape[1]
+        vectors = self._np.empty((len(documents), dimension), dtype=self._np.float32)
+        if embeddings is not None:
+            vectors[missing] = embeddings
+        if reused:
+            vectors[list(reused)] = reused_vectors
+        return await self._write(documents, vectors, hashes, ids, deduplicate)
+
+    async def _write(
+        self,
+        documents: Sequence[Document],
+        vectors: EmbeddingArray,
+        hashes: Sequence[str],
+        ids: Sequence[str] | None,
+        deduplicate: bool,
+    ) -> list[str]:
+        async with self._write_lock:
+            result, added, replaced_rows = self._assign_ids(vectors, hashes, ids, deduplicate)
+            if added:
+                # new rows become visible to searches only once their documents are added
+                positions = list(added.values())
+                size = self._reserve_rows(vectors, positions)
+                args = (size, list(added), [documents[i] for i in positions], [hashes[i] for i in positions])
+                if self._files is not None:
+                    await asyncio.to_thread(self._append, *args)
+                else:
+                    self._append(*args)
+                self.index.add(self.embeddings, size)
+            self._replace(replaced_rows)
+            return result
+
+    def _to_vectors(
+        self, documents: Sequence[Document], embeddings: EmbeddingArray, ids: Sequence[str] | None
+    ) -> EmbeddingArray:
+        vectors = normalize(self._np.asarray(embeddings, dtype=self._np.float32))
+        if vectors.ndim != 2 or len(vectors) != len(documents):
+            raise ValueError("Expected exactly one embedding per document.")
+        if ids is not None and len(ids) != len(documents):
+            raise ValueError("Expected exactly one id per document.")
+        return vectors
+
+    def _assign_ids(
+        self, vectors: EmbeddingArray, hashes: Sequence[str], ids: Sequence[str] | None, deduplicate: bool
+    ) -> tuple[list[str], dict[str, int], list[int]]:
+        """Returns ids of all documents, positions of the documents to add (by their ids) and the replaced rows."""
+        if self._matrix is not None and self._size and self._matrix.shape[1] != vectors.shape[1]:
+            raise ValueError(f"Expected embeddings of dimension {self._matrix.shape[1]}, got {vectors.shape[1]}.")
+
+        rows_by_id, ids_by_hash = self._get_keys()
+        result: list[str] = []
+        added: dict[str, int] = {}  # id → position of the document in this batch
+        added_hashes: dict[str, str] = {}
+        replaced: list[int] = []
+        for i, hash in enumerate(hashes):
+            id = ids[i] if ids is not None else None
+            if id is None:
+                existing = (ids_by_hash.get(hash) or added_hashes.get(hash)) if deduplicate else None
+                if existing is not None:
+                    result.append(existing)
+                    continue
+                id = hash if hash not in rows_by_id and hash not in added else f"{hash}-{uuid.uuid4().hex[:12]}"
+            elif ids_by_hash.get(hash) == id or added_hashes.get(hash) == id:
+                result.append(id)  # unchanged
+                continue
+            elif id in rows_by_id:
+                replaced.append(rows_by_id[id])
+
+            added[id] = i
+            added_hashes[hash] = id
+            result.append(id)
+        return result, added, list(dict.fromkeys(replaced))
+
+    def _reserve_rows(self, vectors: EmbeddingArray, positions: Sequence[int]) -> int:
+        """Copies the vectors into the rows following the last one, returns the first of them."""
+        self._reserve(len(positions), vectors.shape[1])
+        assert self._matrix is not None
+        size = self._size
+        self._matrix[size : size + len(positions)] = vectors[positions]
+        return size
+
+    def _append(self, size: int, ids: Sequence[str], documents: Sequence[Document], hashes: Sequence[str]) -> None:
+        if self._files is not None:
+            assert self._matrix is not None
+            self._append_to_files(self._matrix[size : size + len(documents)])
+        self._documents.add(ids, documents, hashes)
+
+    def _replace(self, rows: Sequence[int]) -> None:
+        # replaced documents are marked only after their replacements were written
+        if rows:
+            self._tombstone(rows)
+            self._compact_if_needed()
+
+    def _tombstone(self, rows: Sequence[int]) -> None:
+        rows_by_id, ids_by_hash = self._get_keys()
+        for row, (id, hash) in zip(rows, self._documents.get_keys(rows), strict=True):
+            if rows_by_id.get(id) == row:
+                del rows_by_id[id]
+            if ids_by_hash.get(hash) == id:
+                del ids_by_hash[hash]
+        self._documents.delete(rows)
+        self._deleted.update(rows)
+        self._live_mask = None
+
+    def _compact_if_needed(self) -> None:
+        if self.compaction_threshold is not None and len(self._deleted) > self.compaction_threshold * self._size:
+            self.compact()
+
+    def _get_keys(self) -> tuple[dict[str, int], dict[str, str]]:
+        if self._keyed < self._size:
+            # like metadata, keys are read lazily, loaded stores which are only searched don't have to read them
+            for row, (id, hash) in enumerate(self._documents.iter_keys(self._keyed), self._keyed):
+                if row not in self._deleted:
+                    self._rows_by_id[id] = row
+                    self._ids_by_hash[hash] = id
+            self._keyed = self._size
+        return self._rows_by_id, self._ids_by_hash
+
+    def _get_live_mask(self) -> Any:
+        if self._live_mask is None or len(self._live_mask) != self._size:
+            self._live_mask = self._np.ones(self._size, dtype=bool)
+            self._live_mask[list(self._deleted)] = False
+        return self._live_mask
+
+    def _get_metadata_index(self) -> MetadataIndex:
+        if self._metadata_indexed < self._size:
+            # documents are indexed lazily, loaded stores which are never filtered don't have to read all metadata
+            self._metadata_index.add(
+                list(self._documents.iter_metadata(self._metadata_indexed)), self._metadata_indexed
+            )
+            self._metadata_indexed = self._size
+        return self._metadata_index
+
+    def _copy_documents(self, target: DocumentStore, rows: Sequence[int]) -> None:
+        for offset in range(0, len(rows), 1000):
+            batch = list(rows[offset : offset + 1000])
+            keys = self._documents.get_keys(batch)
+            target.add([id for id, _ in keys], self._documents.get(batch), [hash for _, hash in keys])
+
+    def _commit_files(self, files: VectorStoreFiles, matrix: EmbeddingArray, documents: SQLiteDocumentStore) -> None:
+        dimension = 0 if self._matrix is None else self._matrix.shape[1]
+        matrix_name = files.write_matrix(matrix.reshape(len(matrix), dimension), self.dtype)
+        files.commit(
+            VectorStoreManifest(
+                dimension=dimension, dtype=self.dtype, matrix=matrix_name, documents=documents.path.name
+            )
+        )
+
+    def _close_documents(self) -> None:
+        if isinstance(self._documents, SQLiteDocumentStore):
+            self._documents.close()
+
+    def _append_to_files(self, rows: EmbeddingArray) -> None:
+        assert self._files is not None
+        manifest = self._files.get_manifest()
+        if not manifest.dimension:
+            self._files.commit(manifest.model_copy(update={"dimension": rows.shape[1]}))
+        self._files.append_segment(rows, self.dtype)
+
+    def _reserve(self, count: int, dimension: int) -> None:
+        size = self._size
+        if self._matrix is not None and size + count <= len(self._matrix) and self._matrix.flags.writeable:
+            return
+
+        capacity = self._capacity if self._matrix is None else max(len(self._matrix), self._capacity)
+        while capacity < size + count:
+            capacity *= 2
+
+        matrix = self._np.empty((capacity, dimension), dtype=self.dtype)
+        if self._matrix is not None and size:
+            matrix[:size] = self._matrix[:size]
+        self._matrix = matrix
+
+
+class HybridRetriever(BeeAIVectorStore):
+    """
+    Combines dense retrieval of a wrapped vector store with a lexical (BM25) index.
+
+    Documents added through the retriever are added to both (upserts and deletions are applied to both as well),
+    a search queries both and merges their results either by reciprocal rank fusion (`"rrf"`)
+    or by a sum of min-max normalized scores (`"weighted"`), `vector_weight` sets the share of the dense side in both.
+    Returned scores are the fused ones.
+
+    When only an embedding model is given (e.g. when created by `VectorStore.from_name`),
+    a `LocalVectorStore` is used.
+    """
+
+    def __init__(
+        self,
+        vector_store: VectorStore | None = None,
+        *,
+        embedding_model: EmbeddingModel | None = None,
+        lexical_index: BM25Index | None = None,
+        fusion: Literal["rrf", "weighted"] = "rrf",
+        vector_weight: float = 0.5,
+        rrf_k: int = 60,
+        fetch_k: int | None = None,
+    ) -> None:
+        if vector_store is None:
+            if embedding_model is None:
+                raise ValueError("Either 'vector_store' or 'embedding_model' must be provided.")
+            vector_store = LocalVectorStore(embedding_model)
+        if not 0 <= vector_weight <= 1:
+            raise ValueError("'vector_weight' must be between 0 and 1.")
+
+        self.vector_store = vector_store
+        self.lexical_index = lexical_index if lexical_index is not None else BM25Index()
+        self.fusion = fusion
+        self.vector_weight = vector_weight
+        self.rrf_k = rrf_k
+        self.fetch_k = fetch_k
+
+    async def add_documents(self, documents: list[Document]) -> list[str]:
+        ids = await self.vector_store.add_documents(documents)
+        self.lexical_index.add(documents, ids)
+        return ids
+
+    async def upsert(self, documents: list[Document], ids: Sequence[str] | None = None) -> list[str]:
+        ids = await self.vector_store.upsert(documents, ids)
+        self.lexical_index.add(documents, ids)
+        return ids
+
+    async def delete(self, ids: Sequence[str] | None = None, *, filter: MetadataFilterLike | None = None) -> None:
+        metadata_filter = to_metadata_filter(filter)
+        await self.vector_store.delete(ids, filter=metadata_filter)
+        self.lexical_index.delete(ids, filter=metadata_filter)
+
+    async def search(
+        self, query: QueryLike, k: int = 4, *, filter: MetadataFilterLike | None = None, **kwargs: Any
+    ) -> list[DocumentWithScore]:
+        if k <= 0:
+            return []
+
+        # each side retrieves more candidates than requested, documents found by only one of them can still rank high
+        fetch_k = max(self.fetch_k or 2 * k, k)
+        metadata_filter = to_metadata_filter(filter)
+        dense = asyncio.create_task(self.vector_store.search(query, k=fetch_k, filter=metadata_filter, **kwargs))
+        try:
+            await asyncio.sleep(0)  # the dense search sends its request (e.g. to embed the query) first
+            # the lexical index is only safe to use from the event loop, which is also the one modifying it
+            lexical = self.lexical_index.search(str(query), fetch_k, filter=metadata_filter)
+        except BaseException:
+            dense.cancel()
+            raise
+        return self._fuse([await dense, lexical], [self.vector_weight, 1 - self.vector_weight])[:k]
+
+    def _fuse(self, rankings: list[list[DocumentWithScore]], weights: list[float]) -> list[DocumentWithScore]:
+        documents: dict[Hashable, Document] = {}
+        scores: dict[Hashable, float] = {}
+        for ranking, weight in zip(rankings, weights, strict=True):
+            if self.fusion == "rrf":
+                contributions = [weight / (self.rrf_k + rank) for rank in range(1, len(ranking) + 1)]
+            else:
+                values = [result.score for result in ranking]
+                low, high = min(values, default=0), max(values, default=0)
+                contributions = [weight * ((value - low) / (high - low) if high > low else 1.0) for value in values]
+
+            for result, contribution in zip(ranking, contributions, strict=True):
+                key = _document_key(result.document)
+                documents.setdefault(key, result.document)
+                scores[key] = scores.get(key, 0.0) + contribution
+
+        return [
+            DocumentWithScore(document=documents[key], score=score)
+            for key, score in sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        ]
+
+
+def _document_key(document: Document) -> Hashable:
+    return document.content, tuple(sorted(document.metadata.items()))
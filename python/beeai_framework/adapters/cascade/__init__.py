@@ -0,0 +1,6 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from beeai_framework.adapters.cascade.backend.chat import CascadeChatModel
+
+__all__ = ["CascadeChatModel"]
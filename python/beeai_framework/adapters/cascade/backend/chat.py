@@ -0,0 +1,7 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+# makes the cascade available via ChatModel.from_name("cascade:<provider:model>,<provider:model>")
+from beeai_framework.backend.cascade import CascadeChatModel
+
+__all__ = ["CascadeChatModel"]
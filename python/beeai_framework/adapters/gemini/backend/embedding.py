@@ -12,6 +12,9 @@ from beeai_framework.backend.embedding import EmbeddingModelKwargs
 
 
 class GeminiEmbeddingModel(LiteLLMEmbeddingModel):
+    # maximal number of inputs in a single request
+    max_batch_size = 100
+
     @property
     def provider_id(self) -> ProviderName:
         return "gemini"
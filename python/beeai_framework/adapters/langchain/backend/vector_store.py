@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import importlib
+from collections.abc import Mapping, Sequence
 from typing import Any
 
 from beeai_framework.adapters.langchain.mappers.embedding import LangChainBeeAIEmbeddingModel
@@ -11,6 +12,7 @@ from beeai_framework.backend.types import Document, DocumentWithScore
 
 try:
     from langchain_core.documents import Document as LCDocument
+    from langchain_core.vectorstores import InMemoryVectorStore as LCInMemoryVectorStore
     from langchain_core.vectorstores import VectorStore as LCVectorStore
 except ModuleNotFoundError as e:
     raise ModuleNotFoundError(
@@ -19,7 +21,8 @@ except ModuleNotFoundError as e:
 
 from beeai_framework.adapters.langchain.mappers.documents import document_to_lc_document, lc_document_to_document
 from beeai_framework.backend.embedding import EmbeddingModel
-from beeai_framework.backend.vector_store import QueryLike, VectorStore
+from beeai_framework.backend.metadata_filter import MetadataFilter, MetadataFilterLike, to_metadata_filter
+from beeai_framework.backend.vector_store import QueryLike, VectorStore, hash_document
 from beeai_framework.logger import Logger
 
 logger = Logger(__name__)
@@ -30,11 +33,85 @@ class LangChainVectorStore(VectorStore):
         super().__init__()
         self.vector_store: LCVectorStore = vector_store
 
+    @property
+    def supports_get_by_ids(self) -> bool:
+        """Whether the underlying store can fetch documents by ids, LangChain stores don't have to implement it."""
+        store_class = type(self.vector_store)
+        return (
+            store_class.get_by_ids is not LCVectorStore.get_by_ids
+            or store_class.aget_by_ids is not LCVectorStore.aget_by_ids
+        )
+
+    @property
+    def supports_delete_by_filter(self) -> bool:
+        """Whether documents can be deleted by a filter alone, without their ids."""
+        return isinstance(self.vector_store, LCInMemoryVectorStore)
+
     async def add_documents(self, documents: list[Document]) -> list[str]:
         lc_documents = [document_to_lc_document(document) for document in documents]
         return await self.vector_store.aadd_documents(lc_documents)
 
-    async def search(self, query: QueryLike, k: int = 4, **kwargs: Any) -> list[DocumentWithScore]:
+    async def upsert(self, documents: list[Document], ids: Sequence[str] | None = None) -> list[str]:
+        """
+        Adds or replaces documents by ids, relies on the underlying store overwriting documents with existing ids.
+
+        Documents which are stored unchanged are skipped (see `supports_get_by_ids`), so they are not embedded again.
+        """
+        ids = list(ids) if ids is not None else [hash_document(document) for document in documents]
+        pending = dict(zip(ids, documents, strict=True))
+        stored = await self.vector_store.aget_by_ids(list(pending)) if self.supports_get_by_ids else []
+        for lc_document in stored:
+            if lc_document.id in pending and lc_document_to_document(lc_document) == pending[lc_document.id]:
+                del pending[lc_document.id]
+
+        if pending:
+            lc_documents = [document_to_lc_document(document) for document in pending.values()]
+            await self.vector_store.aadd_documents(lc_documents, ids=list(pending))
+        return ids
+
+    async def delete(self, ids: Sequence[str] | None = None, *, filter: MetadataFilterLike | None = None) -> None:
+        """
+        Deletes documents by ids or by a metadata filter.
+
+        Filters are evaluated on documents fetched by ids (when both are given, see `supports_get_by_ids`),
+        or on all documents of the in-memory store (see `supports_delete_by_filter`).
+        """
+        if ids is None and filter is None:
+            raise ValueError("Either 'ids' or 'filter' must be provided.")
+
+        metadata_filter = to_metadata_filter(filter)
+        if metadata_filter is None:
+            assert ids is not None
+            selected = list(ids)
+        elif ids is not None:
+            if not self.supports_get_by_ids:
+                raise ValueError(f"{type(self.vector_store).__name__} can't fetch documents by ids to filter them.")
+            stored = await self.vector_store.aget_by_ids(list(ids))
+            selected = [
+                lc_document.id
+                for lc_document in stored
+                if lc_document.id is not None and metadata_filter.matches(lc_document.metadata)
+            ]
+        elif isinstance(self.vector_store, LCInMemoryVectorStore):
+            selected = [id for id, item in self.vector_store.store.items() if metadata_filter.matches(item["metadata"])]
+        else:
+            raise ValueError(f"{type(self.vector_store).__name__} can't delete by a filter alone, provide 'ids'.")
+
+        if selected:
+            await self.vector_store.adelete(selected)
+
+    async def search(
+        self, query: QueryLike, k: int = 4, *, filter: MetadataFilterLike | Any | None = None, **kwargs: Any
+    ) -> list[DocumentWithScore]:
+        """
+        Searches the underlying store.
+
+        Filters in the framework's syntax are translated by `_to_native_filter`. Anything else, such as
+        operators the framework does not know (e.g. `$ne`) or a store-specific filter, is passed to the store as is.
+        """
+        if filter is not None:
+            kwargs["filter"] = self._parse_filter(filter)
+
         query_str = str(query)
         lc_documents_with_scores: list[
             tuple[LCDocument, float]
@@ -45,6 +122,30 @@ class LangChainVectorStore(VectorStore):
         ]
         return documents_with_scores
 
+    def _parse_filter(self, filter: MetadataFilterLike | Any) -> Any:
+        if isinstance(filter, MetadataFilter):
+            return self._to_native_filter(filter)
+        if not isinstance(filter, Mapping):
+            return filter
+
+        try:
+            metadata_filter = MetadataFilter.from_dict(filter)
+        except ValueError:
+            return filter
+        return self._to_native_filter(metadata_filter)
+
+    def _to_native_filter(self, metadata_filter: MetadataFilter) -> Any:
+        """
+        Translates the filter for the underlying store.
+
+        The in-memory store accepts a predicate, other stores get the MongoDB-like dictionary
+        which is understood by many integrations (e.g. Chroma, Pinecone, PGVector, MongoDB Atlas).
+        Override this method for stores with a different syntax.
+        """
+        if isinstance(self.vector_store, LCInMemoryVectorStore):
+            return lambda document: metadata_filter.matches(document.metadata)
+        return metadata_filter.to_dict()
+
     @classmethod
     def _class_from_name(cls, class_name: str, embedding_model: EmbeddingModel, **kwargs: Any) -> LangChainVectorStore:
         """
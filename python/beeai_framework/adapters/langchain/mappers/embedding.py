@@ -25,20 +25,20 @@ class LangChainBeeAIEmbeddingModel(LCEmbeddingModel):
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         embedding_res: EmbeddingModelOutput = run_sync(self._embedding_model.create(values=texts))
-        return embedding_res.embeddings
+        return embedding_res.to_list()
 
     async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
         results = []
         for iteration_start_index in range(0, len(texts), self._batch_size):
             texts_to_embed = texts[iteration_start_index : iteration_start_index + self._batch_size]
             embedding_res: EmbeddingModelOutput = await self._embedding_model.create(values=texts_to_embed)
-            results.extend(embedding_res.embeddings)
+            results.extend(embedding_res.to_list())
         return results
 
     def embed_query(self, text: str) -> list[float]:
         embedding_res: EmbeddingModelOutput = run_sync(self._embedding_model.create(values=[text]))
-        return embedding_res.embeddings[0]
+        return embedding_res.to_list()[0]
 
     async def aembed_query(self, text: str) -> list[float]:
         embedding_res: EmbeddingModelOutput = await self._embedding_model.create(values=[text])
-        return embedding_res.embeddings[0]
+        return embedding_res.to_list()[0]
@@ -1,6 +1,7 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+from beeai_framework.adapters.litellm.batch import LiteLLMBatchSubmitter
 from beeai_framework.adapters.litellm.chat import LiteLLMChatModel
 
-__all__ = ["LiteLLMChatModel"]
+__all__ = ["LiteLLMBatchSubmitter", "LiteLLMChatModel"]
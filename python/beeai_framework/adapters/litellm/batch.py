@@ -0,0 +1,66 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from pathlib import Path
+from typing import Any, Literal
+
+import litellm
+
+from beeai_framework.backend.batch import ChatModelBatchSubmitter
+from beeai_framework.backend.errors import ChatModelError
+
+__all__ = ["LiteLLMBatchSubmitter"]
+
+
+class LiteLLMBatchSubmitter(ChatModelBatchSubmitter):
+    """
+    Submits batches to the provider's batch API (OpenAI or Azure OpenAI) via LiteLLM.
+
+    Extra keyword arguments (e.g. `api_key`, `api_base`) are passed to every LiteLLM call.
+    """
+
+    def __init__(self, provider: Literal["openai", "azure"] = "openai", **settings: Any) -> None:
+        self.provider: Literal["openai", "azure"] = provider
+        self.settings = settings
+        self._paths: dict[str, Path] = {}
+
+    async def submit(self, path: Path) -> str:
+        content = await asyncio.to_thread(path.read_bytes)
+        file = await litellm.acreate_file(
+            file=(path.name, content), purpose="batch", custom_llm_provider=self.provider, **self.settings
+        )
+
+        batch = await litellm.acreate_batch(
+            completion_window="24h",
+            endpoint="/v1/chat/completions",
+            input_file_id=file.id,
+            custom_llm_provider=self.provider,
+            **self.settings,
+        )
+        batch_id = str(batch.id)
+        self._paths[batch_id] = path
+        return batch_id
+
+    async def poll(self, batch_id: str) -> Path | None:
+        batch = await litellm.aretrieve_batch(batch_id=batch_id, custom_llm_provider=self.provider, **self.settings)
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise ChatModelError(
+                f"Batch '{batch_id}' has {batch.status}.",
+                context={"errors": batch.errors.model_dump() if batch.errors else None},
+            )
+        if batch.status != "completed":
+            return None
+
+        # failed requests are reported in a separate file, both share the same format
+        contents: list[bytes] = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                content = await litellm.afile_content(
+                    file_id=file_id, custom_llm_provider=self.provider, **self.settings
+                )
+                contents.append(content.content)
+
+        results_path = self._paths.pop(batch_id).with_suffix(".results.jsonl")
+        await asyncio.to_thread(results_path.write_bytes, b"".join(contents))
+        return results_path
@@ -1,13 +1,16 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import copy
 import os
 from abc import ABC
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 from itertools import chain
-from typing import Any, Self
+from typing import Any, NamedTuple, Self
+from weakref import WeakKeyDictionary
 
-from beeai_framework.adapters.litellm.utils import litellm_debug
+from beeai_framework.adapters.litellm.utils import get_litellm_client_params, litellm_debug
 
 if not os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", None):
     os.environ["LITELLM_LOCAL_MODEL_COST_MAP"] = "True"
@@ -19,7 +22,8 @@ from litellm import (  # type: ignore
     acompletion,
     get_supported_openai_params,
 )
-from litellm.types.utils import StreamingChoices
+from litellm.types.utils import ChatCompletionDeltaCustomToolCall, StreamingChoices
+from litellm.utils import get_model_info, supports_prompt_caching
 from openai.lib._pydantic import _ensure_strict_json_schema, to_strict_json_schema
 from pydantic import BaseModel
 from typing_extensions import Unpack
@@ -30,11 +34,15 @@ from beeai_framework.backend.chat import (
 )
 from beeai_framework.backend.errors import ChatModelError
 from beeai_framework.backend.message import (
+    AnyMessage,
     AssistantMessage,
+    MessageCacheControl,
     MessageTextContent,
     MessageToolCallContent,
+    MessageToolCallDeltaContent,
     ToolMessage,
 )
+from beeai_framework.backend.tokenizer import TiktokenTokenizer, Tokenizer
 from beeai_framework.backend.types import (
     ChatModelInput,
     ChatModelOutput,
@@ -43,16 +51,82 @@ from beeai_framework.backend.types import (
     ChatModelStructureOutput,
     ChatModelUsage,
 )
-from beeai_framework.backend.utils import parse_broken_json
+from beeai_framework.backend.utils import get_tool_spec, to_tool_json_schema
 from beeai_framework.cache.null_cache import NullCache
 from beeai_framework.context import RunContext
 from beeai_framework.logger import Logger
 from beeai_framework.tools.tool import Tool
 from beeai_framework.utils.dicts import exclude_keys, exclude_none, include_keys, set_attr_if_none
+from beeai_framework.utils.http import HTTPTransport
 from beeai_framework.utils.strings import to_json
 
 logger = Logger(__name__)
 
+# LiteLLM adjusts tool and response schemas of these providers in place (e.g. it unwinds '$defs')
+_SCHEMA_MUTATING_PROVIDERS = frozenset({"bedrock", "gemini", "vertex_ai"})
+
+
+class _MessagePayloadEntry(NamedTuple):
+    version: tuple[Any, ...]
+    model_supports_tool_calling: bool
+    cache_control: MessageCacheControl | None
+    payload: list[dict[str, Any]]
+
+
+def _content_version(message: AnyMessage) -> tuple[Any, ...] | None:
+    """
+    Returns a cheap version of the message's content made of the field values of its parts.
+
+    Reassigning a part's field (e.g. `content.text = ...`) or replacing a part changes the version.
+    Messages holding mutable values (e.g. a dict tool result) have no version because in-place edits of such
+    values cannot be detected without serializing them.
+    """
+    version = tuple((type(part), *vars(part).values()) for part in message.content)
+    try:
+        hash(version)
+    except TypeError:
+        return None
+    return version
+
+
+def _set_cache_control(payload: dict[str, Any], cache_control: MessageCacheControl) -> None:
+    content = payload.get("content")
+    if payload["role"] == "tool" or not content:
+        payload["cache_control"] = dict(cache_control)
+    elif isinstance(content, str):
+        payload["content"] = [{"type": "text", "text": content, "cache_control": dict(cache_control)}]
+    else:
+        content[-1]["cache_control"] = dict(cache_control)
+
+
+def _supports_prompt_caching(model_id: str, provider_id: str) -> bool:
+    try:
+        return bool(supports_prompt_caching(model=model_id, custom_llm_provider=provider_id))
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=256)
+def _get_context_window(model_id: str, provider_id: str) -> int | None:
+    try:
+        info = get_model_info(model=model_id, custom_llm_provider=provider_id)
+    except Exception:
+        return None
+    return info.get("max_input_tokens") or info.get("max_tokens")
+
+
+def _transform_usage(usage: Any) -> ChatModelUsage:
+    prompt_tokens_details = getattr(usage, "prompt_tokens_details", None)
+    return ChatModelUsage(
+        prompt_tokens=usage.prompt_tokens,
+        completion_tokens=usage.completion_tokens,
+        total_tokens=usage.total_tokens,
+        cached_prompt_tokens=getattr(prompt_tokens_details, "cached_tokens", None)
+        or getattr(usage, "cache_read_input_tokens", None)
+        or 0,
+        cache_creation_prompt_tokens=getattr(usage, "cache_creation_input_tokens", None) or 0,
+    )
+
 
 class LiteLLMChatModel(ChatModel, ABC):
     @property
@@ -74,6 +148,25 @@ class LiteLLMChatModel(ChatModel, ABC):
         litellm.drop_params = True
         # disable LiteLLM caching in favor of our own
         litellm.disable_cache()  # type: ignore [attr-defined]
+        # connections are pooled per base URL and shared across models, set to None to use LiteLLM's own clients
+        self.http_transport: HTTPTransport | None = HTTPTransport.root()
+        # conversations are re-sent on every call, only new or changed messages get converted
+        self._message_payload_cache: WeakKeyDictionary[AnyMessage, _MessagePayloadEntry] = WeakKeyDictionary()
+        # cache breakpoints are only sent to providers which support them, others reuse prefixes automatically
+        self.supports_prompt_caching = _supports_prompt_caching(self.model_id, provider_id)
+
+    def _create_tokenizer(self) -> Tokenizer:
+        # tiktoken only knows OpenAI models, other models (or a failed download) get a calibrated estimate
+        try:
+            return TiktokenTokenizer.for_model(self.model_id)
+        except Exception as e:
+            logger.debug(f"Tiktoken tokenizer for '{self.model_id}' is not available, using an estimate. {e!s}")
+            return super()._create_tokenizer()
+
+    @property
+    def context_window(self) -> int | None:
+        # the lookup in LiteLLM's model map is not free and the agents ask for it before every request
+        return _get_context_window(self.model_id, self._litellm_provider_id)
 
     async def _create(
         self,
@@ -81,7 +174,7 @@ class LiteLLMChatModel(ChatModel, ABC):
         run: RunContext,
     ) -> ChatModelOutput:
         litellm_input = self._transform_input(input) | {"stream": False}
-        response = await acompletion(**litellm_input)
+        response = await acompletion(**litellm_input, **self._get_client_params())
         response_output = self._transform_output(response)
         logger.debug(f"Inference response output:\n{response_output}")
         return response_output
@@ -89,7 +182,7 @@ class LiteLLMChatModel(ChatModel, ABC):
     async def _create_stream(self, input: ChatModelInput, _: RunContext) -> AsyncGenerator[ChatModelOutput]:
         litellm_input = self._transform_input(input) | {"stream": True}
         set_attr_if_none(litellm_input, ["stream_options", "include_usage"], value=True)
-        response = await acompletion(**litellm_input)
+        response = await acompletion(**litellm_input, **self._get_client_params())
 
         is_empty = True
         async for chunk in response:
@@ -107,94 +200,20 @@ class LiteLLMChatModel(ChatModel, ABC):
             logger.warning(f"{self.provider_id} model {self.model_id} does not support structured data.")
             return await super()._create_structure(input, run)
         else:
-            response = await self._create(
+            return await self._generate_structure_with_retries(
                 ChatModelInput(
                     messages=input.messages, response_format=input.input_schema, abort_signal=input.abort_signal
                 ),
+                input,
                 run,
             )
 
-            logger.debug(f"Structured response received:\n{response}")
-
-            text_response = response.get_text_content()
-            result = parse_broken_json(text_response)
-            # TODO: validate result matches expected schema
-            return ChatModelStructureOutput(object=result)
-
     def _transform_input(self, input: ChatModelInput) -> dict[str, Any]:
-        messages: list[dict[str, Any]] = []
-        for message in input.messages:
-            if isinstance(message, ToolMessage):
-                for content in message.content:
-                    new_msg = (
-                        {
-                            "tool_call_id": content.tool_call_id,
-                            "role": "tool",
-                            "name": content.tool_name,
-                            "content": content.result,
-                        }
-                        if self.model_supports_tool_calling
-                        else {
-                            "role": "assistant",
-                            "content": to_json(
-                                {"tool_call_id": content.tool_call_id, "result": content.result},
-                                indent=2,
-                                sort_keys=False,
-                            ),
-                        }
-                    )
-                    messages.append(new_msg)
-
-            elif isinstance(message, AssistantMessage):
-                msg_text_content = [t.model_dump() for t in message.get_text_messages()]
-                msg_tool_calls = [
-                    {
-                        "id": call.id,
-                        "type": "function",
-                        "function": {
-                            "arguments": call.args,
-                            "name": call.tool_name,
-                        },
-                    }
-                    for call in message.get_tool_calls()
-                ]
-
-                new_msg = (
-                    {
-                        "role": "assistant",
-                        "content": msg_text_content or None,
-                        "tool_calls": msg_tool_calls or None,
-                    }
-                    if self.model_supports_tool_calling
-                    else {
-                        "role": "assistant",
-                        "content": [
-                            *msg_text_content,
-                            *[
-                                MessageTextContent(text=to_json(t, indent=2, sort_keys=False)).model_dump()
-                                for t in msg_tool_calls
-                            ],
-                        ]
-                        or None,
-                    }
-                )
-
-                messages.append(exclude_none(new_msg))
-            else:
-                messages.append(message.to_plain())
+        messages = [payload for message in input.messages for payload in self._transform_message(message)]
 
-        tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": self._format_tool_model(tool.input_schema),
-                    "strict": self.use_strict_tool_schema,
-                },
-            }
-            for tool in input.tools or []
-        ]
+        tools = [get_tool_spec(tool, strict=self.use_strict_tool_schema) for tool in input.tools or []]
+        if self._litellm_provider_id in _SCHEMA_MUTATING_PROVIDERS:
+            tools = copy.deepcopy(tools)  # the specs are shared between calls
 
         settings = exclude_keys(
             self._settings | input.model_dump(exclude_unset=True),
@@ -230,12 +249,142 @@ class LiteLLMChatModel(ChatModel, ABC):
             }
         )
 
+    def _create_batch_request(self, input: ChatModelInput) -> dict[str, Any] | None:
+        # settings such as credentials or base URLs must never end up in the batch file
+        body = include_keys(
+            self._transform_input(input),
+            {"messages", "tools", "tool_choice", "response_format", *self.supported_params}
+            - {"stream", "stream_options"},
+        )
+        return body | {"model": self.model_id}
+
+    def _load_batch_response(self, body: dict[str, Any]) -> ChatModelOutput:
+        return self._transform_output(ModelResponse(**body))
+
+    def _transform_message(self, message: AnyMessage) -> list[dict[str, Any]]:
+        """Returns provider payload for the given message, reusing the one built for the same content version."""
+        version = _content_version(message)
+        if version is None:
+            return self._create_message_payload(message)
+
+        entry = self._message_payload_cache.get(message)
+        if (
+            entry is None
+            or entry.model_supports_tool_calling != self.model_supports_tool_calling
+            or entry.cache_control != message.cache_control
+            or entry.version != version
+        ):
+            entry = _MessagePayloadEntry(
+                version=version,
+                model_supports_tool_calling=self.model_supports_tool_calling,
+                cache_control=copy.copy(message.cache_control),
+                payload=self._create_message_payload(message),
+            )
+            self._message_payload_cache[message] = entry
+
+        # LiteLLM replaces top-level keys (e.g. 'content') of messages in place for some providers
+        return [dict(payload) for payload in entry.payload]
+
+    def _create_message_payload(self, message: AnyMessage) -> list[dict[str, Any]]:
+        payload: list[dict[str, Any]] = []
+        if isinstance(message, ToolMessage):
+            for content in message.content:
+                new_msg = (
+                    {
+                        "tool_call_id": content.tool_call_id,
+                        "role": "tool",
+                        "name": content.tool_name,
+                        "content": content.result,
+                    }
+                    if self.model_supports_tool_calling
+                    else {
+                        "role": "assistant",
+                        "content": to_json(
+                            {"tool_call_id": content.tool_call_id, "result": content.result},
+                            indent=2,
+                            sort_keys=False,
+                        ),
+                    }
+                )
+                payload.append(new_msg)
+
+        elif isinstance(message, AssistantMessage):
+            msg_text_content = [t.model_dump() for t in message.get_text_messages()]
+            msg_tool_calls = [
+                {
+                    "id": call.id,
+                    "type": "function",
+                    "function": {
+                        "arguments": call.args,
+                        "name": call.tool_name,
+                    },
+                }
+                for call in message.get_tool_calls()
+            ]
+
+            new_msg = (
+                {
+                    "role": "assistant",
+                    "content": msg_text_content or None,
+                    "tool_calls": msg_tool_calls or None,
+                }
+                if self.model_supports_tool_calling
+                else {
+                    "role": "assistant",
+                    "content": [
+                        *msg_text_content,
+                        *[
+                            MessageTextContent(text=to_json(t, indent=2, sort_keys=False)).model_dump()
+                            for t in msg_tool_calls
+                        ],
+                    ]
+                    or None,
+                }
+            )
+
+            payload.append(exclude_none(new_msg))
+        else:
+            payload.append(message.to_plain())
+
+        if message.cache_control and self.supports_prompt_caching and payload:
+            _set_cache_control(payload[-1], message.cache_control)
+        return payload
+
+    def _get_client_params(self) -> dict[str, Any]:
+        return get_litellm_client_params(
+            self.http_transport,
+            kind="chat",
+            provider_id=self._litellm_provider_id,
+            model_id=self.model_id,
+            settings=self._settings,
+        )
+
     def _transform_output(self, chunk: ModelResponse | ModelResponseStream) -> ChatModelOutput:
         choice = chunk.choices[0]
         finish_reason = choice.finish_reason
         usage = chunk.get("usage")  # type: ignore
+        is_stream = isinstance(choice, StreamingChoices)
         update = choice.delta if isinstance(choice, StreamingChoices) else choice.message
 
+        if is_stream and update.tool_calls:
+            # streamed arguments are partial, they get assembled by the ChatModel
+            return ChatModelOutput(
+                messages=[],
+                tool_call_deltas=[
+                    MessageToolCallDeltaContent(
+                        index=getattr(call, "index", None),
+                        id=call.id,
+                        tool_name=call.function.name,
+                        args=call.function.arguments or "",
+                    )
+                    for call in update.tool_calls
+                    # custom (free-form) tool calls are not supported, tools are always called with JSON arguments
+                    if not isinstance(call, ChatCompletionDeltaCustomToolCall)
+                ],
+                finish_reason=finish_reason,
+                usage=_transform_usage(usage) if usage else None,
+            )
+
         return ChatModelOutput(
             messages=(
                 [
@@ -248,6 +397,7 @@ class LiteLLMChatModel(ChatModel, ABC):
                                     args=call.function.arguments,
                                 )
                                 for call in update.tool_calls
+                                if not isinstance(call, ChatCompletionDeltaCustomToolCall)
                             ]
                         )
                         if update.tool_calls
@@ -258,13 +408,15 @@ class LiteLLMChatModel(ChatModel, ABC):
                 else []
             ),
             finish_reason=finish_reason,
-            usage=ChatModelUsage(**usage.model_dump()) if usage else None,
+            usage=_transform_usage(usage) if usage else None,
         )
 
     def _format_tool_model(self, model: type[BaseModel]) -> dict[str, Any]:
-        return to_strict_json_schema(model) if self.use_strict_tool_schema else model.model_json_schema()
+        return to_tool_json_schema(model, strict=self.use_strict_tool_schema)
 
     def _format_response_model(self, model: type[BaseModel] | dict[str, Any]) -> type[BaseModel] | dict[str, Any]:
+        if isinstance(model, dict) and self._litellm_provider_id in _SCHEMA_MUTATING_PROVIDERS:
+            model = copy.deepcopy(model)  # the schema may be shared (e.g. a tool union)
         if isinstance(model, dict) and model.get("type") in ["json_schema", "json_object"]:
             return model
 
@@ -294,6 +446,9 @@ class LiteLLMChatModel(ChatModel, ABC):
         cloned.model_supports_tool_calling = self.model_supports_tool_calling
         cloned.use_strict_model_schema = self.use_strict_model_schema
         cloned.use_strict_tool_schema = self.use_strict_tool_schema
+        cloned.http_transport = self.http_transport
+        cloned.supports_prompt_caching = self.supports_prompt_caching
+        cloned.tokenizer = self.tokenizer.clone()
         return cloned
 
     def _assert_setting_value(
@@ -12,15 +12,20 @@ from litellm.litellm_core_utils.get_supported_openai_params import get_supported
 from litellm.types.utils import EmbeddingResponse
 from typing_extensions import Unpack
 
-from beeai_framework.adapters.litellm.utils import litellm_debug
+from beeai_framework.adapters.litellm.utils import get_litellm_client_params, litellm_debug
 from beeai_framework.backend import EmbeddingModel
 from beeai_framework.backend.embedding import EmbeddingModelKwargs
+from beeai_framework.backend.tokenizer import TiktokenTokenizer, Tokenizer
 from beeai_framework.backend.types import EmbeddingModelInput, EmbeddingModelOutput, EmbeddingModelUsage
 from beeai_framework.context import RunContext
 from beeai_framework.logger import Logger
+from beeai_framework.utils.http import HTTPTransport
+from beeai_framework.utils.vectors import EmbeddingArray, decode_embedding, import_numpy, to_array
 
 logger = Logger(__name__)
 
+_BASE64_ENCODING_PROVIDERS = {"openai"}
+
 
 class LiteLLMEmbeddingModelOutput(EmbeddingModelOutput):
     response: Any
@@ -42,18 +47,37 @@ class LiteLLMEmbeddingModel(EmbeddingModel, ABC):
         litellm.drop_params = True
         # disable LiteLLM caching in favor of our own
         litellm.disable_cache()  # type: ignore [attr-defined]
+        # connections are pooled per base URL and shared across models, set to None to use LiteLLM's own clients
+        self.http_transport: HTTPTransport | None = HTTPTransport.root()
 
     @property
     def model_id(self) -> str:
         return self._model_id
 
+    def _create_tokenizer(self) -> Tokenizer:
+        # tiktoken only knows OpenAI models, other models (or a failed download) get a calibrated estimate
+        try:
+            return TiktokenTokenizer.for_model(self.model_id)
+        except Exception as e:
+            logger.debug(f"Tiktoken tokenizer for '{self.model_id}' is not available, using an estimate. {e!s}")
+            return super()._create_tokenizer()
+
     async def _create(
         self,
         input: EmbeddingModelInput,
         run: RunContext,
     ) -> EmbeddingModelOutput:
         litellm_input = self._transform_input(input)
-        response = await aembedding(**litellm_input)
+        response = await aembedding(
+            **litellm_input,
+            **get_litellm_client_params(
+                self.http_transport,
+                kind="embedding",
+                provider_id=self._litellm_provider_id,
+                model_id=self._model_id,
+                settings=self._settings,
+            ),
+        )
         response_output = self._transform_output(response, input)
         logger.debug(f"Inference response output:\n{response_output}")
         return response_output
@@ -62,16 +86,24 @@ class LiteLLMEmbeddingModel(EmbeddingModel, ABC):
         return {
             "model": f"{self._litellm_provider_id}/{self._model_id}",
             "input": model_input.values,
+            # base64 encoded vectors are decoded straight into an array, without parsing floats from JSON
+            **(
+                {"encoding_format": "base64"}
+                if model_input.dtype is not None and self._litellm_provider_id in _BASE64_ENCODING_PROVIDERS
+                else {}
+            ),
             **self._settings,
         }
 
     def _transform_output(
         self, response: EmbeddingResponse, model_input: EmbeddingModelInput
     ) -> LiteLLMEmbeddingModelOutput:
-        embeddings: list[list[float]] = []
-
-        for result in response.data:
-            embeddings.append([float(value) for value in result.get("embedding")])
+        embeddings: list[list[float]] | EmbeddingArray
+        if model_input.dtype is not None:
+            vectors = [decode_embedding(result.get("embedding"), model_input.dtype) for result in response.data]
+            embeddings = import_numpy().stack(vectors) if vectors else to_array([], model_input.dtype)
+        else:
+            embeddings = [[float(value) for value in result.get("embedding")] for result in response.data]
 
         return LiteLLMEmbeddingModelOutput(
             values=model_input.values,
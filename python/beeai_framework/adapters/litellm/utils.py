@@ -2,9 +2,64 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-from typing import Any
+from functools import lru_cache
+from typing import Any, Literal
+from weakref import WeakKeyDictionary
 
+import httpx
 import litellm
+from litellm.litellm_core_utils.get_llm_provider_logic import get_llm_provider
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+from openai import AsyncOpenAI, OpenAIError
+
+from beeai_framework.utils.http import HTTPTransport, HTTPTransportConfig
+
+# providers which LiteLLM calls through the OpenAI SDK accept `AsyncOpenAI`, the others its own `AsyncHTTPHandler`
+_OPENAI_SDK_PROVIDERS = {
+    "chat": {"openai", "text-completion-openai"},
+    "embedding": {"openai", "mistral"},
+}
+_HTTP_HANDLER_PROVIDERS = {
+    "chat": {
+        "anthropic",
+        "bedrock",
+        "gemini",
+        "groq",
+        "mistral",
+        "ollama",
+        "ollama_chat",
+        "vertex_ai",
+        "watsonx",
+        "xai",
+    },
+    "embedding": {"gemini", "watsonx"},
+}
+_litellm_clients: WeakKeyDictionary[httpx.AsyncClient, dict[tuple[str | None, ...], Any]] = WeakKeyDictionary()
+
+
+class _PooledAsyncHTTPHandler(AsyncHTTPHandler):
+    """LiteLLM's `AsyncHTTPHandler` backed by a shared client instead of a client of its own."""
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self._shared_client = client
+        super().__init__()
+        self.client = client
+
+    def create_client(self, *args: Any, **kwargs: Any) -> httpx.AsyncClient:
+        return self._shared_client
+
+
+@lru_cache(maxsize=256)
+def _resolve_endpoint(
+    provider_id: str, model_id: str, api_base: str | None, api_key: str | None
+) -> tuple[str | None, str | None]:
+    try:
+        _, _, resolved_api_key, resolved_api_base = get_llm_provider(
+            model=f"{provider_id}/{model_id}", api_base=api_base, api_key=api_key
+        )
+        return resolved_api_key, resolved_api_base
+    except Exception:
+        return api_key, None
 
 
 def parse_extra_headers(
@@ -62,6 +117,46 @@ def _parse_header_string(header_string: str) -> dict[str, str]:
     return headers
 
 
+def get_litellm_client_params(
+    transport: HTTPTransport | None,
+    *,
+    kind: Literal["chat", "embedding"],
+    provider_id: str,
+    model_id: str,
+    settings: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Returns the `client` parameter for a LiteLLM call, backed by a pooled connection from the given transport.
+
+    Providers for which the client type is unknown (or cannot be created) are left to LiteLLM's own clients.
+    """
+    is_openai_sdk = provider_id in _OPENAI_SDK_PROVIDERS[kind]
+    if transport is None or not (is_openai_sdk or provider_id in _HTTP_HANDLER_PROVIDERS[kind]):
+        return {}
+
+    api_key, api_base = _resolve_endpoint(
+        provider_id, model_id, settings.get("api_base") or settings.get("base_url"), settings.get("api_key")
+    )
+
+    # generations take far longer than regular HTTP calls, LiteLLM applies its own timeout to each request
+    config: HTTPTransportConfig = transport.get_config(api_base or provider_id).model_copy(update={"timeout": None})
+    http_client = transport.get_client(api_base or provider_id, config=config)
+    clients = _litellm_clients.setdefault(http_client, {})
+    key = (provider_id, api_key, api_base) if is_openai_sdk else (provider_id,)
+    client = clients.get(key)
+    if client is None:
+        if is_openai_sdk:
+            try:
+                client = AsyncOpenAI(api_key=api_key, base_url=api_base, http_client=http_client)
+            except OpenAIError:
+                return {}  # e.g. missing API key, LiteLLM raises a better error
+        else:
+            client = _PooledAsyncHTTPHandler(http_client)
+        clients[key] = client
+
+    return {"client": client}
+
+
 def litellm_debug(enable: bool = True) -> None:
     litellm.set_verbose = enable  # type: ignore
     litellm.suppress_debug_info = not enable
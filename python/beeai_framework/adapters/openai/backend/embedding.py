@@ -12,6 +12,10 @@ from beeai_framework.backend.embedding import EmbeddingModelKwargs
 
 
 class OpenAIEmbeddingModel(LiteLLMEmbeddingModel):
+    # limits of a single request to the embeddings API
+    max_batch_size = 2048
+    max_batch_tokens = 300_000
+
     @property
     def provider_id(self) -> ProviderName:
         return "openai"
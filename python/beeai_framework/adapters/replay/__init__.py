@@ -0,0 +1,20 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from beeai_framework.adapters.replay.backend.cassette import (
+    ReplayCassette,
+    ReplayLatency,
+    ReplayRecord,
+    ReplaySimulation,
+)
+from beeai_framework.adapters.replay.backend.chat import ReplayChatModel
+from beeai_framework.adapters.replay.backend.embedding import ReplayEmbeddingModel
+
+__all__ = [
+    "ReplayCassette",
+    "ReplayChatModel",
+    "ReplayEmbeddingModel",
+    "ReplayLatency",
+    "ReplayRecord",
+    "ReplaySimulation",
+]
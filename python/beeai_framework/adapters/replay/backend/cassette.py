@@ -0,0 +1,147 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import BaseModel, PrivateAttr
+
+from beeai_framework.backend.errors import BackendError
+
+
+class ReplayChunk(BaseModel):
+    delay: float
+    output: dict[str, Any]
+
+
+class ReplayRecord(BaseModel):
+    kind: Literal["chat", "embedding"]
+    fingerprint: str
+    latency: float
+    # streamed responses are stored as chunks, the others as a single output
+    output: dict[str, Any] | None = None
+    chunks: list[ReplayChunk] | None = None
+
+
+class ReplayCassette:
+    """
+    Recorded request/response pairs stored in a JSON Lines file.
+
+    Records are looked up by the request fingerprint. When the same request was recorded several times,
+    the recorded responses are replayed in their original order (and then again from the start).
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._records: dict[tuple[str, str], list[ReplayRecord]] = defaultdict(list)
+        self._cursors: dict[tuple[str, str], int] = defaultdict(int)
+        self._write_lock = asyncio.Lock()
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = ReplayRecord.model_validate_json(line)
+                        self._records[(record.kind, record.fingerprint)].append(record)
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self._records.values())
+
+    def find(self, kind: Literal["chat", "embedding"], fingerprint: str) -> ReplayRecord | None:
+        records = self._records.get((kind, fingerprint))
+        if not records:
+            return None
+
+        cursor = self._cursors[(kind, fingerprint)]
+        self._cursors[(kind, fingerprint)] = cursor + 1
+        return records[cursor % len(records)]
+
+    async def add(self, record: ReplayRecord) -> None:
+        self._records[(record.kind, record.fingerprint)].append(record)
+        # appends must not interleave, otherwise concurrent records could end up on the same line
+        async with self._write_lock:
+            await asyncio.to_thread(self._append, record.model_dump_json() + "\n")
+
+    def _append(self, line: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(line)
+
+
+class ReplayLatency(BaseModel):
+    """Distribution of the time (in seconds) until the first part of the response arrives."""
+
+    distribution: Literal["constant", "uniform", "normal", "lognormal"] = "constant"
+    mean: float = 0.0
+    stddev: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "uniform":
+            spread = self.stddev * math.sqrt(3)
+            return max(0.0, rng.uniform(self.mean - spread, self.mean + spread))
+        elif self.distribution == "normal":
+            return max(0.0, rng.gauss(self.mean, self.stddev))
+        elif self.distribution == "lognormal":
+            if self.mean <= 0:
+                return 0.0
+            sigma = math.sqrt(math.log(1 + (self.stddev / self.mean) ** 2))
+            return rng.lognormvariate(math.log(self.mean) - sigma**2 / 2, sigma)
+        return self.mean
+
+
+class ReplaySimulation(BaseModel):
+    """
+    Controls how recorded responses are served.
+
+    Without a `latency` or `tokens_per_second`, the recorded timing is reproduced (multiplied by `time_scale`,
+    use 0 to respond immediately). Errors are injected with the given probabilities; a simulated timeout
+    waits for `timeout` seconds before failing.
+    """
+
+    latency: ReplayLatency | None = None
+    tokens_per_second: float | None = None
+    time_scale: float = 1.0
+    rate_limit_probability: float = 0.0
+    timeout_probability: float = 0.0
+    timeout: float = 0.0
+    seed: int | None = None
+
+    _rng: random.Random = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        self._rng = random.Random(self.seed)
+
+    async def before_response(self, recorded_latency: float) -> None:
+        draw = self._rng.random()
+        if draw < self.rate_limit_probability:
+            raise BackendError(
+                "Rate limit exceeded (simulated).", is_fatal=False, is_retryable=True, context={"status_code": 429}
+            )
+        if draw < self.rate_limit_probability + self.timeout_probability:
+            await self._sleep(self.timeout)
+            raise BackendError(
+                "Request has timed out (simulated).", is_fatal=False, is_retryable=True, context={"status_code": 408}
+            )
+
+        await self._sleep(self.latency.sample(self._rng) if self.latency is not None else recorded_latency)
+
+    async def before_chunk(self, recorded_delay: float, text: str) -> None:
+        if self.tokens_per_second:
+            await self._sleep(max(1, len(text) // 4) / self.tokens_per_second)
+        else:
+            await self._sleep(recorded_delay)
+
+    async def _sleep(self, seconds: float) -> None:
+        if seconds > 0 and self.time_scale > 0:
+            await asyncio.sleep(seconds * self.time_scale)
+
+
+def create_fingerprint(value: Any) -> str:
+    """Returns a stable hash of the given JSON-like value (key order does not matter)."""
+    normalized = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
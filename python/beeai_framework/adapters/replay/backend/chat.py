@@ -0,0 +1,207 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import time
+from collections.abc import AsyncGenerator, Callable
+from pathlib import Path
+from typing import Any, Self
+
+from typing_extensions import Unpack
+
+from beeai_framework.adapters.replay.backend.cassette import (
+    ReplayCassette,
+    ReplayChunk,
+    ReplayRecord,
+    ReplaySimulation,
+    create_fingerprint,
+)
+from beeai_framework.backend.chat import ChatModel, ChatModelKwargs
+from beeai_framework.backend.constants import ProviderName
+from beeai_framework.backend.errors import BackendError
+from beeai_framework.backend.message import (
+    AnyMessage,
+    AssistantMessage,
+    CustomMessage,
+    MessageToolCallDeltaContent,
+    Role,
+    SystemMessage,
+    ToolMessage,
+    UserMessage,
+)
+from beeai_framework.backend.types import (
+    ChatModelInput,
+    ChatModelOutput,
+    ChatModelUsage,
+)
+from beeai_framework.context import RunContext
+from beeai_framework.tools.tool import Tool
+
+
+class ReplayChatModel(ChatModel):
+    """
+    Chat model which records the exchanges of the `target` model or replays them without touching any provider.
+
+    Requests are matched by a fingerprint of the messages, tools and generation parameters.
+    Streamed responses are recorded chunk by chunk, including the delays between them.
+    """
+
+    def __init__(
+        self,
+        cassette: ReplayCassette | str | Path,
+        *,
+        target: ChatModel | None = None,
+        simulation: ReplaySimulation | None = None,
+        **kwargs: Unpack[ChatModelKwargs],
+    ) -> None:
+        super().__init__(**kwargs)
+        self.cassette = cassette if isinstance(cassette, ReplayCassette) else ReplayCassette(cassette)
+        self.target = target
+        self.simulation = simulation or ReplaySimulation()
+
+    @property
+    def model_id(self) -> str:
+        return self.target.model_id if self.target is not None else "replay"
+
+    @property
+    def provider_id(self) -> ProviderName:
+        return "replay"
+
+    async def _create(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        fingerprint = _chat_fingerprint(input)
+        if self.target is not None:
+            started_at = time.monotonic()
+            output = await self.target._create(input, run)
+            await self.cassette.add(
+                ReplayRecord(
+                    kind="chat",
+                    fingerprint=fingerprint,
+                    latency=time.monotonic() - started_at,
+                    output=_dump_chat_output(output),
+                )
+            )
+            return output
+
+        record = self._find(fingerprint)
+        await self.simulation.before_response(record.latency)
+        if record.chunks is not None:
+            return ChatModelOutput.from_chunks([_load_chat_output(chunk.output) for chunk in record.chunks])
+        return _load_chat_output(record.output or {})
+
+    async def _create_stream(self, input: ChatModelInput, run: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        fingerprint = _chat_fingerprint(input)
+        if self.target is not None:
+            chunks: list[ReplayChunk] = []
+            started_at = last_at = time.monotonic()
+            async for chunk in self.target._create_stream(input, run):
+                now = time.monotonic()
+                chunks.append(ReplayChunk(delay=now - last_at, output=_dump_chat_output(chunk)))
+                last_at = now
+                yield chunk
+
+            await self.cassette.add(
+                ReplayRecord(
+                    kind="chat",
+                    fingerprint=fingerprint,
+                    latency=chunks[0].delay if chunks else last_at - started_at,
+                    chunks=chunks,
+                )
+            )
+            return
+
+        record = self._find(fingerprint)
+        await self.simulation.before_response(record.latency)
+        recorded_chunks = record.chunks
+        if recorded_chunks is None:
+            recorded_chunks = [ReplayChunk(delay=0, output=record.output or {})]
+        for index, recorded_chunk in enumerate(recorded_chunks):
+            chunk = _load_chat_output(recorded_chunk.output)
+            if index > 0:
+                await self.simulation.before_chunk(recorded_chunk.delay, chunk.get_text_content())
+            yield chunk
+
+    def _find(self, fingerprint: str) -> ReplayRecord:
+        record = self.cassette.find("chat", fingerprint)
+        if record is None:
+            raise BackendError(
+                f"No recorded response matches the request (fingerprint '{fingerprint}').",
+                is_retryable=False,
+                context={"cassette": str(self.cassette.path), "fingerprint": fingerprint},
+            )
+        return record
+
+    async def clone(self) -> Self:
+        cloned = type(self)(
+            self.cassette,
+            target=await self.target.clone() if self.target is not None else None,
+            simulation=self.simulation.model_copy(),
+            parameters=self.parameters.model_copy(),
+            settings=self._settings.copy(),
+        )
+        cloned.cache = await self.cache.clone()
+        cloned.tool_call_fallback_via_response_format = self.tool_call_fallback_via_response_format
+        cloned.model_supports_tool_calling = self.model_supports_tool_calling
+        cloned.use_strict_model_schema = self.use_strict_model_schema
+        cloned.use_strict_tool_schema = self.use_strict_tool_schema
+        cloned.tokenizer = self.tokenizer.clone()
+        return cloned
+
+
+def _chat_fingerprint(input: ChatModelInput) -> str:
+    response_format = input.response_format
+    return create_fingerprint(
+        {
+            "messages": [message.to_plain() for message in input.messages],
+            "tools": [
+                {"name": tool.name, "description": tool.description, "schema": tool.input_schema.model_json_schema()}
+                for tool in input.tools or []
+            ],
+            "tool_choice": input.tool_choice.name if isinstance(input.tool_choice, Tool) else input.tool_choice,
+            "response_format": response_format.model_json_schema()
+            if isinstance(response_format, type)
+            else response_format,
+            "parameters": input.model_dump(
+                exclude={"messages", "tools", "tool_choice", "response_format", "abort_signal", "stream"},
+                exclude_none=True,
+            ),
+        }
+    )
+
+
+def _dump_chat_output(output: ChatModelOutput) -> dict[str, Any]:
+    return {
+        "messages": [_dump_message(message) for message in output.messages],
+        "tool_call_deltas": [delta.model_dump() for delta in output.tool_call_deltas],
+        "usage": output.usage.model_dump() if output.usage else None,
+        "finish_reason": output.finish_reason,
+    }
+
+
+def _load_chat_output(data: dict[str, Any]) -> ChatModelOutput:
+    usage = data.get("usage")
+    return ChatModelOutput(
+        messages=[_load_message(message) for message in data.get("messages", [])],
+        tool_call_deltas=[MessageToolCallDeltaContent(**delta) for delta in data.get("tool_call_deltas", [])],
+        usage=ChatModelUsage(**usage) if usage else None,
+        finish_reason=data.get("finish_reason"),
+    )
+
+
+_message_classes: dict[str, Callable[[Any], AnyMessage]] = {
+    Role.ASSISTANT: AssistantMessage,
+    Role.SYSTEM: SystemMessage,
+    Role.TOOL: ToolMessage,
+    Role.USER: UserMessage,
+}
+
+
+def _dump_message(message: AnyMessage) -> dict[str, Any]:
+    return {
+        "role": message.role.value if isinstance(message.role, Role) else message.role,
+        "content": [content.model_dump() for content in message.content],
+    }
+
+
+def _load_message(data: dict[str, Any]) -> AnyMessage:
+    role: str = data["role"]
+    message_cls = _message_classes.get(role)
+    return message_cls(data["content"]) if message_cls is not None else CustomMessage(role, data["content"])
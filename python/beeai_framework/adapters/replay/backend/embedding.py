@@ -0,0 +1,88 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import time
+from pathlib import Path
+from typing import Self
+
+from typing_extensions import Unpack
+
+from beeai_framework.adapters.replay.backend.cassette import (
+    ReplayCassette,
+    ReplayRecord,
+    ReplaySimulation,
+    create_fingerprint,
+)
+from beeai_framework.backend.constants import ProviderName
+from beeai_framework.backend.embedding import EmbeddingModel, EmbeddingModelKwargs
+from beeai_framework.backend.errors import BackendError
+from beeai_framework.backend.types import EmbeddingModelInput, EmbeddingModelOutput, EmbeddingModelUsage
+from beeai_framework.context import RunContext
+
+
+class ReplayEmbeddingModel(EmbeddingModel):
+    """Embedding model which records the responses of the `target` model or replays them."""
+
+    def __init__(
+        self,
+        cassette: ReplayCassette | str | Path,
+        *,
+        target: EmbeddingModel | None = None,
+        simulation: ReplaySimulation | None = None,
+        **kwargs: Unpack[EmbeddingModelKwargs],
+    ) -> None:
+        super().__init__(**kwargs)
+        self.cassette = cassette if isinstance(cassette, ReplayCassette) else ReplayCassette(cassette)
+        self.target = target
+        self.simulation = simulation or ReplaySimulation()
+
+    @property
+    def model_id(self) -> str:
+        return self.target.model_id if self.target is not None else "replay"
+
+    @property
+    def provider_id(self) -> ProviderName:
+        return "replay"
+
+    async def _create(self, input: EmbeddingModelInput, run: RunContext) -> EmbeddingModelOutput:
+        fingerprint = create_fingerprint({"values": input.values})
+        if self.target is not None:
+            started_at = time.monotonic()
+            output = await self.target._create(input, run)
+            await self.cassette.add(
+                ReplayRecord(
+                    kind="embedding",
+                    fingerprint=fingerprint,
+                    latency=time.monotonic() - started_at,
+                    output={
+                        "embeddings": output.to_list(),
+                        "usage": output.usage.model_dump() if output.usage else None,
+                    },
+                )
+            )
+            return output
+
+        record = self.cassette.find("embedding", fingerprint)
+        if record is None:
+            raise BackendError(
+                f"No recorded embeddings match the request (fingerprint '{fingerprint}').",
+                is_retryable=False,
+                context={"cassette": str(self.cassette.path), "fingerprint": fingerprint},
+            )
+
+        await self.simulation.before_response(record.latency)
+        recorded = record.output or {}
+        usage = recorded.get("usage")
+        return EmbeddingModelOutput(
+            values=input.values,
+            embeddings=recorded.get("embeddings", []),
+            usage=EmbeddingModelUsage(**usage) if usage else None,
+        )
+
+    def clone(self) -> Self:
+        return type(self)(
+            self.cassette,
+            target=self.target.clone() if self.target is not None else None,
+            simulation=self.simulation.model_copy(),
+            settings=self._settings.copy(),
+        )
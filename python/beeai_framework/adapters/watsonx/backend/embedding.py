@@ -11,6 +11,9 @@ from beeai_framework.backend.embedding import EmbeddingModelKwargs
 
 
 class WatsonxEmbeddingModel(LiteLLMEmbeddingModel):
+    # maximal number of inputs in a single request
+    max_batch_size = 1000
+
     @property
     def provider_id(self) -> ProviderName:
         return "watsonx"
@@ -42,7 +42,7 @@ def beeai_message_to_watsonx_orchestrate_message(message: AnyMessage) -> list[wa
                             watsonx_orchestrate_api.ChatToolCall(
                                 id=t.id,
                                 function=watsonx_orchestrate_api.ChatToolFunctionDefinition(
-                                    name=t.tool_name, arguments=json.loads(t.args)
+                                    name=t.tool_name, arguments=t.parsed_args
                                 ),
                                 type=t.type,
                             )
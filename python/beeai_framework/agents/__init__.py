@@ -2,7 +2,30 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from beeai_framework.agents.base import AnyAgent, BaseAgent
+from beeai_framework.agents.context_window import (
+    ContextCompactionPolicy,
+    ContextWindowBudget,
+    ContextWindowGuard,
+    DropToolResultsPolicy,
+    KeepPinnedMessagesPolicy,
+    SummarizeHistoryPolicy,
+    TruncateToolResultsPolicy,
+)
 from beeai_framework.agents.errors import AgentError
 from beeai_framework.agents.types import AgentExecutionConfig, AgentMeta, BaseAgentRunOptions
 
-__all__ = ["AgentError", "AgentExecutionConfig", "AgentMeta", "AnyAgent", "BaseAgent", "BaseAgentRunOptions"]
+__all__ = [
+    "AgentError",
+    "AgentExecutionConfig",
+    "AgentMeta",
+    "AnyAgent",
+    "BaseAgent",
+    "BaseAgentRunOptions",
+    "ContextCompactionPolicy",
+    "ContextWindowBudget",
+    "ContextWindowGuard",
+    "DropToolResultsPolicy",
+    "KeepPinnedMessagesPolicy",
+    "SummarizeHistoryPolicy",
+    "TruncateToolResultsPolicy",
+]
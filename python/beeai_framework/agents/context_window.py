@@ -0,0 +1,301 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from beeai_framework.agents.errors import AgentError
+from beeai_framework.backend.chat import ChatModel
+from beeai_framework.backend.message import (
+    AnyMessage,
+    MessageTextContent,
+    MessageToolCallContent,
+    MessageToolResultContent,
+    SystemMessage,
+    ToolMessage,
+    UserMessage,
+)
+from beeai_framework.backend.tokenizer import Tokenizer
+from beeai_framework.backend.utils import get_tool_spec
+from beeai_framework.logger import Logger
+from beeai_framework.memory.base_memory import BaseMemory
+from beeai_framework.tools.tool import AnyTool
+from beeai_framework.utils.strings import to_json
+
+__all__ = [
+    "ContextCompactionPolicy",
+    "ContextWindowBudget",
+    "ContextWindowGuard",
+    "DropToolResultsPolicy",
+    "KeepPinnedMessagesPolicy",
+    "SummarizeHistoryPolicy",
+    "TruncateToolResultsPolicy",
+]
+
+logger = Logger(__name__)
+
+
+class ContextWindowBudget:
+    """Number of tokens the conversation may take in a single request, and the messages which must be kept."""
+
+    def __init__(self, *, max_tokens: int, tokenizer: Tokenizer, llm: ChatModel, pinned: Sequence[AnyMessage]) -> None:
+        self.max_tokens = max_tokens
+        self.tokenizer = tokenizer
+        self.llm = llm
+        self._pinned = {id(message) for message in pinned}
+
+    def count(self, messages: Sequence[AnyMessage]) -> int:
+        return self.tokenizer.count_tokens(messages)
+
+    def fits(self, messages: Sequence[AnyMessage]) -> bool:
+        return self.count(messages) <= self.max_tokens
+
+    def is_pinned(self, message: AnyMessage) -> bool:
+        return id(message) in self._pinned
+
+
+class ContextCompactionPolicy(ABC):
+    @abstractmethod
+    async def compact(self, messages: list[AnyMessage], budget: ContextWindowBudget) -> list[AnyMessage]:
+        """Returns a shorter conversation; the given messages must not be modified."""
+        pass
+
+
+class TruncateToolResultsPolicy(ContextCompactionPolicy):
+    """Truncates results longer than `max_tokens` tokens, starting with the oldest ones."""
+
+    def __init__(
+        self, *, max_tokens: int = 1024, marker: str = "\n[...the rest of the output has been truncated]"
+    ) -> None:
+        self.max_tokens = max_tokens
+        self.marker = marker
+
+    async def compact(self, messages: list[AnyMessage], budget: ContextWindowBudget) -> list[AnyMessage]:
+        tokenizer = budget.tokenizer
+        total = budget.count(messages)
+        compacted = list(messages)
+        for index, message in enumerate(messages):
+            if total <= budget.max_tokens:
+                break
+            if not isinstance(message, ToolMessage) or budget.is_pinned(message):
+                continue
+
+            content = [
+                result.model_copy(update={"result": tokenizer.truncate(text, self.max_tokens) + self.marker})
+                if tokenizer.count(text := _to_text(result.result)) > self.max_tokens
+                else result
+                for result in message.content
+            ]
+            if content != message.content:
+                compacted[index] = ToolMessage(content, message.meta.copy())
+                total += tokenizer.count_message(compacted[index]) - tokenizer.count_message(message)
+        return compacted
+
+
+class DropToolResultsPolicy(ContextCompactionPolicy):
+    """Replaces results of older tool calls with a placeholder, the last `keep_last` tool messages are left intact."""
+
+    def __init__(
+        self, *, keep_last: int = 1, placeholder: str = "[The output has been removed to save space.]"
+    ) -> None:
+        self.keep_last = keep_last
+        self.placeholder = placeholder
+
+    async def compact(self, messages: list[AnyMessage], budget: ContextWindowBudget) -> list[AnyMessage]:
+        tokenizer = budget.tokenizer
+        candidates = [index for index, message in enumerate(messages) if isinstance(message, ToolMessage)]
+        candidates = candidates[: max(len(candidates) - self.keep_last, 0)]
+
+        total = budget.count(messages)
+        compacted = list(messages)
+        for index in candidates:
+            if total <= budget.max_tokens:
+                break
+
+            message = messages[index]
+            if budget.is_pinned(message):
+                continue
+
+            compacted[index] = ToolMessage(
+                [result.model_copy(update={"result": self.placeholder}) for result in message.content],
+                message.meta.copy(),
+            )
+            total += tokenizer.count_message(compacted[index]) - tokenizer.count_message(message)
+        return compacted
+
+
+class SummarizeHistoryPolicy(ContextCompactionPolicy):
+    """
+    Replaces older turns with their summary, the last `keep_last` messages are left intact.
+
+    The summary is generated by the given model (the agent's model by default) and kept in a user message
+    (system messages in the middle of a conversation are rejected by some providers), which gets merged
+    into the next summary.
+    """
+
+    def __init__(self, *, llm: ChatModel | None = None, keep_last: int = 4) -> None:
+        self.llm = llm
+        self.keep_last = keep_last
+
+    async def compact(self, messages: list[AnyMessage], budget: ContextWindowBudget) -> list[AnyMessage]:
+        tail_start = _align_to_turn(messages, max(len(messages) - self.keep_last, 0))
+        summarized = [index for index, message in enumerate(messages[:tail_start]) if not budget.is_pinned(message)]
+        if not summarized:
+            return messages
+
+        transcript = "\n".join(f"{messages[index].role}: {_to_transcript(messages[index])}" for index in summarized)
+        llm = self.llm or budget.llm
+        response = await llm.create(
+            messages=[
+                UserMessage(
+                    "Summarize the following conversation. Be concise but include all key information, "
+                    "especially facts that were found out and results of the tool calls.\n\n"
+                    f"Conversation:\n{budget.tokenizer.truncate(transcript, budget.max_tokens)}\n\nSummary:"
+                )
+            ]
+        )
+        summary = UserMessage(
+            f"Summary of the earlier conversation:\n{response.get_text_content()}", {"contextSummary": True}
+        )
+
+        indexes = set(summarized)
+        return [
+            summary if index == summarized[0] else message
+            for index, message in enumerate(messages)
+            if index not in indexes or index == summarized[0]
+        ]
+
+
+class KeepPinnedMessagesPolicy(ContextCompactionPolicy):
+    """
+    Removes the oldest turns (a message and results of its tool calls) until only the pinned messages
+    and the last `keep_last` turns are left.
+    """
+
+    def __init__(self, *, keep_last: int = 1) -> None:
+        self.keep_last = keep_last
+
+    async def compact(self, messages: list[AnyMessage], budget: ContextWindowBudget) -> list[AnyMessage]:
+        tokenizer = budget.tokenizer
+        total = budget.count(messages)
+        removed: set[int] = set()
+        turns = _to_turns(messages)
+        for start, end in turns[: max(len(turns) - self.keep_last, 0)]:
+            if total <= budget.max_tokens:
+                break
+            if budget.is_pinned(messages[start]):
+                continue
+
+            removed.update(range(start, end))
+            total -= sum(tokenizer.count_message(message) for message in messages[start:end])
+        return [message for index, message in enumerate(messages) if index not in removed]
+
+
+class ContextWindowGuard:
+    """
+    Checks that the conversation fits into the model's context window before it gets sent.
+
+    The available budget is `context_size` (the model's context window by default) minus `output_reserve`
+    tokens for the response, the tool definitions and the agent's own prompts. When the conversation does not fit,
+    policies are applied in order until it does. System messages, the first and the last user message are pinned.
+    """
+
+    def __init__(
+        self,
+        *,
+        context_size: int | None = None,
+        output_reserve: int = 1024,
+        policies: Sequence[ContextCompactionPolicy] | None = None,
+    ) -> None:
+        self.context_size = context_size
+        self.output_reserve = output_reserve
+        self.policies = (
+            list(policies)
+            if policies is not None
+            else [TruncateToolResultsPolicy(), DropToolResultsPolicy(), KeepPinnedMessagesPolicy()]
+        )
+
+    async def apply(
+        self,
+        memory: BaseMemory,
+        *,
+        llm: ChatModel,
+        tools: Sequence[AnyTool] = (),
+        extra_messages: Sequence[AnyMessage] = (),
+    ) -> bool:
+        """Compacts messages in the memory if needed, returns whether the memory has been changed."""
+        context_size = self.context_size or llm.context_window
+        if context_size is None:
+            return False
+
+        tokenizer = llm.tokenizer
+        reserved = (
+            self.output_reserve
+            + sum(tokenizer.count_message(message) for message in extra_messages)
+            + sum(tokenizer.count_batch([to_json(get_tool_spec(tool, strict=False)) for tool in tools]))
+        )
+        messages = memory.messages
+        budget = ContextWindowBudget(
+            max_tokens=context_size - reserved, tokenizer=tokenizer, llm=llm, pinned=_find_pinned(messages)
+        )
+        if budget.fits(messages):
+            return False
+
+        compacted = list(messages)
+        for policy in self.policies:
+            compacted = await policy.compact(compacted, budget)
+            if budget.fits(compacted):
+                break
+        else:
+            raise AgentError(
+                f"The conversation does not fit into the context window of {context_size} tokens.",
+                context={"tokens": budget.count(compacted), "max_tokens": budget.max_tokens},
+            )
+
+        logger.debug(f"Conversation has been compacted from {len(messages)} to {len(compacted)} messages.")
+        memory.reset()
+        await memory.add_many(compacted)
+        return True
+
+
+def _find_pinned(messages: Sequence[AnyMessage]) -> list[AnyMessage]:
+    pinned: list[AnyMessage] = [message for message in messages if isinstance(message, SystemMessage)]
+    user_messages = [
+        message for message in messages if isinstance(message, UserMessage) and not message.meta.get("contextSummary")
+    ]
+    if user_messages:
+        pinned.extend((user_messages[0], user_messages[-1]))
+    return pinned
+
+
+def _to_turns(messages: Sequence[AnyMessage]) -> list[tuple[int, int]]:
+    """Groups every message with the results of its tool calls, so they are never separated."""
+    turns: list[tuple[int, int]] = []
+    for index, message in enumerate(messages):
+        if turns and isinstance(message, ToolMessage):
+            turns[-1] = (turns[-1][0], index + 1)
+        else:
+            turns.append((index, index + 1))
+    return turns
+
+
+def _align_to_turn(messages: Sequence[AnyMessage], index: int) -> int:
+    while 0 < index < len(messages) and isinstance(messages[index], ToolMessage):
+        index -= 1
+    return index
+
+
+def _to_text(value: object) -> str:
+    return value if isinstance(value, str) else to_json(value, sort_keys=False)
+
+
+def _to_transcript(message: AnyMessage) -> str:
+    parts: list[str] = []
+    for content in message.content:
+        if isinstance(content, MessageTextContent):
+            parts.append(content.text)
+        elif isinstance(content, MessageToolCallContent):
+            parts.append(f"(calls {content.tool_name} with {content.args})")
+        elif isinstance(content, MessageToolResultContent):
+            parts.append(_to_text(content.result))
+    return " ".join(parts)
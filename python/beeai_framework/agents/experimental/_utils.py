@@ -2,30 +2,43 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from beeai_framework.agents.experimental.prompts import (
+    RequirementAgentStepPromptInput,
     RequirementAgentSystemPromptInput,
     RequirementAgentToolTemplateDefinition,
 )
 from beeai_framework.agents.experimental.types import RequirementAgentRequest
-from beeai_framework.backend import SystemMessage
+from beeai_framework.backend import SystemMessage, UserMessage
 from beeai_framework.template import PromptTemplate
 from beeai_framework.utils.strings import to_json
 
 
 def _create_system_message(
-    *, template: PromptTemplate[RequirementAgentSystemPromptInput], request: RequirementAgentRequest
+    *,
+    template: PromptTemplate[RequirementAgentSystemPromptInput],
+    request: RequirementAgentRequest,
+    previous: SystemMessage | None = None,
 ) -> SystemMessage:
-    return SystemMessage(
-        template.render(
-            tools=[
-                RequirementAgentToolTemplateDefinition.from_tool(tool, allowed=tool in request.allowed_tools)
-                for tool in request.tools
-            ],
-            final_answer_name=request.final_answer.name,
-            final_answer_schema=to_json(
-                request.final_answer.input_schema.model_json_schema(mode="validation"), indent=2, sort_keys=False
-            )
-            if request.final_answer.custom_schema
-            else None,
-            final_answer_instructions=request.final_answer.instructions,
+    text = template.render(
+        # which tools are allowed changes between steps, it is only stated by the step message
+        tools=[RequirementAgentToolTemplateDefinition.from_tool(tool) for tool in request.tools],
+        final_answer_name=request.final_answer.name,
+        final_answer_schema=to_json(
+            request.final_answer.input_schema.model_json_schema(mode="validation"), indent=2, sort_keys=False
         )
+        if request.final_answer.custom_schema
+        else None,
+        final_answer_instructions=request.final_answer.instructions,
     )
+    # reusing the same message keeps the prompt prefix (and its converted payload) intact between steps
+    if previous is not None and previous.text == text:
+        return previous
+    return SystemMessage(text).mark_cache_breakpoint()
+
+
+def _create_step_message(
+    *, template: PromptTemplate[RequirementAgentStepPromptInput], request: RequirementAgentRequest
+) -> UserMessage | None:
+    text = template.render(
+        disallowed_tools=[tool.name for tool in request.tools if tool not in request.allowed_tools],
+    )
+    return UserMessage(text) if text.strip() else None
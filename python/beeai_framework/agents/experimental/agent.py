@@ -9,7 +9,8 @@ from typing_extensions import TypeVar
 
 from beeai_framework.agents import AgentError, AgentExecutionConfig, AgentMeta
 from beeai_framework.agents.base import BaseAgent
-from beeai_framework.agents.experimental._utils import _create_system_message
+from beeai_framework.agents.context_window import ContextWindowGuard
+from beeai_framework.agents.experimental._utils import _create_step_message, _create_system_message
 from beeai_framework.agents.experimental.events import (
     RequirementAgentStartEvent,
     RequirementAgentSuccessEvent,
@@ -29,12 +30,14 @@ from beeai_framework.agents.experimental.types import (
 )
 from beeai_framework.agents.experimental.utils._llm import RequirementsReasoner
 from beeai_framework.agents.experimental.utils._tool import FinalAnswerTool, FinalAnswerToolSchema, _run_tools
+from beeai_framework.agents.speculation import SpeculativeToolExecutor
 from beeai_framework.agents.tool_calling.utils import ToolCallChecker, ToolCallCheckerConfig
 from beeai_framework.backend.chat import ChatModel
 from beeai_framework.backend.message import (
     AssistantMessage,
     MessageToolCallContent,
     MessageToolResultContent,
+    SystemMessage,
     ToolMessage,
     UserMessage,
 )
@@ -70,12 +73,14 @@ class RequirementAgent(BaseAgent[RequirementAgentRunOutput]):
         instructions: str | list[str] | None = None,
         notes: str | list[str] | None = None,
         tool_call_checker: ToolCallCheckerConfig | bool = True,
+        context_guard: ContextWindowGuard | bool = False,
         final_answer_as_tool: bool = True,
         save_intermediate_steps: bool = True,
         templates: dict[RequirementAgentTemplatesKeys, PromptTemplate[Any] | RequirementAgentTemplateFactory]
         | RequirementAgentTemplates
         | None = None,
         middlewares: Sequence[RunMiddlewareType] | None = None,
+        speculative_tool_execution: bool = False,
     ) -> None:
         super().__init__()
         self._llm = llm
@@ -83,7 +88,9 @@ class RequirementAgent(BaseAgent[RequirementAgentRunOutput]):
         self._templates = self._generate_templates(templates)
         self._save_intermediate_steps = save_intermediate_steps
         self._tool_call_checker = tool_call_checker
+        self._context_guard = context_guard
         self._final_answer_as_tool = final_answer_as_tool
+        self._speculative_tool_execution = speculative_tool_execution
         if role or instructions or notes:
             self._templates.system.update(
                 defaults=exclude_none(
@@ -131,6 +138,8 @@ class RequirementAgent(BaseAgent[RequirementAgentRunOutput]):
 
             return state, user_message
 
+        speculation = SpeculativeToolExecutor()
+
         async def handler(run_context: RunContext) -> RequirementAgentRunOutput[TOutput]:
             state, user_message = await init_state()
 
@@ -142,9 +151,11 @@ class RequirementAgent(BaseAgent[RequirementAgentRunOutput]):
             await reasoner.update(self._requirements)
 
             tool_call_cycle_checker = self._create_tool_call_checker()
+            context_guard = self._create_context_guard()
             tool_call_retry_counter = RetryCounter(error_type=AgentError, max_retries=run_config.total_max_retries or 1)
             force_final_answer_as_tool = self._final_answer_as_tool
             tmp_rules: list[Rule] = []
+            system_message: SystemMessage | None = None
 
             while state.answer is None:
                 state.iteration += 1
@@ -162,18 +173,32 @@ class RequirementAgent(BaseAgent[RequirementAgentRunOutput]):
                     RequirementAgentStartEvent(state=state, request=request),
                 )
 
+                await speculation.reset(
+                    request.allowed_tools if self._speculative_tool_execution else [],
+                    context=lambda: {"state": state.model_dump()},
+                )
+                # static instructions come first and dynamic per-step state last, to keep the prefix cacheable
+                system_message = _create_system_message(
+                    template=self._templates.system, request=request, previous=system_message
+                )
+                step_message = _create_step_message(template=self._templates.step, request=request)
+                if context_guard is not None:
+                    await context_guard.apply(
+                        state.memory,
+                        llm=self._llm,
+                        tools=request.allowed_tools,
+                        extra_messages=[system_message, *([step_message] if step_message is not None else [])],
+                    )
                 response = await self._llm.create(
                     messages=[
-                        _create_system_message(
-                            template=self._templates.system,
-                            request=request,
-                        ),
+                        system_message,
                         *state.memory.messages,
+                        *([step_message] if step_message is not None else []),
                     ],
                     tools=request.allowed_tools,
                     tool_choice=request.tool_choice,
-                    stream=False,
-                )
+                    stream=self._speculative_tool_execution,
+                ).on("new_token", speculation.on_new_token)
                 await state.memory.add_many(response.messages)
 
                 text_messages = response.get_text_messages()
@@ -216,6 +241,7 @@ class RequirementAgent(BaseAgent[RequirementAgentRunOutput]):
                         tools=request.allowed_tools,
                         messages=tool_call_messages,
                         context={"state": state.model_dump()},
+                        speculation=speculation,
                     ):
                         state.steps.append(
                             RequirementAgentRunStateStep(
@@ -267,8 +293,14 @@ class RequirementAgent(BaseAgent[RequirementAgentRunOutput]):
                 answer=state.answer, memory=state.memory, state=state, answer_structured=state.result
             )
 
+        async def run_handler(run_context: RunContext) -> RequirementAgentRunOutput[TOutput]:
+            try:
+                return await handler(run_context)
+            finally:
+                await speculation.close()
+
         return self._to_run(
-            handler,
+            run_handler,
             signal=None,
             run_params={
                 "prompt": prompt,
@@ -322,10 +354,12 @@ class RequirementAgent(BaseAgent[RequirementAgentRunOutput]):
             requirements=self._requirements.copy(),
             templates=self._templates.model_dump(),
             tool_call_checker=self._tool_call_checker,
+            context_guard=self._context_guard,
             save_intermediate_steps=self._save_intermediate_steps,
             final_answer_as_tool=self._final_answer_as_tool,
             name=self._meta.name,
             description=self._meta.description,
+            speculative_tool_execution=self._speculative_tool_execution,
         )
         cloned.emitter = await self.emitter.clone()
         return cloned
@@ -341,6 +375,11 @@ class RequirementAgent(BaseAgent[RequirementAgentRunOutput]):
             tools=list(self._tools),
         )
 
+    def _create_context_guard(self) -> ContextWindowGuard | None:
+        if isinstance(self._context_guard, ContextWindowGuard):
+            return self._context_guard
+        return ContextWindowGuard() if self._context_guard else None
+
     def _create_tool_call_checker(self) -> ToolCallChecker:
         config = ToolCallCheckerConfig()
         update_model(config, sources=[self._tool_call_checker])
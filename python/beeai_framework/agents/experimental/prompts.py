@@ -71,7 +71,6 @@ Never use the tool twice with the same input if not stated otherwise.
 {{#tools}}
 Name: {{name}}
 Description: {{description}}
-Allowed: {{allowed}}
 
 {{/tools}}
 {{/tools.0}}
@@ -94,6 +93,20 @@ Allowed: {{allowed}}
 )
 
 
+class RequirementAgentStepPromptInput(BaseModel):
+    disallowed_tools: list[str]
+
+
+# rendered as a trailing user message, after the cached conversation prefix
+RequirementAgentStepPrompt = PromptTemplate(
+    PromptTemplateInput(
+        schema=RequirementAgentStepPromptInput,
+        functions={"formatTools": lambda data: ", ".join(f"'{name}'" for name in data["disallowed_tools"])},
+        template="""{{#disallowed_tools.0}}The following tools cannot be used in the current step: {{formatTools}}.{{/disallowed_tools.0}}""",  # noqa: E501
+    )
+)
+
+
 class RequirementAgentTaskPromptInput(BaseModel):
     prompt: str
     context: str | None = None
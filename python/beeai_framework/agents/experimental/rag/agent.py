@@ -1,11 +1,14 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+from typing import Any
+
 from pydantic import BaseModel, InstanceOf
 
-from beeai_framework.adapters.beeai.backend.document_processor import LLMDocumentReranker
 from beeai_framework.agents import AgentExecutionConfig, AgentMeta, BaseAgent
 from beeai_framework.backend import AnyMessage, AssistantMessage, ChatModel, SystemMessage, UserMessage
+from beeai_framework.backend.document_processor import DocumentProcessor
+from beeai_framework.backend.metadata_filter import MetadataFilter
 from beeai_framework.backend.types import DocumentWithScore
 from beeai_framework.backend.vector_store import VectorStore
 from beeai_framework.context import Run, RunContext
@@ -18,6 +21,7 @@ from beeai_framework.utils.cancellation import AbortSignal
 
 class RagAgentRunInput(BaseModel):
     message: InstanceOf[AnyMessage]
+    filter: InstanceOf[MetadataFilter] | dict[str, Any] | None = None
 
 
 class RAGAgentRunOutput(BaseModel):
@@ -31,7 +35,7 @@ class RAGAgent(BaseAgent[RAGAgentRunOutput]):
         llm: ChatModel,
         memory: BaseMemory,
         vector_store: VectorStore,
-        reranker: LLMDocumentReranker | None = None,
+        reranker: DocumentProcessor | None = None,
         number_of_retrieved_documents: int = 7,
         documents_threshold: float = 0.0,
     ) -> None:
@@ -60,7 +64,9 @@ class RAGAgent(BaseAgent[RAGAgentRunOutput]):
             query = prompt.message.text
 
             try:
-                retrieved_docs = await self.vector_store.search(query, k=self.number_of_retrieved_documents)
+                retrieved_docs = await self.vector_store.search(
+                    query, k=self.number_of_retrieved_documents, filter=prompt.filter
+                )
 
                 # Apply re-ranking
                 if self.reranker:
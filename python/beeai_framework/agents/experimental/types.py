@@ -8,6 +8,8 @@ from pydantic import BaseModel, ConfigDict, Field, InstanceOf
 from typing_extensions import TypeVar
 
 from beeai_framework.agents.experimental.prompts import (
+    RequirementAgentStepPrompt,
+    RequirementAgentStepPromptInput,
     RequirementAgentSystemPrompt,
     RequirementAgentSystemPromptInput,
     RequirementAgentTaskPrompt,
@@ -42,6 +44,9 @@ class RequirementAgentTemplates(BaseModel):
     tool_no_result: InstanceOf[PromptTemplate[RequirementAgentToolNoResultTemplateInput]] = Field(
         default_factory=lambda: RequirementAgentToolNoResultPrompt.fork(None),
     )
+    step: InstanceOf[PromptTemplate[RequirementAgentStepPromptInput]] = Field(
+        default_factory=lambda: RequirementAgentStepPrompt.fork(None),
+    )
 
 
 RequirementAgentTemplateFactory = Callable[[InstanceOf[PromptTemplate[Any]]], InstanceOf[PromptTemplate[Any]]]
@@ -2,12 +2,14 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
-import json
+import copy
 from asyncio import create_task
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field, InstanceOf
 
+from beeai_framework.agents.speculation import SpeculativeToolExecutor
 from beeai_framework.backend import AssistantMessage, MessageToolCallContent
 from beeai_framework.context import RunContext
 from beeai_framework.emitter import Emitter
@@ -22,11 +24,13 @@ async def _run_tool(
     tools: list[AnyTool],
     msg: MessageToolCallContent,
     context: dict[str, Any],
+    speculation: SpeculativeToolExecutor | None = None,
 ) -> "ToolInvocationResult":
     result = ToolInvocationResult(
         msg=msg,
         tool=None,
-        input=json.loads(msg.args),
+        # parsed args are shared by the message, the tool and the result get their own copy
+        input=copy.deepcopy(msg.parsed_args),
         output=StringToolOutput(""),
         error=None,
     )
@@ -36,7 +40,12 @@ async def _run_tool(
         if not result.tool:
             raise ToolError(f"Tool '{msg.tool_name}' does not exist!")
 
-        result.output = await result.tool.run(result.input).context({**context, "tool_call_msg": msg})
+        speculative_run = speculation.pop(msg) if speculation is not None else None
+        result.output = (
+            await speculative_run
+            if speculative_run is not None
+            else await result.tool.run(result.input).context({**context, "tool_call_msg": msg})
+        )
     except ToolError as e:
         error = FrameworkError.ensure(e)
         result.error = error
@@ -45,10 +54,13 @@ async def _run_tool(
 
 
 async def _run_tools(
-    tools: list[AnyTool], messages: list[MessageToolCallContent], context: dict[str, Any]
+    tools: list[AnyTool],
+    messages: list[MessageToolCallContent],
+    context: dict[str, Any],
+    speculation: SpeculativeToolExecutor | None = None,
 ) -> list["ToolInvocationResult"]:
     return await asyncio.gather(
-        *(create_task(_run_tool(tools, msg=msg, context=context)) for msg in messages),
+        *(create_task(_run_tool(tools, msg=msg, context=context, speculation=speculation)) for msg in messages),
         return_exceptions=False,
     )
 
@@ -71,7 +83,7 @@ class FinalAnswerTool(Tool[BaseModel, ToolRunOptions, StringToolOutput]):
     def _create_emitter(self) -> Emitter:
         return Emitter.root().child(namespace=["tool", "final_answer"], creator=self)
 
-    @property
+    @cached_property
     def input_schema(self) -> type[BaseModel]:
         expected_output = self._expected_output
 
@@ -0,0 +1,157 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import contextlib
+import contextvars
+import copy
+import json
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from pydantic import ValidationError
+
+from beeai_framework.backend import (
+    ChatModelNewTokenEvent,
+    ChatModelOutput,
+    MessageToolCallContent,
+    MessageToolCallDeltaContent,
+)
+from beeai_framework.emitter import EventMeta
+from beeai_framework.logger import Logger
+from beeai_framework.tools import AnyTool, ToolOutput, ToolRunOptions
+from beeai_framework.utils.cancellation import AbortController
+
+__all__ = ["SpeculativeToolExecutor"]
+
+logger = Logger(__name__)
+
+_RunKey = tuple[str, str, str]
+
+
+class _ToolCallDraft:
+    def __init__(self, id: str | None, tool_name: str | None) -> None:
+        self.id = id
+        self.tool_name = tool_name or ""
+        self.args: list[str] = []
+        self.started = False
+
+
+class SpeculativeToolExecutor:
+    """
+    Runs side-effect-free tools while the model is still streaming its response.
+
+    Streamed tool call fragments are assembled as they arrive. Once the arguments of a call form a JSON object
+    which satisfies the tool's input schema, the tool starts in the background. The agent then takes over the run
+    for every final tool call via `pop`, which only matches a run with the same call id, tool name and arguments.
+    Runs that are not claimed are aborted by the next `reset` or by `close`.
+    Only tools with `side_effect_free` set are ever executed speculatively.
+    """
+
+    def __init__(self) -> None:
+        self._tools: dict[str, AnyTool] = {}
+        self._context: Callable[[], dict[str, Any]] | None = None
+        self._drafts: dict[int | str, _ToolCallDraft] = {}
+        self._last_key: int | str | None = None
+        self._runs: dict[_RunKey, asyncio.Task[ToolOutput]] = {}
+        self._controller = AbortController()
+        self._run_context: contextvars.Context | None = None
+
+    async def reset(self, tools: Sequence[AnyTool], *, context: Callable[[], dict[str, Any]] | None = None) -> None:
+        """
+        Prepares the executor for the next model response.
+
+        The `context` factory is evaluated when a speculative run starts, so the run sees the same state
+        as a tool executed after the response.
+        """
+        await self.close()
+        self._tools = {tool.name: tool for tool in tools if tool.side_effect_free}
+        self._context = context
+        self._drafts.clear()
+        self._last_key = None
+        self._controller = AbortController()
+        # runs are started from the model's event handlers, but they must belong to the caller's run
+        self._run_context = contextvars.copy_context()
+
+    def add(self, chunk: ChatModelOutput) -> None:
+        if not self._tools:
+            return
+
+        for message in chunk.messages:
+            for content in message.content:
+                if isinstance(content, MessageToolCallContent):
+                    self._start(content)
+        for delta in chunk.tool_call_deltas:
+            self._add_delta(delta)
+
+    async def on_new_token(self, data: ChatModelNewTokenEvent, _: EventMeta) -> None:
+        self.add(data.value)
+
+    def pop(self, tool_call: MessageToolCallContent) -> "asyncio.Task[ToolOutput] | None":
+        """Returns the speculative run that matches the given (final) tool call, if there is one."""
+        key = self._to_key(tool_call)
+        return self._runs.pop(key, None) if key is not None else None
+
+    async def close(self) -> None:
+        """Aborts every speculative run that has not been claimed."""
+        runs = list(self._runs.values())
+        self._runs.clear()
+        if runs:
+            # cancelling the awaiting task would leave the tool's own run task behind, the signal stops both
+            self._controller.abort("Speculative tool run does not match the final response.")
+            logger.debug(f"Aborted {len(runs)} speculative tool run(s) which did not match the final response.")
+            await asyncio.gather(*runs, return_exceptions=True)
+
+    def _add_delta(self, delta: MessageToolCallDeltaContent) -> None:
+        key = delta.index if delta.index is not None else delta.id if delta.id is not None else self._last_key
+        if key is None:
+            return
+
+        draft = self._drafts.get(key)
+        # some providers reuse the same index for multiple complete tool calls
+        if draft is None or (delta.id and draft.id and delta.id != draft.id):
+            draft = self._drafts[key] = _ToolCallDraft(delta.id, delta.tool_name)
+        draft.id = draft.id or delta.id
+        draft.tool_name = draft.tool_name or delta.tool_name or ""
+        self._last_key = key
+
+        if delta.args:
+            draft.args.append(delta.args)
+            text = "".join(draft.args).strip()
+            # without an id, the run could not be matched to the final tool call
+            if not draft.started and draft.id and text.endswith("}"):
+                with contextlib.suppress(ValidationError):
+                    msg = MessageToolCallContent(id=draft.id, tool_name=draft.tool_name, args=text)
+                    draft.started = self._start(msg)
+
+    def _start(self, msg: MessageToolCallContent) -> bool:
+        tool = self._tools.get(msg.tool_name)
+        if tool is None:
+            return False
+
+        input = msg.parsed_args
+        try:
+            tool.input_schema.model_validate(input)
+        except ValidationError:
+            return False
+
+        key = self._to_key(msg)
+        if key is None or key in self._runs:
+            return key is not None
+
+        self._runs[key] = asyncio.create_task(self._execute(tool, copy.deepcopy(input), msg), context=self._run_context)
+        return True
+
+    async def _execute(self, tool: AnyTool, input: dict[str, Any], msg: MessageToolCallContent) -> ToolOutput:
+        context = self._context() if self._context is not None else {}
+        output: ToolOutput = await tool.run(input, ToolRunOptions(signal=self._controller.signal)).context(
+            {**context, "tool_call_msg": msg}
+        )
+        return output
+
+    @staticmethod
+    def _to_key(msg: MessageToolCallContent) -> _RunKey | None:
+        input = msg.parsed_args
+        if not msg.id or not isinstance(input, dict):
+            return None
+        return msg.id, msg.tool_name, json.dumps(input, sort_keys=True, ensure_ascii=False)
@@ -1,7 +1,7 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
-import json
+import copy
 from collections.abc import Sequence
 from typing import Any
 
@@ -9,6 +9,8 @@ from pydantic import BaseModel, Field, create_model
 
 from beeai_framework.agents import AgentError, AgentExecutionConfig
 from beeai_framework.agents.base import BaseAgent
+from beeai_framework.agents.context_window import ContextWindowGuard
+from beeai_framework.agents.speculation import SpeculativeToolExecutor
 from beeai_framework.agents.tool_calling.events import (
     ToolCallingAgentStartEvent,
     ToolCallingAgentSuccessEvent,
@@ -64,7 +66,9 @@ class ToolCallingAgent(BaseAgent[ToolCallingAgentRunOutput]):
         save_intermediate_steps: bool = True,
         meta: AgentMeta | None = None,
         tool_call_checker: ToolCallCheckerConfig | bool = True,
+        context_guard: ContextWindowGuard | bool = False,
         final_answer_as_tool: bool = True,
+        speculative_tool_execution: bool = False,
     ) -> None:
         super().__init__()
         self._llm = llm
@@ -74,7 +78,9 @@ class ToolCallingAgent(BaseAgent[ToolCallingAgentRunOutput]):
         self._save_intermediate_steps = save_intermediate_steps
         self._meta = meta
         self._tool_call_checker = tool_call_checker
+        self._context_guard = context_guard
         self._final_answer_as_tool = final_answer_as_tool
+        self._speculative_tool_execution = speculative_tool_execution
 
     def run(
         self,
@@ -91,9 +97,12 @@ class ToolCallingAgent(BaseAgent[ToolCallingAgentRunOutput]):
             max_iterations=10,
         )
 
+        speculation = SpeculativeToolExecutor()
+
         async def handler(run_context: RunContext) -> ToolCallingAgentRunOutput:
             state = ToolCallingAgentRunState(memory=UnconstrainedMemory(), result=None, iteration=0)
-            await state.memory.add(SystemMessage(self._templates.system.render()))
+            # the system prompt and the tools stay the same for the whole run, providers can cache them
+            await state.memory.add(SystemMessage(self._templates.system.render()).mark_cache_breakpoint())
             await state.memory.add_many(self.memory.messages)
 
             user_message: UserMessage | None = None
@@ -142,6 +151,7 @@ class ToolCallingAgent(BaseAgent[ToolCallingAgentRunOutput]):
 
             tools = [*self._tools, final_answer_tool]
             tool_call_checker = self._create_tool_call_checker()
+            context_guard = self._create_context_guard()
             final_answer_as_tool = self._final_answer_as_tool
 
             while state.result is None:
@@ -154,12 +164,17 @@ class ToolCallingAgent(BaseAgent[ToolCallingAgentRunOutput]):
                     "start",
                     ToolCallingAgentStartEvent(state=state),
                 )
+                await speculation.reset(
+                    tools if self._speculative_tool_execution else [], context=lambda: {"state": state.model_dump()}
+                )
+                if context_guard is not None:
+                    await context_guard.apply(state.memory, llm=self._llm, tools=tools)
                 response = await self._llm.create(
                     messages=state.memory.messages,
                     tools=tools,
                     tool_choice=("required" if len(tools) > 1 else tools[0]) if final_answer_as_tool else "auto",
-                    stream=False,
-                )
+                    stream=self._speculative_tool_execution,
+                ).on("new_token", speculation.on_new_token)
 
                 text_messages = response.get_text_messages()
                 tool_call_messages = response.get_tool_calls()
@@ -210,9 +225,13 @@ class ToolCallingAgent(BaseAgent[ToolCallingAgentRunOutput]):
                             tool_call_checker.reset(tool_call)
                             break
 
-                        tool_input = json.loads(tool_call.args)
-                        tool_response = await tool.run(tool_input).context(
-                            {"state": state.model_dump(), "tool_call_msg": tool_call}
+                        speculative_run = speculation.pop(tool_call)
+                        tool_response = (
+                            await speculative_run
+                            if speculative_run is not None
+                            else await tool.run(copy.deepcopy(tool_call.parsed_args)).context(
+                                {"state": state.model_dump(), "tool_call_msg": tool_call}
+                            )
                         )
                         await state.memory.add(
                             ToolMessage(
@@ -258,7 +277,13 @@ class ToolCallingAgent(BaseAgent[ToolCallingAgentRunOutput]):
                 await self.memory.add_many(state.memory.messages[-2:])
             return ToolCallingAgentRunOutput(result=state.result, memory=state.memory)
 
-        return self._to_run(handler, signal=signal, run_params={"prompt": prompt, "execution": execution})
+        async def run_handler(run_context: RunContext) -> ToolCallingAgentRunOutput:
+            try:
+                return await handler(run_context)
+            finally:
+                await speculation.close()
+
+        return self._to_run(run_handler, signal=signal, run_params={"prompt": prompt, "execution": execution})
 
     def _create_emitter(self) -> Emitter:
         return Emitter.root().child(
@@ -303,13 +328,20 @@ class ToolCallingAgent(BaseAgent[ToolCallingAgentRunOutput]):
             tools=[await tool.clone() for tool in self._tools],
             templates=self._templates.model_dump(),
             tool_call_checker=self._tool_call_checker,
+            context_guard=self._context_guard,
             save_intermediate_steps=self._save_intermediate_steps,
             meta=self._meta,
             final_answer_as_tool=self._final_answer_as_tool,
+            speculative_tool_execution=self._speculative_tool_execution,
         )
         cloned.emitter = await self.emitter.clone()
         return cloned
 
+    def _create_context_guard(self) -> ContextWindowGuard | None:
+        if isinstance(self._context_guard, ContextWindowGuard):
+            return self._context_guard
+        return ContextWindowGuard() if self._context_guard else None
+
     def _create_tool_call_checker(self) -> ToolCallChecker:
         config = ToolCallCheckerConfig()
         update_model(config, sources=[self._tool_call_checker])
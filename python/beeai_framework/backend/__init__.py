@@ -2,12 +2,29 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from beeai_framework.backend.backend import Backend
+from beeai_framework.backend.batch import ChatModelBatch, ChatModelBatchSubmitter, LocalChatModelBatchSubmitter
+from beeai_framework.backend.cascade import (
+    CascadeAcceptor,
+    CascadeAcceptorInput,
+    CascadeChatModel,
+    CascadeChatModelAcceptEvent,
+    CascadeChatModelEscalateEvent,
+    SelfConsistencyAcceptor,
+    ValidToolCallsAcceptor,
+)
 from beeai_framework.backend.chat import ChatModel
 from beeai_framework.backend.embedding import EmbeddingModel
-from beeai_framework.backend.errors import BackendError, ChatModelError, EmbeddingModelError, MessageError
+from beeai_framework.backend.errors import (
+    BackendError,
+    ChatModelError,
+    ChatModelStructureError,
+    EmbeddingModelError,
+    MessageError,
+)
 from beeai_framework.backend.events import (
     ChatModelErrorEvent,
     ChatModelNewTokenEvent,
+    ChatModelPartialStructureEvent,
     ChatModelStartEvent,
     ChatModelSuccessEvent,
     EmbeddingModelErrorEvent,
@@ -21,9 +38,11 @@ from beeai_framework.backend.message import (
     CustomMessage,
     CustomMessageContent,
     Message,
+    MessageCacheControl,
     MessageImageContent,
     MessageTextContent,
     MessageToolCallContent,
+    MessageToolCallDeltaContent,
     MessageToolResultContent,
     Role,
     SystemMessage,
@@ -31,6 +50,7 @@ from beeai_framework.backend.message import (
     UserMessage,
     UserMessageContent,
 )
+from beeai_framework.backend.tokenizer import CalibratedTokenizer, HuggingFaceTokenizer, TiktokenTokenizer, Tokenizer
 from beeai_framework.backend.types import (
     ChatModelOutput,
     ChatModelParameters,
@@ -44,13 +64,23 @@ __all__ = [
     "AssistantMessageContent",
     "Backend",
     "BackendError",
+    "CalibratedTokenizer",
+    "CascadeAcceptor",
+    "CascadeAcceptorInput",
+    "CascadeChatModel",
+    "CascadeChatModelAcceptEvent",
+    "CascadeChatModelEscalateEvent",
     "ChatModel",
+    "ChatModelBatch",
+    "ChatModelBatchSubmitter",
     "ChatModelError",
     "ChatModelErrorEvent",
     "ChatModelNewTokenEvent",
     "ChatModelOutput",
     "ChatModelParameters",
+    "ChatModelPartialStructureEvent",
     "ChatModelStartEvent",
+    "ChatModelStructureError",
     "ChatModelStructureOutput",
     "ChatModelSuccessEvent",
     "CustomMessage",
@@ -62,16 +92,24 @@ __all__ = [
     "EmbeddingModelOutput",
     "EmbeddingModelStartEvent",
     "EmbeddingModelSuccessEvent",
+    "HuggingFaceTokenizer",
+    "LocalChatModelBatchSubmitter",
     "Message",
+    "MessageCacheControl",
     "MessageError",
     "MessageImageContent",
     "MessageTextContent",
     "MessageToolCallContent",
+    "MessageToolCallDeltaContent",
     "MessageToolResultContent",
     "Role",
+    "SelfConsistencyAcceptor",
     "SystemMessage",
+    "TiktokenTokenizer",
+    "Tokenizer",
     "ToolMessage",
     "UserMessage",
     "UserMessage",
     "UserMessageContent",
+    "ValidToolCallsAcceptor",
 ]
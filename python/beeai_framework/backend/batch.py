@@ -0,0 +1,454 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import contextvars
+import tempfile
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, NamedTuple, Self
+
+from pydantic import BaseModel
+
+from beeai_framework.backend.errors import ChatModelError
+from beeai_framework.backend.message import (
+    AnyMessage,
+    AssistantMessage,
+    AssistantMessageContent,
+    MessageImageContent,
+    MessageTextContent,
+    MessageToolCallContent,
+    MessageToolResultContent,
+    SystemMessage,
+    ToolMessage,
+    UserMessage,
+    UserMessageContent,
+)
+from beeai_framework.backend.types import ChatModelOutput, ChatModelParameters, ChatModelToolChoice
+from beeai_framework.context import RunContext
+from beeai_framework.emitter import Emitter
+from beeai_framework.logger import Logger
+from beeai_framework.tools.errors import ToolError
+from beeai_framework.tools.tool import AnyTool, Tool
+from beeai_framework.tools.types import StringToolOutput, ToolRunOptions
+from beeai_framework.utils.models import JSONSchemaModel
+from beeai_framework.utils.strings import to_safe_word
+
+if TYPE_CHECKING:
+    from beeai_framework.backend.chat import ChatModel
+
+__all__ = [
+    "ChatModelBatch",
+    "ChatModelBatchError",
+    "ChatModelBatchRequest",
+    "ChatModelBatchResponse",
+    "ChatModelBatchResult",
+    "ChatModelBatchSubmitter",
+    "LocalChatModelBatchSubmitter",
+]
+
+logger = Logger(__name__)
+
+_storage: ContextVar["ChatModelBatch | None"] = ContextVar("chat_model_batch", default=None)
+
+
+class ChatModelBatchRequest(BaseModel):
+    """A single line of the batch input file (OpenAI-compatible)."""
+
+    custom_id: str
+    method: str = "POST"
+    url: str = "/v1/chat/completions"
+    body: dict[str, Any]
+
+
+class ChatModelBatchResponse(BaseModel):
+    status_code: int
+    body: dict[str, Any]
+
+
+class ChatModelBatchError(BaseModel):
+    code: str | None = None
+    message: str
+
+
+class ChatModelBatchResult(BaseModel):
+    """A single line of the batch output file (OpenAI-compatible)."""
+
+    custom_id: str
+    response: ChatModelBatchResponse | None = None
+    error: ChatModelBatchError | None = None
+
+
+class ChatModelBatchSubmitter(ABC):
+    """Submits batch input files to a batch API and collects the results."""
+
+    @abstractmethod
+    async def submit(self, path: Path) -> str:
+        """Submits the JSONL file with requests and returns the batch id."""
+        pass
+
+    @abstractmethod
+    async def poll(self, batch_id: str) -> Path | None:
+        """Returns the JSONL file with results once the batch has completed, otherwise None."""
+        pass
+
+
+class _PendingRequest(NamedTuple):
+    model: "ChatModel"
+    request: ChatModelBatchRequest
+    future: asyncio.Future[ChatModelOutput]
+
+
+class ChatModelBatch:
+    """
+    Collects `ChatModel.create` calls into batch files and resolves them once the batch has been processed.
+
+    Within the scope (`async with ChatModelBatch(submitter):`), non-streaming calls of models that support batching
+    are not sent to the provider. Instead, requests for the same model are collected for `window` seconds
+    (or until `max_size` requests are collected), written to a JSONL file, submitted and polled every `poll_interval`
+    seconds. Awaiting callers get their responses once the batch has completed. Other calls are executed directly.
+    Leaving the scope submits the remaining requests and waits for every batch to finish.
+    """
+
+    def __init__(
+        self,
+        submitter: ChatModelBatchSubmitter,
+        *,
+        directory: str | Path | None = None,
+        window: float = 1.0,
+        max_size: int = 50_000,
+        poll_interval: float = 30.0,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("'max_size' must be a positive number")
+
+        self.submitter = submitter
+        self.directory = Path(directory) if directory else Path(tempfile.mkdtemp(prefix="beeai-batch-"))
+        self.window = window
+        self.max_size = max_size
+        self.poll_interval = poll_interval
+        self._pending: dict[str, list[_PendingRequest]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._token: contextvars.Token[ChatModelBatch | None] | None = None
+        self._context: contextvars.Context | None = None
+
+    @staticmethod
+    def current() -> "ChatModelBatch | None":
+        return _storage.get()
+
+    async def __aenter__(self) -> Self:
+        # batches are processed outside of the runs which have enqueued the requests
+        self._context = contextvars.copy_context()
+        self._context.run(_storage.set, None)
+        self._token = _storage.set(self)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._token is not None:
+            _storage.reset(self._token)
+            self._token = None
+
+        if exc_val is not None:
+            for timer in self._timers.values():
+                timer.cancel()
+            for task in self._tasks:
+                task.cancel()
+            for requests in self._pending.values():
+                for pending in requests:
+                    pending.future.cancel()
+            self._timers.clear()
+            self._pending.clear()
+
+        for key in list(self._pending.keys()):
+            self._flush(key)
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def add(self, model: "ChatModel", body: dict[str, Any]) -> ChatModelOutput:
+        """Adds the request to the batch and waits until its response is available."""
+        loop = asyncio.get_running_loop()
+        key = f"{model.provider_id}:{model.model_id}"
+        requests = self._pending.setdefault(key, [])
+        pending = _PendingRequest(
+            model=model,
+            request=ChatModelBatchRequest(custom_id=f"request-{uuid.uuid4().hex}", body=body),
+            future=loop.create_future(),
+        )
+        requests.append(pending)
+
+        if len(requests) >= self.max_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+
+        return await pending.future
+
+    def _flush(self, key: str) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        requests = [pending for pending in self._pending.pop(key, []) if not pending.future.done()]
+        if not requests:
+            return
+
+        # calls made while processing the batch (e.g. by a local submitter) must not end up in the batch again
+        context = self._context.copy() if self._context is not None else contextvars.Context()
+        task = asyncio.create_task(self._process(requests), context=context)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _process(self, requests: list[_PendingRequest]) -> None:
+        try:
+            path = self.directory / f"{uuid.uuid4().hex}.jsonl"
+            await asyncio.to_thread(_write_lines, path, [pending.request.model_dump_json() for pending in requests])
+
+            batch_id = await self.submitter.submit(path)
+            logger.debug(f"Batch '{batch_id}' with {len(requests)} request(s) has been submitted.")
+            results_path = await self.submitter.poll(batch_id)
+            while results_path is None:
+                await asyncio.sleep(self.poll_interval)
+                results_path = await self.submitter.poll(batch_id)
+            logger.debug(f"Batch '{batch_id}' has been completed.")
+
+            by_id = {pending.request.custom_id: pending for pending in requests}
+            for line in await asyncio.to_thread(_read_lines, results_path):
+                result = ChatModelBatchResult.model_validate_json(line)
+                if (entry := by_id.pop(result.custom_id, None)) is not None:
+                    self._resolve(entry, result)
+
+            for entry in by_id.values():
+                if not entry.future.done():
+                    entry.future.set_exception(
+                        ChatModelError(f"Batch '{batch_id}' has no result for '{entry.request.custom_id}'.")
+                    )
+        except Exception as e:
+            for pending in requests:
+                if not pending.future.done():
+                    pending.future.set_exception(ChatModelError.ensure(e, model=pending.model))
+        except asyncio.CancelledError:
+            for pending in requests:
+                pending.future.cancel()
+            raise
+
+    @staticmethod
+    def _resolve(pending: _PendingRequest, result: ChatModelBatchResult) -> None:
+        if pending.future.done():
+            return
+
+        try:
+            if result.error is not None or result.response is None:
+                message = result.error.message if result.error else "The response is missing."
+                raise ChatModelError(f"Batch request '{result.custom_id}' has failed. {message}")
+            if result.response.status_code >= 400:
+                raise ChatModelError(
+                    f"Batch request '{result.custom_id}' has failed with status code {result.response.status_code}.",
+                    context={"body": result.response.body},
+                )
+            pending.future.set_result(pending.model._load_batch_response(result.response.body))
+        except Exception as e:
+            pending.future.set_exception(ChatModelError.ensure(e, model=pending.model))
+
+
+class _BatchTool(Tool[BaseModel, ToolRunOptions, StringToolOutput]):
+    """A tool restored from its specification, it is only used to describe the tool to the model."""
+
+    def __init__(self, spec: dict[str, Any]) -> None:
+        super().__init__()
+        self._spec = spec
+
+    @property
+    def name(self) -> str:
+        return str(self._spec["name"])
+
+    @property
+    def description(self) -> str:
+        return str(self._spec.get("description") or "")
+
+    @property
+    def input_schema(self) -> type[BaseModel]:
+        return JSONSchemaModel.create(self.name, self._spec.get("parameters") or {"type": "object", "properties": {}})
+
+    def _create_emitter(self) -> Emitter:
+        return Emitter.root().child(namespace=["tool", "batch", to_safe_word(self.name)], creator=self)
+
+    async def _run(self, input: BaseModel, options: ToolRunOptions | None, context: RunContext) -> StringToolOutput:
+        raise ToolError(f"Tool '{self.name}' has been restored from a batch request and cannot be executed.")
+
+
+class LocalChatModelBatchSubmitter(ChatModelBatchSubmitter):
+    """
+    Processes batch files locally through the given model (a stand-in for a provider's batch API).
+
+    Requests in the OpenAI chat completions format are converted back to messages and tools,
+    at most `concurrency` of them are processed at the same time.
+    """
+
+    def __init__(self, model: "ChatModel", *, concurrency: int = 8) -> None:
+        self.model = model
+        self.concurrency = concurrency
+        self._batches: dict[str, tuple[asyncio.Task[None], Path]] = {}
+
+    async def submit(self, path: Path) -> str:
+        batch_id = f"batch_{uuid.uuid4().hex}"
+        results_path = path.with_suffix(".results.jsonl")
+        self._batches[batch_id] = (asyncio.create_task(self._process(path, results_path)), results_path)
+        return batch_id
+
+    async def poll(self, batch_id: str) -> Path | None:
+        task, results_path = self._batches[batch_id]
+        if not task.done():
+            return None
+
+        del self._batches[batch_id]
+        task.result()  # re-raises when the processing has failed
+        return results_path
+
+    async def _process(self, path: Path, results_path: Path) -> None:
+        requests = [
+            ChatModelBatchRequest.model_validate_json(line) for line in await asyncio.to_thread(_read_lines, path)
+        ]
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def process(request: ChatModelBatchRequest) -> ChatModelBatchResult:
+            async with semaphore:
+                try:
+                    output = await self._create(request.body)
+                    return ChatModelBatchResult(
+                        custom_id=request.custom_id,
+                        response=ChatModelBatchResponse(
+                            status_code=200, body=_to_chat_completion(output, model_id=self.model.model_id)
+                        ),
+                    )
+                except Exception as e:
+                    return ChatModelBatchResult(
+                        custom_id=request.custom_id, error=ChatModelBatchError(code=type(e).__name__, message=str(e))
+                    )
+
+        results = await asyncio.gather(*(process(request) for request in requests))
+        await asyncio.to_thread(_write_lines, results_path, [result.model_dump_json() for result in results])
+
+    async def _create(self, body: dict[str, Any]) -> ChatModelOutput:
+        tools: list[AnyTool] = [_BatchTool(tool["function"]) for tool in body.get("tools") or []]
+        tool_choice: ChatModelToolChoice | None = body.get("tool_choice")
+        if isinstance(tool_choice, dict):
+            name = tool_choice["function"]["name"]
+            tool_choice = next((tool for tool in tools if tool.name == name), None)
+
+        return await self.model.create(
+            messages=[_from_openai_message(message) for message in body["messages"]],
+            tools=tools or None,
+            tool_choice=tool_choice,
+            response_format=body.get("response_format"),
+            stop_sequences=body.get("stop"),
+            **{
+                name: body[name]
+                for name in ChatModelParameters.model_fields
+                if name in body and name not in {"stream", "stop_sequences"}
+            },
+        )
+
+
+def _write_lines(path: Path, lines: list[str]) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        for line in lines:
+            f.write(line + "\n")
+
+
+def _read_lines(path: Path) -> list[str]:
+    with path.open(encoding="utf-8") as f:
+        return [line for line in f if line.strip()]
+
+
+def _to_text(content: str | list[dict[str, Any]] | None) -> str:
+    if content is None or isinstance(content, str):
+        return content or ""
+    return "".join(part.get("text", "") for part in content)
+
+
+def _from_openai_message(message: dict[str, Any]) -> AnyMessage:
+    role, content = message["role"], message.get("content")
+    if role == "system":
+        return SystemMessage(_to_text(content))
+    elif role == "tool":
+        return ToolMessage(
+            MessageToolResultContent(
+                result=_to_text(content), tool_name=message.get("name") or "", tool_call_id=message["tool_call_id"]
+            )
+        )
+    elif role == "assistant":
+        assistant_content: list[AssistantMessageContent] = []
+        if text := _to_text(content):
+            assistant_content.append(MessageTextContent(text=text))
+        assistant_content.extend(
+            MessageToolCallContent(
+                id=call["id"], tool_name=call["function"]["name"], args=call["function"]["arguments"]
+            )
+            for call in message.get("tool_calls") or []
+        )
+        return AssistantMessage(assistant_content)
+    else:
+        user_content: list[UserMessageContent] = (
+            [MessageTextContent(text=content)]
+            if isinstance(content, str)
+            else [
+                MessageImageContent(image_url=part["image_url"])
+                if part.get("type") == "image_url"
+                else MessageTextContent(text=part.get("text", ""))
+                for part in content or []
+            ]
+        )
+        return UserMessage(user_content)
+
+
+def _to_chat_completion(output: ChatModelOutput, *, model_id: str) -> dict[str, Any]:
+    tool_calls = output.get_tool_calls()
+    text = output.get_text_content()
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model_id,
+        "choices": [
+            {
+                "index": 0,
+                "message": {
+                    "role": "assistant",
+                    "content": text or None,
+                    **(
+                        {
+                            "tool_calls": [
+                                {
+                                    "id": call.id,
+                                    "type": "function",
+                                    "function": {"name": call.tool_name, "arguments": call.args},
+                                }
+                                for call in tool_calls
+                            ]
+                        }
+                        if tool_calls
+                        else {}
+                    ),
+                },
+                "finish_reason": output.finish_reason or ("tool_calls" if tool_calls else "stop"),
+            }
+        ],
+        "usage": {
+            "prompt_tokens": output.usage.prompt_tokens,
+            "completion_tokens": output.usage.completion_tokens,
+            "total_tokens": output.usage.total_tokens,
+            "prompt_tokens_details": {"cached_tokens": output.usage.cached_prompt_tokens},
+        }
+        if output.usage
+        else None,
+    }
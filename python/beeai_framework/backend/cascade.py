@@ -0,0 +1,317 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
+from typing import Any, Self
+
+from pydantic import BaseModel, InstanceOf, ValidationError
+from typing_extensions import Unpack
+
+from beeai_framework.backend.chat import ChatModel, ChatModelKwargs
+from beeai_framework.backend.constants import ProviderName
+from beeai_framework.backend.errors import ChatModelError, ChatModelStructureError
+from beeai_framework.backend.events import ChatModelNewTokenEvent, chat_model_event_types
+from beeai_framework.backend.types import (
+    ChatModelInput,
+    ChatModelOutput,
+    ChatModelStructureInput,
+    ChatModelStructureOutput,
+)
+from beeai_framework.context import Run, RunContext
+from beeai_framework.emitter import Emitter, EventMeta
+from beeai_framework.errors import FrameworkError
+from beeai_framework.logger import Logger
+from beeai_framework.tools.tool import Tool
+from beeai_framework.utils.asynchronous import ensure_async
+from beeai_framework.utils.models import JSONSchemaModel
+
+__all__ = [
+    "CascadeAcceptor",
+    "CascadeAcceptorInput",
+    "CascadeChatModel",
+    "CascadeChatModelAcceptEvent",
+    "CascadeChatModelEscalateEvent",
+    "SelfConsistencyAcceptor",
+    "ValidToolCallsAcceptor",
+]
+
+logger = Logger(__name__)
+
+
+class CascadeAcceptorInput(BaseModel):
+    tier: int
+    model: InstanceOf[ChatModel]
+    input: InstanceOf[ChatModelInput]
+    output: InstanceOf[ChatModelOutput]
+    run: InstanceOf[RunContext]
+
+
+CascadeAcceptor = Callable[[CascadeAcceptorInput], bool | Awaitable[bool]]
+
+
+class CascadeChatModelAcceptEvent(BaseModel):
+    tier: int
+    model: InstanceOf[ChatModel]
+    output: InstanceOf[ChatModelOutput] | InstanceOf[ChatModelStructureOutput]
+
+
+class CascadeChatModelEscalateEvent(BaseModel):
+    tier: int
+    model: InstanceOf[ChatModel]
+    output: InstanceOf[ChatModelOutput] | InstanceOf[ChatModelStructureOutput] | None = None
+    error: InstanceOf[FrameworkError] | None = None
+
+
+cascade_chat_model_event_types: dict[str, type] = {
+    **chat_model_event_types,
+    "accept": CascadeChatModelAcceptEvent,
+    "escalate": CascadeChatModelEscalateEvent,
+}
+
+
+class ValidToolCallsAcceptor:
+    """Rejects responses which call unknown tools, pass invalid arguments or omit a required tool call."""
+
+    def __call__(self, data: CascadeAcceptorInput) -> bool:
+        tool_calls = data.output.get_tool_calls()
+        tool_choice = data.input.tool_choice
+        if not tool_calls:
+            return not data.input.tools or not (tool_choice == "required" or isinstance(tool_choice, Tool))
+
+        tools = {tool.name: tool for tool in data.input.tools or []}
+        for tool_call in tool_calls:
+            tool = tools.get(tool_call.tool_name)
+            if tool is None:
+                return False
+
+            try:
+                tool.input_schema.model_validate(tool_call.parsed_args)
+            except (ValueError, ValidationError):
+                return False
+
+        return True
+
+
+class SelfConsistencyAcceptor:
+    """
+    Samples the same tier `samples` more times and accepts the response when at least `threshold` of all responses
+    agree with it. Only meaningful with a non-zero temperature.
+    """
+
+    def __init__(
+        self,
+        *,
+        samples: int = 2,
+        threshold: float = 1.0,
+        normalize: Callable[[ChatModelOutput], str] | None = None,
+    ) -> None:
+        if samples < 1:
+            raise ValueError("'samples' must be a positive number")
+
+        self.samples = samples
+        self.threshold = threshold
+        self.normalize = normalize or self._normalize
+
+    async def __call__(self, data: CascadeAcceptorInput) -> bool:
+        outputs = await asyncio.gather(*(_create(data.model, data.input) for _ in range(self.samples)))
+        expected = self.normalize(data.output)
+        agreeing = 1 + sum(1 for output in outputs if self.normalize(output) == expected)
+        return agreeing / (self.samples + 1) >= self.threshold
+
+    @staticmethod
+    def _normalize(output: ChatModelOutput) -> str:
+        tool_calls = output.get_tool_calls()
+        if tool_calls:
+            return json.dumps(sorted([call.tool_name, call.parsed_args] for call in tool_calls), sort_keys=True)
+        return " ".join(output.get_text_content().lower().split())
+
+
+class CascadeChatModel(ChatModel):
+    """
+    Chat model which tries the given models in order, from the cheapest to the most capable one.
+
+    A response is returned as soon as every acceptor accepts it, otherwise the request escalates to the next model.
+    Errors (e.g. an unparsable or invalid structure in `create_structure`) escalate as well,
+    and the last model's response is always returned. The answering tier is reported via the `accept` event,
+    every rejected one via the `escalate` event. Streaming responses of all but the last model are buffered until
+    they get accepted. Models can also be given by their names, e.g. `"ollama:granite3.3,openai:gpt-4o"`.
+    """
+
+    def __init__(
+        self,
+        models: Sequence[ChatModel] | str,
+        *,
+        acceptors: Sequence[CascadeAcceptor] | None = None,
+        escalate_on_error: bool = True,
+        **kwargs: Unpack[ChatModelKwargs],
+    ) -> None:
+        if isinstance(models, str):
+            models = [ChatModel.from_name(name.strip()) for name in models.split(",") if name.strip()]
+        if not models:
+            raise ValueError("At least one model must be provided.")
+
+        kwargs.setdefault("model_supports_tool_calling", all(model.model_supports_tool_calling for model in models))
+        kwargs.setdefault("tool_choice_support", set.intersection(*(model._tool_choice_support for model in models)))
+        super().__init__(**kwargs)
+        self.models = list(models)
+        self.acceptors = list(acceptors) if acceptors is not None else [ValidToolCallsAcceptor()]
+        self.escalate_on_error = escalate_on_error
+
+    @property
+    def model_id(self) -> str:
+        return ",".join(model.model_id for model in self.models)
+
+    @property
+    def provider_id(self) -> ProviderName:
+        return "cascade"
+
+    def _create_emitter(self) -> Emitter:
+        return Emitter.root().child(
+            namespace=["backend", self.provider_id, "chat"],
+            creator=self,
+            events=cascade_chat_model_event_types,
+        )
+
+    async def _create(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        last_tier = len(self.models) - 1
+        for tier, model in enumerate(self.models[:last_tier]):
+            try:
+                output = await _create(model, input)
+            except Exception as e:
+                await self._escalate_on_error(tier, e, run)
+                continue
+
+            if await self._accept(tier, input, output, run):
+                return output
+
+        output = await _create(self.models[last_tier], input)
+        await self._accept(last_tier, input, output, run)
+        return output
+
+    async def _create_stream(self, input: ChatModelInput, run: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        last_tier = len(self.models) - 1
+        for tier, model in enumerate(self.models[:last_tier]):
+            try:
+                chunks = [chunk async for chunk in _create_stream(model, input)]
+            except Exception as e:
+                await self._escalate_on_error(tier, e, run)
+                continue
+
+            if await self._accept(tier, input, ChatModelOutput.from_chunks(chunks), run):
+                for chunk in chunks:
+                    yield chunk
+                return
+
+        chunks = []
+        async for chunk in _create_stream(self.models[last_tier], input):
+            chunks.append(chunk)
+            yield chunk
+        await self._accept(last_tier, input, ChatModelOutput.from_chunks(chunks), run)
+
+    async def _create_structure(self, input: ChatModelStructureInput[Any], run: RunContext) -> ChatModelStructureOutput:
+        schema = (
+            input.input_schema
+            if isinstance(input.input_schema, type)
+            else JSONSchemaModel.create("CascadeStructure", input.input_schema)
+        )
+
+        last_tier = len(self.models) - 1
+        for tier, model in enumerate(self.models[:last_tier]):
+            try:
+                output = await _create_structure(model, input, schema)
+            except Exception as e:
+                await self._escalate_on_error(tier, e, run)
+                continue
+
+            await run.emitter.emit("accept", CascadeChatModelAcceptEvent(tier=tier, model=model, output=output))
+            return output
+
+        model = self.models[last_tier]
+        output = await _create_structure(model, input, schema)
+        await run.emitter.emit("accept", CascadeChatModelAcceptEvent(tier=last_tier, model=model, output=output))
+        return output
+
+    async def _accept(self, tier: int, input: ChatModelInput, output: ChatModelOutput, run: RunContext) -> bool:
+        model = self.models[tier]
+        if tier < len(self.models) - 1:
+            data = CascadeAcceptorInput(tier=tier, model=model, input=input, output=output, run=run)
+            for acceptor in self.acceptors:
+                if not await ensure_async(acceptor)(data):
+                    logger.debug(f"Response of '{model.model_id}' has been rejected, escalating.")
+                    await run.emitter.emit(
+                        "escalate", CascadeChatModelEscalateEvent(tier=tier, model=model, output=output)
+                    )
+                    return False
+
+        await run.emitter.emit("accept", CascadeChatModelAcceptEvent(tier=tier, model=model, output=output))
+        return True
+
+    async def _escalate_on_error(self, tier: int, error: Exception, run: RunContext) -> None:
+        model = self.models[tier]
+        if not self.escalate_on_error or run.signal.aborted:
+            raise error
+
+        logger.debug(f"Model '{model.model_id}' has failed, escalating. {error}")
+        await run.emitter.emit(
+            "escalate",
+            CascadeChatModelEscalateEvent(tier=tier, model=model, error=ChatModelError.ensure(error, model=model)),
+        )
+
+    async def clone(self) -> Self:
+        cloned = type(self)(
+            [await model.clone() for model in self.models],
+            acceptors=self.acceptors,
+            escalate_on_error=self.escalate_on_error,
+            parameters=self.parameters.model_copy(),
+            settings=self._settings.copy(),
+        )
+        cloned.cache = await self.cache.clone()
+        cloned.tool_call_fallback_via_response_format = self.tool_call_fallback_via_response_format
+        cloned.model_supports_tool_calling = self.model_supports_tool_calling
+        cloned.use_strict_model_schema = self.use_strict_model_schema
+        cloned.use_strict_tool_schema = self.use_strict_tool_schema
+        return cloned
+
+
+def _create(model: ChatModel, input: ChatModelInput) -> Run[ChatModelOutput]:
+    # going through the public API keeps the model's own middlewares, cache and events in place
+    return model.create(**dict(input))
+
+
+async def _create_stream(model: ChatModel, input: ChatModelInput) -> AsyncGenerator[ChatModelOutput]:
+    queue: asyncio.Queue[ChatModelOutput | None] = asyncio.Queue()
+
+    async def on_new_token(data: ChatModelNewTokenEvent, _: EventMeta) -> None:
+        await queue.put(data.value)
+
+    task = asyncio.ensure_future(
+        _create(model, input.model_copy(update={"stream": True})).on("new_token", on_new_token)
+    )
+    task.add_done_callback(lambda _: queue.put_nowait(None))
+    try:
+        while (chunk := await queue.get()) is not None:
+            yield chunk
+        await task
+    finally:
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+async def _create_structure(
+    model: ChatModel, input: ChatModelStructureInput[Any], schema: type[BaseModel]
+) -> ChatModelStructureOutput:
+    output = await model.create_structure(
+        schema=input.input_schema,
+        messages=input.messages,
+        abort_signal=input.abort_signal,
+        max_retries=input.max_retries,
+        stream=input.stream,
+    )
+    try:
+        schema.model_validate(output.object)
+    except ValidationError as e:
+        raise ChatModelStructureError(f"The response does not match the schema.\n{e}", cause=e) from e
+    return output
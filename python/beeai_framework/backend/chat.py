@@ -4,37 +4,44 @@
 import json
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator, Callable, Sequence
+from contextlib import aclosing
 from functools import cached_property
 from typing import Any, ClassVar, Literal, Self
 
 from pydantic import BaseModel, ConfigDict, Field, InstanceOf, TypeAdapter
 from typing_extensions import TypedDict, TypeVar, Unpack
 
+from beeai_framework.backend.batch import ChatModelBatch
 from beeai_framework.backend.constants import ProviderName
 from beeai_framework.backend.errors import ChatModelError
 from beeai_framework.backend.events import (
     ChatModelErrorEvent,
     ChatModelNewTokenEvent,
+    ChatModelPartialStructureEvent,
     ChatModelStartEvent,
     ChatModelSuccessEvent,
     chat_model_event_types,
 )
 from beeai_framework.backend.message import AnyMessage, MessageToolCallContent, SystemMessage
+from beeai_framework.backend.tokenizer import CalibratedTokenizer, Tokenizer
 from beeai_framework.backend.types import (
     ChatModelCache,
     ChatModelInput,
     ChatModelOutput,
+    ChatModelOutputAccumulator,
     ChatModelParameters,
     ChatModelStructureInput,
     ChatModelStructureOutput,
     ChatModelToolChoice,
 )
 from beeai_framework.backend.utils import (
+    StructureStreamParser,
     filter_tools_by_tool_choice,
     generate_tool_union_schema,
     load_model,
     parse_broken_json,
     parse_model,
+    validate_structure,
 )
 from beeai_framework.cache.null_cache import NullCache
 from beeai_framework.context import Run, RunContext, RunMiddlewareType
@@ -66,6 +73,7 @@ class ChatModelKwargs(TypedDict, total=False):
     settings: dict[str, Any]
     middlewares: Sequence[RunMiddlewareType]
     tool_choice_support: set[ToolChoiceType]
+    tokenizer: InstanceOf[Tokenizer]
 
     __pydantic_config__ = ConfigDict(extra="forbid", arbitrary_types_allowed=True)  # type: ignore
 
@@ -107,6 +115,9 @@ class ChatModel(ABC):
         self.use_strict_tool_schema = kwargs.get("use_strict_tool_schema", True)
         self.use_strict_model_schema = kwargs.get("use_strict_model_schema", False)
 
+        if "tokenizer" in kwargs:
+            self.tokenizer = kwargs["tokenizer"]
+
         custom_tool_choice_support = kwargs.get("tool_choice_support")
         self._tool_choice_support: set[ToolChoiceType] = (
             custom_tool_choice_support
@@ -125,6 +136,18 @@ class ChatModel(ABC):
             events=chat_model_event_types,
         )
 
+    @cached_property
+    def tokenizer(self) -> Tokenizer:
+        return self._create_tokenizer()
+
+    def _create_tokenizer(self) -> Tokenizer:
+        return CalibratedTokenizer()
+
+    @property
+    def context_window(self) -> int | None:
+        """Maximum number of input tokens the model accepts, `None` when unknown."""
+        return None
+
     @abstractmethod
     async def _create(
         self,
@@ -141,7 +164,6 @@ class ChatModel(ABC):
     ) -> AsyncGenerator[ChatModelOutput]:
         raise NotImplementedError
 
-    @abstractmethod
     async def _create_structure(
         self,
         input: ChatModelStructureInput[T],
@@ -172,7 +194,7 @@ IMPORTANT: You MUST answer with a JSON object that matches the JSON schema above
 
         input_messages = input.messages
         messages: list[AnyMessage] = [
-            SystemMessage(system_template.render({"schema": to_json(json_schema, indent=4, sort_keys=False)})),
+            SystemMessage(system_template.render(schema=to_json(json_schema, indent=4, sort_keys=False))),
             *input_messages,
         ]
 
@@ -181,20 +203,39 @@ IMPORTANT: You MUST answer with a JSON object that matches the JSON schema above
             expected: str
             received: str
 
-        async def executor(_: RetryableContext) -> ChatModelStructureOutput:
-            response = await self._create(
-                ChatModelInput(
-                    messages=messages, response_format={"type": "object-json"}, abort_signal=input.abort_signal
-                ),
-                run,
-            )
+        return await self._generate_structure_with_retries(
+            ChatModelInput(messages=messages, response_format={"type": "object-json"}, abort_signal=input.abort_signal),
+            input,
+            run,
+        )
 
-            logger.debug(f"Recieved structured response:\n{response}")
+    def _create_batch_request(self, input: ChatModelInput) -> dict[str, Any] | None:
+        """
+        Returns the body of an OpenAI-compatible chat completion request for batch APIs.
+
+        Models that do not support batching return None, their requests are sent directly.
+        """
+        return None
 
-            text_response = response.get_text_content()
-            result = parse_broken_json(text_response)
-            # TODO: validate result matches expected schema
-            return ChatModelStructureOutput(object=result)
+    def _load_batch_response(self, body: dict[str, Any]) -> ChatModelOutput:
+        """Converts the body of an OpenAI-compatible chat completion response from batch APIs."""
+        raise ChatModelError(f"{type(self).__name__} does not support batching.")
+
+    async def _create_or_enqueue(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        batch = ChatModelBatch.current()
+        if batch is not None:
+            body = self._create_batch_request(input)
+            if body is not None:
+                return await batch.add(self, body)
+            logger.debug(f"{type(self).__name__} does not support batching, the request is sent directly.")
+
+        return await self._create(input, run)
+
+    async def _generate_structure_with_retries(
+        self, model_input: ChatModelInput, input: ChatModelStructureInput[Any], run: RunContext
+    ) -> ChatModelStructureOutput:
+        async def executor(_: RetryableContext) -> ChatModelStructureOutput:
+            return await self._generate_structure(model_input, input, run)
 
         return await Retryable(
             RetryableInput(
@@ -206,6 +247,33 @@ IMPORTANT: You MUST answer with a JSON object that matches the JSON schema above
             )
         ).get()
 
+    async def _generate_structure(
+        self, model_input: ChatModelInput, input: ChatModelStructureInput[Any], run: RunContext
+    ) -> ChatModelStructureOutput:
+        if not input.stream:
+            response = await self._create_or_enqueue(model_input, run)
+            logger.debug(f"Recieved structured response:\n{response}")
+
+            result = parse_broken_json(response.get_text_content())
+            return ChatModelStructureOutput(object=validate_structure(result, input.input_schema))
+
+        # closing the stream on a schema violation stops the generation without waiting for the rest
+        parser = StructureStreamParser(input.input_schema)
+        async with aclosing(self._create_stream(model_input, run)) as stream:
+            async for chunk in stream:
+                for field in parser.feed(chunk.get_text_content()):
+                    partial = parser.partial
+                    await run.emitter.emit(
+                        "partial_structure",
+                        ChatModelPartialStructureEvent(
+                            field=field,
+                            value=getattr(partial, field) if isinstance(partial, BaseModel) else partial[field],
+                            object=partial,
+                        ),
+                    )
+
+        return ChatModelStructureOutput(object=parser.end())
+
     def create(
         self,
         *,
@@ -253,25 +321,33 @@ IMPORTANT: You MUST answer with a JSON object that matches the JSON schema above
                     generator = (
                         to_async_generator(cache_hit) if cache_hit else self._create_stream(model_input, context)
                     )
+                    accumulator = ChatModelOutputAccumulator()
                     abort_controller: AbortController = AbortController()
                     async for value in generator:
-                        chunks.append(value)
+                        accumulator.add(value)
+                        if self.cache.enabled and not cache_hit:
+                            chunks.append(value)
                         await context.emitter.emit(
                             "new_token", ChatModelNewTokenEvent(value=value, abort=lambda: abort_controller.abort())
                         )
                         if abort_controller.signal.aborted:
                             break
 
-                    if not cache_hit:
+                    if self.cache.enabled and not cache_hit:
                         await self.cache.set(cache_key, chunks)
-                    result = ChatModelOutput.from_chunks(chunks)
+                    result = accumulator.build(ChatModelOutput)
                 else:
                     if cache_hit:
                         result = cache_hit[0].model_copy()
                     else:
-                        result = await self._create(model_input, context)
+                        result = await self._create_or_enqueue(model_input, context)
                         await self.cache.set(cache_key, [result])
 
+                if not cache_hit and result.usage and not model_input.tools and not model_input.response_format:
+                    tokenizer = self.tokenizer
+                    if isinstance(tokenizer, CalibratedTokenizer):
+                        tokenizer.observe(model_input.messages, result.usage.prompt_tokens)
+
                 if force_tool_call_via_response_format and not result.get_tool_calls():
                     msg = result.messages[-1]
                     tool_call: dict[str, Any] = parse_broken_json(msg.text)
@@ -315,9 +391,10 @@ IMPORTANT: You MUST answer with a JSON object that matches the JSON schema above
         messages: list[AnyMessage],
         abort_signal: AbortSignal | None = None,
         max_retries: int | None = None,
+        stream: bool | None = None,
     ) -> Run[ChatModelStructureOutput]:
         model_input = ChatModelStructureInput[T](
-            schema=schema, messages=messages, abort_signal=abort_signal, max_retries=max_retries
+            schema=schema, messages=messages, abort_signal=abort_signal, max_retries=max_retries, stream=stream
         )
 
         async def handler(context: RunContext) -> ChatModelStructureOutput:
@@ -394,6 +471,7 @@ IMPORTANT: You MUST answer with a JSON object that matches the JSON schema above
             settings=self._settings.copy(),
             use_strict_model_schema=self.use_strict_model_schema,
             use_strict_tool_schema=self.use_strict_tool_schema,
+            tokenizer=self.tokenizer.clone(),
         )
         return cloned
 
@@ -20,6 +20,8 @@ ProviderName = Literal[
     "mistralai",
     "langchain",
     "llamaindex",
+    "replay",
+    "cascade",
 ]
 ProviderHumanName = Literal[
     "BeeAI",
@@ -36,6 +38,8 @@ ProviderHumanName = Literal[
     "MistralAI",
     "LangChain",
     "LlamaIndex",
+    "Replay",
+    "Cascade",
 ]
 
 ModelTypes = Literal["embedding", "chat"]
@@ -83,4 +87,6 @@ BackendProviders = {
     "Langchain": ProviderDef(name="LangChain", module="langchain", aliases=["langchain", "LangChain"]),
     "Llamaindex": ProviderDef(name="LlamaIndex", module="llamaindex", aliases=["llamaindex", "LlamaIndex"]),
     "BeeAI": ProviderDef(name="BeeAI", module="beeai", aliases=["BeeAI", "Beeai", "BAI"]),
+    "Replay": ProviderDef(name="Replay", module="replay", aliases=["replay"]),
+    "Cascade": ProviderDef(name="Cascade", module="cascade", aliases=["cascade"]),
 }
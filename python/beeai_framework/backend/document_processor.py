@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 
 from beeai_framework.backend.types import DocumentWithScore
 
+__all__ = ["DocumentProcessor", "Reranker"]
+
 
 class DocumentProcessor(ABC):
     @abstractmethod
@@ -12,3 +14,50 @@ class DocumentProcessor(ABC):
         self, documents: list[DocumentWithScore], *, query: str | None = None
     ) -> list[DocumentWithScore]:
         raise NotImplementedError()
+
+
+class Reranker(DocumentProcessor, ABC):
+    """
+    Reorders retrieved documents by their relevance to the query and keeps the `top_n` best ones.
+
+    When the retrieval scores already separate the `top_n` documents from the rest, i.e. the gap between
+    the last kept and the first dropped document is at least `separation` times the range of all scores,
+    the documents are returned in their original order without being reranked.
+    """
+
+    def __init__(self, *, top_n: int | None = None, separation: float | None = None) -> None:
+        if top_n is not None and top_n <= 0:
+            raise ValueError("'top_n' must be a positive number.")
+        if separation is not None and not 0 < separation <= 1:
+            raise ValueError("'separation' must be between 0 (exclusive) and 1.")
+
+        self.top_n = top_n
+        self.separation = separation
+
+    async def rerank(self, query: str, documents: list[DocumentWithScore]) -> list[DocumentWithScore]:
+        top_n = self.top_n or len(documents)
+        if not documents:
+            return []
+        if self._is_separated(documents, top_n):
+            return sorted(documents, key=lambda document: document.score, reverse=True)[:top_n]
+        return (await self._rerank(query, documents, top_n))[:top_n]
+
+    async def postprocess_documents(
+        self, documents: list[DocumentWithScore], *, query: str | None = None
+    ) -> list[DocumentWithScore]:
+        if query is None:
+            raise ValueError(f"{type(self).__name__} requires 'query' parameter for reranking")
+        return await self.rerank(query, documents)
+
+    @abstractmethod
+    async def _rerank(self, query: str, documents: list[DocumentWithScore], top_n: int) -> list[DocumentWithScore]:
+        """Returns the documents ordered by relevance (at least the `top_n` best ones), scores are replaced."""
+        raise NotImplementedError()
+
+    def _is_separated(self, documents: list[DocumentWithScore], top_n: int) -> bool:
+        if self.separation is None or top_n >= len(documents):
+            return False
+
+        scores = sorted((document.score for document in documents), reverse=True)
+        spread = scores[0] - scores[-1]
+        return spread > 0 and scores[top_n - 1] - scores[top_n] >= self.separation * spread
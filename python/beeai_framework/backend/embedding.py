@@ -1,12 +1,13 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from functools import cached_property
 from typing import Any, Self
 
-from pydantic import ConfigDict, TypeAdapter
+from pydantic import ConfigDict, InstanceOf, TypeAdapter
 from typing_extensions import TypedDict, Unpack
 
 from beeai_framework.backend.constants import ProviderName
@@ -17,25 +18,45 @@ from beeai_framework.backend.events import (
     EmbeddingModelSuccessEvent,
     embedding_model_event_types,
 )
-from beeai_framework.backend.types import EmbeddingModelInput, EmbeddingModelOutput
+from beeai_framework.backend.tokenizer import CalibratedTokenizer, Tokenizer
+from beeai_framework.backend.types import EmbeddingModelInput, EmbeddingModelOutput, EmbeddingModelUsage
 from beeai_framework.backend.utils import load_model, parse_model
 from beeai_framework.context import Run, RunContext, RunMiddlewareType
 from beeai_framework.emitter import Emitter
+from beeai_framework.logger import Logger
+from beeai_framework.retryable import Retryable, RetryableConfig, RetryableContext, RetryableInput
 from beeai_framework.utils import AbortSignal
 from beeai_framework.utils.dicts import exclude_non_annotated
+from beeai_framework.utils.vectors import EmbeddingDType, import_numpy, is_array
 
 
 class EmbeddingModelKwargs(TypedDict, total=False):
     middlewares: Sequence[RunMiddlewareType]
     settings: dict[str, Any]
+    tokenizer: InstanceOf[Tokenizer]
+    max_batch_size: int | None
+    max_batch_tokens: int | None
+    max_concurrency: int
 
     __pydantic_config__ = ConfigDict(extra="forbid", arbitrary_types_allowed=True)  # type: ignore
 
 
 _EmbeddingModelKwargsAdapter = TypeAdapter(EmbeddingModelKwargs)
 
+logger = Logger(__name__)
+
 
 class EmbeddingModel(ABC):
+    """
+    Large inputs are split into sub-batches of at most `max_batch_size` values and `max_batch_tokens` tokens
+    (counted by the model's tokenizer), which are embedded concurrently (up to `max_concurrency` at once)
+    and retried independently.
+    """
+
+    max_batch_size: int | None = None
+    max_batch_tokens: int | None = None
+    max_concurrency: int = 4
+
     @property
     @abstractmethod
     def model_id(self) -> str:
@@ -57,22 +78,47 @@ class EmbeddingModel(ABC):
             events=embedding_model_event_types,
         )
 
+    @cached_property
+    def tokenizer(self) -> Tokenizer:
+        return self._create_tokenizer()
+
+    def _create_tokenizer(self) -> Tokenizer:
+        return CalibratedTokenizer()
+
     def __init__(self, **kwargs: Unpack[EmbeddingModelKwargs]) -> None:
         self._settings: dict[str, Any] = kwargs.get("settings", {})
         self._settings.update(**exclude_non_annotated(kwargs, EmbeddingModelKwargs))
 
         kwargs = _EmbeddingModelKwargsAdapter.validate_python(kwargs)
         self.middlewares: list[RunMiddlewareType] = [*kwargs.get("middlewares", [])]
+        if "tokenizer" in kwargs:
+            self.tokenizer = kwargs["tokenizer"]
+        self.max_batch_size = kwargs.get("max_batch_size", type(self).max_batch_size)
+        self.max_batch_tokens = kwargs.get("max_batch_tokens", type(self).max_batch_tokens)
+        self.max_concurrency = kwargs.get("max_concurrency", type(self).max_concurrency)
 
     def create(
-        self, values: list[str], *, abort_signal: AbortSignal | None = None, max_retries: int | None = None
+        self,
+        values: list[str],
+        *,
+        abort_signal: AbortSignal | None = None,
+        max_retries: int | None = None,
+        dtype: EmbeddingDType | None = None,
     ) -> Run[EmbeddingModelOutput]:
-        model_input = EmbeddingModelInput(values=values, abort_signal=abort_signal, max_retries=max_retries or 0)
+        """
+        Embeds the given values.
+
+        With `dtype` set, embeddings are returned as a contiguous 2D numpy array of that type (requires numpy)
+        instead of lists of floats.
+        """
+        model_input = EmbeddingModelInput(
+            values=values, abort_signal=abort_signal, max_retries=max_retries or 0, dtype=dtype
+        )
 
         async def handler(context: RunContext) -> EmbeddingModelOutput:
             try:
                 await context.emitter.emit("start", EmbeddingModelStartEvent(input=model_input))
-                result: EmbeddingModelOutput = await self._create(model_input, context)
+                result = await self._create_batched(model_input, context)
                 await context.emitter.emit("success", EmbeddingModelSuccessEvent(value=result))
                 return result
             except Exception as ex:
@@ -100,6 +146,69 @@ class EmbeddingModel(ABC):
     ) -> EmbeddingModelOutput:
         raise NotImplementedError
 
+    async def _create_batched(self, input: EmbeddingModelInput, run: RunContext) -> EmbeddingModelOutput:
+        batches = self._split_into_batches(input.values)
+        if len(batches) <= 1:
+            return await self._create_with_retries(input, run)
+
+        logger.debug(f"Embedding {len(input.values)} values in {len(batches)} batches.")
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def process(values: list[str]) -> EmbeddingModelOutput:
+            async with semaphore:
+                return await self._create_with_retries(input.model_copy(update={"values": values}), run)
+
+        outputs = await asyncio.gather(*(process(values) for values in batches))
+        usages = [output.usage for output in outputs if output.usage is not None]
+        return EmbeddingModelOutput(
+            values=input.values,
+            embeddings=import_numpy().concatenate([output.embeddings for output in outputs])
+            if input.dtype is not None
+            else [embedding for output in outputs for embedding in output.embeddings],
+            usage=EmbeddingModelUsage(
+                prompt_tokens=sum(usage.prompt_tokens for usage in usages),
+                completion_tokens=sum(usage.completion_tokens for usage in usages),
+                total_tokens=sum(usage.total_tokens for usage in usages),
+            )
+            if usages
+            else None,
+        )
+
+    async def _create_with_retries(self, input: EmbeddingModelInput, run: RunContext) -> EmbeddingModelOutput:
+        async def executor(_: RetryableContext) -> EmbeddingModelOutput:
+            output = await self._create(input, run)
+            if input.dtype is not None and not is_array(output.embeddings):
+                output.embeddings = output.to_array(input.dtype)
+            return output
+
+        return await Retryable(
+            RetryableInput(
+                executor=executor, config=RetryableConfig(max_retries=input.max_retries or 0, signal=run.signal)
+            )
+        ).get()
+
+    def _split_into_batches(self, values: list[str]) -> list[list[str]]:
+        """Splits values into consecutive batches which respect the item and token limits."""
+        if self.max_batch_tokens is None:
+            size = self.max_batch_size or len(values) or 1
+            return [values[i : i + size] for i in range(0, len(values), size)]
+
+        batches: list[list[str]] = []
+        batch: list[str] = []
+        batch_tokens = 0
+        for value, tokens in zip(values, self.tokenizer.count_batch(values), strict=True):
+            if batch and (
+                batch_tokens + tokens > self.max_batch_tokens
+                or (self.max_batch_size is not None and len(batch) >= self.max_batch_size)
+            ):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(value)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
     def clone(self) -> Self:
         return type(self)()
 
@@ -47,6 +47,19 @@ class ChatModelError(BackendError):
         return super().ensure(error, message=message, context=model_context)
 
 
+class ChatModelStructureError(BackendError):
+    """Raised when a generated structure does not match the expected schema; the generation can be retried."""
+
+    def __init__(
+        self,
+        message: str = "Chat Model structure error",
+        *,
+        cause: Exception | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(message, is_fatal=True, is_retryable=True, cause=cause, context=context)
+
+
 class EmbeddingModelError(BackendError):
     def __init__(
         self,
@@ -3,6 +3,7 @@
 
 from collections.abc import Callable
 from types import NoneType
+from typing import Any
 
 from pydantic import BaseModel, InstanceOf
 
@@ -15,6 +16,12 @@ class ChatModelNewTokenEvent(BaseModel):
     abort: Callable[[], None]
 
 
+class ChatModelPartialStructureEvent(BaseModel):
+    field: str
+    value: Any
+    object: Any
+
+
 class ChatModelSuccessEvent(BaseModel):
     value: InstanceOf[ChatModelOutput]
 
@@ -30,6 +37,7 @@ class ChatModelErrorEvent(BaseModel):
 
 chat_model_event_types: dict[str, type] = {
     "new_token": ChatModelNewTokenEvent,
+    "partial_structure": ChatModelPartialStructureEvent,
     "success": ChatModelSuccessEvent,
     "start": ChatModelStartEvent,
     "error": ChatModelErrorEvent,
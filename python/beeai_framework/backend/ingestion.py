@@ -0,0 +1,412 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import hashlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Coroutine, Iterable, Sequence
+from pathlib import Path
+from typing import Any, NamedTuple, Protocol, runtime_checkable
+
+from pydantic import BaseModel
+
+from beeai_framework.backend.embedding import EmbeddingModel
+from beeai_framework.backend.errors import BackendError
+from beeai_framework.backend.tokenizer import Tokenizer
+from beeai_framework.backend.types import Document
+from beeai_framework.backend.vector_store import VectorStore
+from beeai_framework.logger import Logger
+from beeai_framework.utils.vectors import EmbeddingArray
+
+__all__ = [
+    "DocumentLoader",
+    "FileIngestionCheckpoint",
+    "InMemoryIngestionCheckpoint",
+    "IngestionCheckpoint",
+    "IngestionPipeline",
+    "IngestionStats",
+    "TextFileLoader",
+    "TokenTextSplitter",
+]
+
+logger = Logger(__name__)
+
+
+class DocumentLoader(ABC):
+    @abstractmethod
+    def load(self) -> AsyncIterator[Document]:
+        """Yields documents one by one, so that they don't have to be held in memory at once."""
+        pass
+
+
+class TextFileLoader(DocumentLoader):
+    """Loads a text file or all files in a directory matching the `pattern`, one document per file."""
+
+    def __init__(self, path: str | Path, *, pattern: str = "**/*", encoding: str = "utf-8") -> None:
+        self.path = Path(path)
+        self.pattern = pattern
+        self.encoding = encoding
+
+    async def load(self) -> AsyncIterator[Document]:
+        files = [self.path] if self.path.is_file() else sorted(p for p in self.path.glob(self.pattern) if p.is_file())
+        for file in files:
+            content = await asyncio.to_thread(file.read_text, encoding=self.encoding)
+            yield Document(content=content, metadata={"source": str(file)})
+
+
+class TokenTextSplitter:
+    """
+    Splits documents into chunks of at most `chunk_size` tokens, consecutive chunks share `chunk_overlap` tokens.
+
+    Chunks inherit the metadata of their document, extended by the `chunk` index.
+    """
+
+    def __init__(self, tokenizer: Tokenizer, *, chunk_size: int = 512, chunk_overlap: int = 64) -> None:
+        if chunk_size <= 0:
+            raise ValueError("'chunk_size' must be greater than 0")
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("'chunk_overlap' must be non-negative and less than 'chunk_size'")
+
+        self.tokenizer = tokenizer
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+
+    def split(self, document: Document) -> list[Document]:
+        if not document.content.strip():
+            return []
+
+        texts = (
+            [document.content]
+            if self.tokenizer.count(document.content) <= self.chunk_size
+            else self.tokenizer.split(document.content, self.chunk_size, self.chunk_overlap)
+        )
+        return [
+            Document(content=text, metadata={**document.metadata, "chunk": index}) for index, text in enumerate(texts)
+        ]
+
+
+class IngestionCheckpoint(ABC):
+    """Remembers which source documents have been fully written, so that an interrupted ingestion can be resumed."""
+
+    @abstractmethod
+    async def contains(self, source_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def commit(self, source_ids: Sequence[str]) -> None:
+        pass
+
+
+class InMemoryIngestionCheckpoint(IngestionCheckpoint):
+    def __init__(self) -> None:
+        self._source_ids: set[str] = set()
+
+    async def contains(self, source_id: str) -> bool:
+        return source_id in self._source_ids
+
+    async def commit(self, source_ids: Sequence[str]) -> None:
+        self._source_ids.update(source_ids)
+
+
+class FileIngestionCheckpoint(IngestionCheckpoint):
+    """Appends ids of completed sources to a text file, one per line."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._source_ids: set[str] | None = None
+
+    async def contains(self, source_id: str) -> bool:
+        return source_id in await self._load()
+
+    async def commit(self, source_ids: Sequence[str]) -> None:
+        if not source_ids:
+            return
+
+        loaded = await self._load()
+        await asyncio.to_thread(self._append, source_ids)
+        loaded.update(source_ids)
+
+    async def _load(self) -> set[str]:
+        if self._source_ids is None:
+            self._source_ids = await asyncio.to_thread(self._read)
+        return self._source_ids
+
+    def _read(self) -> set[str]:
+        if not self.path.exists():
+            return set()
+        return {line for line in self.path.read_text(encoding="utf-8").splitlines() if line}
+
+    def _append(self, source_ids: Sequence[str]) -> None:
+        with self.path.open("a", encoding="utf-8") as file:
+            file.writelines(f"{source_id}\n" for source_id in source_ids)
+
+
+@runtime_checkable
+class _SupportsAddEmbeddings(Protocol):
+    async def aadd_embeddings(self, documents: Sequence[Document], embeddings: EmbeddingArray) -> list[str]: ...
+
+
+@runtime_checkable
+class _SupportsLookup(Protocol):
+    def lookup(self, documents: Sequence[Document]) -> list[str | None]: ...
+
+
+class IngestionStats(BaseModel):
+    sources: int = 0
+    skipped_sources: int = 0
+    chunks: int = 0
+    duplicates: int = 0
+    unchanged: int = 0
+    batches: int = 0
+    written: int = 0
+
+
+class _Chunk(NamedTuple):
+    source_id: str
+    document: Document
+
+
+class _Done:
+    pass
+
+
+_DONE = _Done()
+
+
+class IngestionPipeline:
+    """
+    Streams documents into a vector store through bounded stages running concurrently:
+
+    load → split (by tokens) → deduplicate → micro-batch → embed → write.
+
+    Stages are connected by queues of at most `queue_size` items, so the memory use does not depend on the size
+    of the corpus (apart from 16 byte hashes of unique chunks kept for deduplication and ids of sources), and up to
+    `embedding_concurrency` embedding requests are in flight at once.
+    Stores with `aadd_embeddings` (e.g. `LocalVectorStore`) get precomputed embeddings,
+    other stores embed documents themselves, so their `add_documents` is called by the embedding stage.
+    Chunks which are already stored are skipped before embedding for stores with `lookup` (e.g. `LocalVectorStore`),
+    so running the pipeline again over an updated corpus embeds only new or changed chunks.
+
+    A source is committed to the `checkpoint` once the loader has moved past it and all chunks of its documents
+    are written, and skipped by later runs. Documents sharing a source (e.g. pages of a file) are expected
+    to be loaded one after another. Chunks of a source which was interrupted halfway are ingested again.
+    """
+
+    def __init__(
+        self,
+        vector_store: VectorStore,
+        *,
+        embedding_model: EmbeddingModel | None = None,
+        splitter: TokenTextSplitter | None = None,
+        checkpoint: IngestionCheckpoint | None = None,
+        source_id: Callable[[Document], str] | None = None,
+        deduplicate: bool = True,
+        batch_size: int = 64,
+        max_batch_tokens: int | None = None,
+        batch_timeout: float = 0.5,
+        queue_size: int = 256,
+        split_concurrency: int = 2,
+        embedding_concurrency: int = 4,
+    ) -> None:
+        embedding_model = embedding_model or getattr(vector_store, "embedding_model", None)
+        if splitter is None:
+            if embedding_model is None:
+                raise ValueError("Either 'splitter' or 'embedding_model' must be provided.")
+            splitter = TokenTextSplitter(embedding_model.tokenizer)
+        if embedding_model is None and isinstance(vector_store, _SupportsAddEmbeddings):
+            raise ValueError("The 'embedding_model' must be provided for this vector store.")
+        if batch_size <= 0 or queue_size <= 0 or split_concurrency <= 0 or embedding_concurrency <= 0:
+            raise ValueError("Sizes and concurrency limits must be positive numbers.")
+
+        self.vector_store = vector_store
+        self.embedding_model = embedding_model
+        self.splitter = splitter
+        self.checkpoint = checkpoint or InMemoryIngestionCheckpoint()
+        self.source_id = source_id or _default_source_id
+        self.deduplicate = deduplicate
+        self.batch_size = batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.batch_timeout = batch_timeout
+        self.queue_size = queue_size
+        self.split_concurrency = split_concurrency
+        self.embedding_concurrency = embedding_concurrency
+
+    async def run(self, source: DocumentLoader | Iterable[Document] | AsyncIterable[Document]) -> IngestionStats:
+        stats = IngestionStats()
+        # documents (before they are split) and chunks of each source which are not written yet
+        pending: dict[str, int] = {}
+        started: set[str] = set()
+        loading: str | None = None
+        loaded: asyncio.Queue[tuple[str, Document] | _Done] = asyncio.Queue(self.queue_size)
+        split: asyncio.Queue[tuple[str, list[Document]] | _Done] = asyncio.Queue(self.queue_size)
+        unique: asyncio.Queue[_Chunk | _Done] = asyncio.Queue(self.queue_size)
+        batches: asyncio.Queue[list[_Chunk] | _Done] = asyncio.Queue(self.embedding_concurrency)
+        embedded: asyncio.Queue[tuple[list[_Chunk], list[Document], EmbeddingArray | None] | _Done] = asyncio.Queue(
+            self.embedding_concurrency
+        )
+        seen: set[bytes] = set()
+
+        async def release(counts: dict[str, int]) -> None:
+            completed = []
+            for source_id, count in counts.items():
+                pending[source_id] -= count
+                if not pending[source_id] and source_id != loading:
+                    del pending[source_id]
+                    completed.append(source_id)
+            if completed:
+                await self.checkpoint.commit(completed)
+
+        async def load() -> None:
+            nonlocal loading
+            async for document in _iterate(source):
+                source_id = self.source_id(document)
+                if source_id not in started and await self.checkpoint.contains(source_id):
+                    stats.skipped_sources += 1
+                    continue
+                started.add(source_id)
+                stats.sources += 1
+                pending[source_id] = pending.get(source_id, 0) + 1
+                previous, loading = loading, source_id
+                if previous is not None and previous != source_id:
+                    await release({previous: 0})  # the loader has moved past it
+                await loaded.put((source_id, document))
+
+            previous, loading = loading, None
+            if previous is not None:
+                await release({previous: 0})
+
+        async def split_document(item: tuple[str, Document]) -> None:
+            source_id, document = item
+            await split.put((source_id, await asyncio.to_thread(self.splitter.split, document)))
+
+        async def deduplicate(item: tuple[str, list[Document]]) -> None:
+            source_id, chunks = item
+            stats.chunks += len(chunks)
+            if self.deduplicate:
+                kept = []
+                for chunk in chunks:
+                    digest = hashlib.blake2b(chunk.content.encode(), digest_size=16).digest()
+                    if digest not in seen:
+                        seen.add(digest)
+                        kept.append(chunk)
+                stats.duplicates += len(chunks) - len(kept)
+                chunks = kept
+
+            # the document is replaced by its chunks
+            pending[source_id] += len(chunks)
+            await release({source_id: 1})
+            for chunk in chunks:
+                await unique.put(_Chunk(source_id, chunk))
+
+        async def batch() -> None:
+            current: list[_Chunk] = []
+            tokens = 0
+
+            async def flush() -> None:
+                nonlocal current, tokens
+                if current:
+                    stats.batches += 1
+                    await batches.put(current)
+                    current, tokens = [], 0
+
+            while True:
+                try:
+                    item = await asyncio.wait_for(unique.get(), self.batch_timeout) if current else await unique.get()
+                except TimeoutError:
+                    await flush()  # the upstream is slow, the embedding stage should not wait for a full batch
+                    continue
+
+                if isinstance(item, _Done):
+                    await flush()
+                    return
+
+                count = self.splitter.tokenizer.count(item.document.content) if self.max_batch_tokens else 0
+                if self.max_batch_tokens and tokens + count > self.max_batch_tokens:
+                    await flush()
+                current.append(item)
+                tokens += count
+                if len(current) >= self.batch_size:
+                    await flush()
+
+        async def embed(chunks: list[_Chunk]) -> None:
+            documents = [chunk.document for chunk in chunks]
+            if isinstance(self.vector_store, _SupportsLookup):
+                stored = self.vector_store.lookup(documents)
+                documents = [document for document, id in zip(documents, stored, strict=True) if id is None]
+                stats.unchanged += len(chunks) - len(documents)
+
+            if not documents:
+                await embedded.put((chunks, documents, None))
+            elif isinstance(self.vector_store, _SupportsAddEmbeddings):
+                assert self.embedding_model is not None
+                response = await self.embedding_model.create(
+                    [document.content for document in documents], dtype="float32"
+                )
+                await embedded.put((chunks, documents, response.to_array()))
+            else:
+                await self.vector_store.add_documents(documents)
+                await embedded.put((chunks, documents, None))
+
+        async def write(item: tuple[list[_Chunk], list[Document], EmbeddingArray | None]) -> None:
+            chunks, documents, embeddings = item
+            if embeddings is not None:
+                assert isinstance(self.vector_store, _SupportsAddEmbeddings)
+                await self.vector_store.aadd_embeddings(documents, embeddings)
+            stats.written += len(documents)
+            await release(Counter(chunk.source_id for chunk in chunks))
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(_stage([load], loaded, self.split_concurrency))
+                tg.create_task(_stage(_workers(loaded, split_document, self.split_concurrency), split, 1))
+                tg.create_task(_stage(_workers(split, deduplicate, 1), unique, 1))
+                tg.create_task(_stage([batch], batches, self.embedding_concurrency))
+                tg.create_task(_stage(_workers(batches, embed, self.embedding_concurrency), embedded, 1))
+                tg.create_task(_stage(_workers(embedded, write, 1), None, 0))
+        except ExceptionGroup as e:
+            error = e.exceptions[0]
+            while isinstance(error, ExceptionGroup):  # stages are nested task groups
+                error = error.exceptions[0]
+            raise BackendError.ensure(error, message="Ingestion of documents has failed.") from None
+
+        logger.debug(f"Ingestion has finished: {stats}")
+        return stats
+
+
+def _default_source_id(document: Document) -> str:
+    source = document.metadata.get("source")
+    return str(source) if source is not None else hashlib.sha256(document.content.encode()).hexdigest()
+
+
+async def _iterate(source: DocumentLoader | Iterable[Document] | AsyncIterable[Document]) -> AsyncIterator[Document]:
+    if isinstance(source, DocumentLoader):
+        source = source.load()
+    if isinstance(source, AsyncIterable):
+        async for document in source:
+            yield document
+    else:
+        for document in source:
+            yield document
+
+
+def _workers(
+    queue: "asyncio.Queue[Any]", handler: Callable[[Any], Awaitable[None]], count: int
+) -> list[Callable[[], Coroutine[Any, Any, None]]]:
+    async def worker() -> None:
+        while not isinstance(item := await queue.get(), _Done):
+            await handler(item)
+
+    return [worker] * count
+
+
+async def _stage(
+    workers: Sequence[Callable[[], Coroutine[Any, Any, None]]], output: "asyncio.Queue[Any] | None", consumers: int
+) -> None:
+    """Runs the workers of a stage, then signals each consumer of the next stage that no more items come."""
+    async with asyncio.TaskGroup() as tg:
+        for worker in workers:
+            tg.create_task(worker())
+    for _ in range(consumers):
+        assert output is not None
+        await output.put(_DONE)
@@ -9,7 +9,7 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import Any, Generic, Literal, Required, Self, TypeAlias, TypeVar, cast
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, PrivateAttr, model_validator
 from typing_extensions import TypedDict
 
 from beeai_framework.utils.lists import cast_list
@@ -51,6 +51,11 @@ class MessageImageContent(BaseModel):
     image_url: MessageImageContentImageUrl
 
 
+class MessageCacheControl(TypedDict, total=False):
+    type: Required[Literal["ephemeral"]]
+    ttl: str
+
+
 class MessageToolResultContent(BaseModel):
     type: Literal["tool-result"] = "tool-result"
     result: Any
@@ -63,19 +68,40 @@ class MessageToolCallContent(BaseModel):
     id: str
     tool_name: str
     args: str
+    _parsed_args: tuple[str, Any] | None = PrivateAttr(default=None)
 
-    @field_validator("args", mode="after")
-    @classmethod
-    def validate_args_json(cls, args: str) -> str:
+    @model_validator(mode="after")
+    def validate_args_json(self) -> Self:
         try:
-            json.loads(args)
-            return args
+            self._parsed_args = (self.args, json.loads(self.args))
+            return self
         except Exception:
             raise ValueError(
-                f"The 'args' parameter for a tool (function) call {args} is the not a valid JSON!"
+                f"The 'args' parameter for a tool (function) call {self.args} is the not a valid JSON!"
                 f"Try to increase max new tokens for your chat model.",
             )
 
+    @property
+    def parsed_args(self) -> Any:
+        """Decoded `args`; the JSON is parsed once and shared, so the returned value must not be mutated."""
+        if self._parsed_args is None or self._parsed_args[0] is not self.args:
+            self._parsed_args = (self.args, json.loads(self.args))
+        return self._parsed_args[1]
+
+
+class MessageToolCallDeltaContent(BaseModel):
+    """
+    A fragment of a tool call produced while streaming. Fragments are assembled by the index and the id.
+
+    Fragments are carried by `ChatModelOutput.tool_call_deltas` and never become a part of a message's content.
+    """
+
+    type: Literal["tool-call-delta"] = "tool-call-delta"
+    index: int | None = None
+    id: str | None = None
+    tool_name: str | None = None
+    args: str = ""
+
 
 class Message(ABC, Generic[T]):
     role: Role | str
@@ -109,6 +135,19 @@ class Message(ABC, Generic[T]):
     def get_by_type(self, tp: type[T2]) -> list[T2]:
         return [cont for cont in self.content if isinstance(cont, tp)]
 
+    @property
+    def cache_control(self) -> MessageCacheControl | None:
+        return cast(MessageCacheControl | None, self.meta.get("cacheControl"))
+
+    def mark_cache_breakpoint(self, *, ttl: str | None = None) -> Self:
+        """
+        Marks the end of a stable prompt prefix (everything up to and including this message).
+
+        Providers with explicit prompt caching (e.g. Anthropic) cache the prefix, others ignore the marker.
+        """
+        self.meta["cacheControl"] = MessageCacheControl(type="ephemeral", ttl=ttl) if ttl else {"type": "ephemeral"}
+        return self
+
     def to_plain(self) -> dict[str, Any]:
         return {
             "role": self.role.value if isinstance(self.role, enum.Enum) else self.role,
@@ -0,0 +1,190 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Any, TypeAlias
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+__all__ = [
+    "AndFilter",
+    "EqFilter",
+    "InFilter",
+    "MetadataFilter",
+    "MetadataFilterLike",
+    "MetadataValue",
+    "OrFilter",
+    "RangeFilter",
+    "to_metadata_filter",
+]
+
+MetadataValue: TypeAlias = str | int | float | bool
+
+
+class MetadataFilter(BaseModel, ABC):
+    """
+    Condition on document metadata, used to restrict a vector store search.
+
+    Filters can be combined with `&` and `|`, or created from a dictionary using MongoDB-like operators
+    (see `MetadataFilter.from_dict`).
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    @abstractmethod
+    def matches(self, metadata: Mapping[str, Any]) -> bool:
+        pass
+
+    @abstractmethod
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the filter as a dictionary with MongoDB-like operators, the syntax used by many vector databases."""
+        pass
+
+    def __and__(self, other: MetadataFilter) -> AndFilter:
+        return AndFilter(filters=[self, other])
+
+    def __or__(self, other: MetadataFilter) -> OrFilter:
+        return OrFilter(filters=[self, other])
+
+    @classmethod
+    def from_dict(cls, value: Mapping[str, Any]) -> MetadataFilter:
+        """
+        Parses a dictionary with MongoDB-like operators.
+
+        Supported are `$eq`, `$in`, `$gt`, `$gte`, `$lt`, `$lte`, `$and` and `$or`,
+        e.g. `{"tenant": "acme", "year": {"$gte": 2020}}` or `{"$or": [{"source": "a"}, {"source": "b"}]}`.
+        A plain value means equality and multiple keys are combined by `$and`.
+        """
+        filters: list[MetadataFilter] = []
+        for key, condition in value.items():
+            if key in ("$and", "$or"):
+                if not isinstance(condition, list) or not condition:
+                    raise ValueError(f"Operator '{key}' expects a non-empty list of filters.")
+                nested = [cls.from_dict(item) for item in condition]
+                filters.append(AndFilter(filters=nested) if key == "$and" else OrFilter(filters=nested))
+            elif key.startswith("$"):
+                raise ValueError(f"Unsupported operator '{key}'.")
+            elif isinstance(condition, Mapping):
+                filters.extend(_parse_field(key, condition))
+            else:
+                filters.append(EqFilter(field=key, value=condition))
+
+        if not filters:
+            raise ValueError("The filter must contain at least one condition.")
+        return filters[0] if len(filters) == 1 else AndFilter(filters=filters)
+
+
+class EqFilter(MetadataFilter):
+    field: str
+    value: MetadataValue
+
+    def matches(self, metadata: Mapping[str, Any]) -> bool:
+        return self.field in metadata and metadata[self.field] == self.value
+
+    def to_dict(self) -> dict[str, Any]:
+        return {self.field: {"$eq": self.value}}
+
+
+class InFilter(MetadataFilter):
+    field: str
+    values: list[MetadataValue]
+
+    def matches(self, metadata: Mapping[str, Any]) -> bool:
+        return self.field in metadata and metadata[self.field] in self.values
+
+    def to_dict(self) -> dict[str, Any]:
+        return {self.field: {"$in": list(self.values)}}
+
+
+class RangeFilter(MetadataFilter):
+    """Matches values within the given bounds, values of a different type (e.g. strings for numeric bounds) never."""
+
+    field: str
+    gt: MetadataValue | None = None
+    gte: MetadataValue | None = None
+    lt: MetadataValue | None = None
+    lte: MetadataValue | None = None
+
+    @model_validator(mode="after")
+    def _validate_bounds(self) -> RangeFilter:
+        if self.gt is None and self.gte is None and self.lt is None and self.lte is None:
+            raise ValueError("At least one bound of the range must be set.")
+        return self
+
+    @property
+    def bounds(self) -> dict[str, MetadataValue]:
+        return {op: bound for op in ("gt", "gte", "lt", "lte") if (bound := getattr(self, op)) is not None}
+
+    def matches(self, metadata: Mapping[str, Any]) -> bool:
+        if self.field not in metadata:
+            return False
+
+        value = metadata[self.field]
+        try:
+            return (
+                (self.gt is None or value > self.gt)
+                and (self.gte is None or value >= self.gte)
+                and (self.lt is None or value < self.lt)
+                and (self.lte is None or value <= self.lte)
+            )
+        except TypeError:
+            return False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {self.field: {f"${op}": bound for op, bound in self.bounds.items()}}
+
+
+class AndFilter(MetadataFilter):
+    filters: list[MetadataFilter]
+
+    def matches(self, metadata: Mapping[str, Any]) -> bool:
+        return all(item.matches(metadata) for item in self.filters)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"$and": [item.to_dict() for item in self.filters]}
+
+    def __and__(self, other: MetadataFilter) -> AndFilter:
+        return AndFilter(filters=[*self.filters, other])
+
+
+class OrFilter(MetadataFilter):
+    filters: list[MetadataFilter]
+
+    def matches(self, metadata: Mapping[str, Any]) -> bool:
+        return any(item.matches(metadata) for item in self.filters)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"$or": [item.to_dict() for item in self.filters]}
+
+    def __or__(self, other: MetadataFilter) -> OrFilter:
+        return OrFilter(filters=[*self.filters, other])
+
+
+MetadataFilterLike: TypeAlias = MetadataFilter | Mapping[str, Any]
+
+
+def to_metadata_filter(value: MetadataFilterLike | None) -> MetadataFilter | None:
+    if value is None or isinstance(value, MetadataFilter):
+        return value
+    return MetadataFilter.from_dict(value)
+
+
+def _parse_field(field: str, condition: Mapping[str, Any]) -> list[MetadataFilter]:
+    filters: list[MetadataFilter] = []
+    bounds: dict[str, Any] = {}
+    for op, operand in condition.items():
+        if op == "$eq":
+            filters.append(EqFilter(field=field, value=operand))
+        elif op == "$in":
+            filters.append(InFilter(field=field, values=operand))
+        elif op in ("$gt", "$gte", "$lt", "$lte"):
+            bounds[op[1:]] = operand
+        else:
+            raise ValueError(f"Unsupported operator '{op}' for the field '{field}'.")
+
+    if bounds:
+        filters.append(RangeFilter(field=field, **bounds))
+    return filters
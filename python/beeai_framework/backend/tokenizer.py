@@ -0,0 +1,225 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import contextlib
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from math import ceil
+from pathlib import Path
+from typing import TYPE_CHECKING, Self
+
+from beeai_framework.backend.message import (
+    AnyMessage,
+    MessageImageContent,
+    MessageTextContent,
+    MessageToolCallContent,
+    MessageToolResultContent,
+)
+from beeai_framework.utils.strings import to_json
+
+if TYPE_CHECKING:
+    import tiktoken
+    import tokenizers
+
+__all__ = ["CalibratedTokenizer", "HuggingFaceTokenizer", "TiktokenTokenizer", "Tokenizer"]
+
+
+class Tokenizer(ABC):
+    """
+    Counts tokens locally, without calling the provider.
+
+    Every message costs `message_overhead` extra tokens (the role and delimiters of the chat template),
+    every request `reply_overhead` tokens (priming of the assistant's reply) and every image `image_tokens` tokens.
+    """
+
+    message_overhead: int = 3
+    reply_overhead: int = 3
+    image_tokens: int = 765
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        pass
+
+    @abstractmethod
+    def split(self, text: str, size: int, overlap: int = 0) -> list[str]:
+        """Splits the text into chunks of at most `size` tokens, consecutive chunks share `overlap` tokens."""
+        pass
+
+    def count_batch(self, texts: Sequence[str]) -> list[int]:
+        return [self.count(text) for text in texts]
+
+    def count_message(self, message: AnyMessage) -> int:
+        texts, images = _to_parts(message)
+        return self.message_overhead + sum(self.count_batch(texts)) + images * self.image_tokens
+
+    def count_tokens(self, messages: Sequence[AnyMessage]) -> int:
+        """Returns the number of prompt tokens for the given messages, including the chat template's overhead."""
+        if not messages:
+            return 0
+
+        parts = [_to_parts(message) for message in messages]
+        counts = self.count_batch([text for texts, _ in parts for text in texts])
+        images = sum(images for _, images in parts)
+        return sum(counts) + images * self.image_tokens + len(messages) * self.message_overhead + self.reply_overhead
+
+    def clone(self) -> Self:
+        """Tokenizers without mutable state are shared between clones."""
+        return self
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Returns the longest prefix of the text which fits into `max_tokens` tokens."""
+        if max_tokens <= 0:
+            return ""
+        return text if self.count(text) <= max_tokens else self.split(text, max_tokens)[0]
+
+    @staticmethod
+    def _validate_split(size: int, overlap: int) -> None:
+        if size <= 0:
+            raise ValueError("size must be greater than 0")
+        if overlap < 0:
+            raise ValueError("overlap must be non-negative")
+        if overlap >= size:
+            raise ValueError("overlap must be less than size")
+
+
+class _EncodingTokenizer(Tokenizer):
+    @abstractmethod
+    def encode(self, text: str) -> list[int]:
+        pass
+
+    @abstractmethod
+    def decode(self, tokens: Sequence[int]) -> str:
+        pass
+
+    def count(self, text: str) -> int:
+        return len(self.encode(text))
+
+    def split(self, text: str, size: int, overlap: int = 0) -> list[str]:
+        self._validate_split(size, overlap)
+        tokens = self.encode(text)
+        step = size - overlap
+        return [self.decode(tokens[i : i + size]) for i in range(0, len(tokens), step)]
+
+
+class TiktokenTokenizer(_EncodingTokenizer):
+    """
+    BPE tokenizer backed by `tiktoken`.
+
+    Encodings are loaded from the directory set by `TIKTOKEN_CACHE_DIR` (LiteLLM's bundled copy of `cl100k_base`
+    and `o200k_base` unless set otherwise), so no network access is needed for them.
+    """
+
+    def __init__(self, encoding: "str | tiktoken.Encoding" = "cl100k_base") -> None:
+        import tiktoken
+
+        _use_bundled_encodings()
+        self.encoding = tiktoken.get_encoding(encoding) if isinstance(encoding, str) else encoding
+
+    @classmethod
+    def for_model(cls, model_id: str) -> "TiktokenTokenizer":
+        """
+        Raises `KeyError` when tiktoken does not know the model.
+
+        Loading an encoding which is not available locally requires network access and fails without it.
+        """
+        import tiktoken
+
+        _use_bundled_encodings()
+        return cls(tiktoken.encoding_for_model(model_id))
+
+    def encode(self, text: str) -> list[int]:
+        return self.encoding.encode_ordinary(text)
+
+    def decode(self, tokens: Sequence[int]) -> str:
+        return self.encoding.decode(list(tokens))
+
+    def count_batch(self, texts: Sequence[str]) -> list[int]:
+        return [len(tokens) for tokens in self.encoding.encode_ordinary_batch(list(texts))]
+
+
+class HuggingFaceTokenizer(_EncodingTokenizer):
+    """Tokenizer loaded from a local `tokenizer.json` file (or an existing `tokenizers.Tokenizer` instance)."""
+
+    def __init__(self, tokenizer: "str | Path | tokenizers.Tokenizer") -> None:
+        from tokenizers import Tokenizer as _Tokenizer
+
+        self.tokenizer = tokenizer if isinstance(tokenizer, _Tokenizer) else _Tokenizer.from_file(str(tokenizer))
+
+    def encode(self, text: str) -> list[int]:
+        return list(self.tokenizer.encode(text, add_special_tokens=False).ids)
+
+    def decode(self, tokens: Sequence[int]) -> str:
+        return str(self.tokenizer.decode(list(tokens)))
+
+    def count_batch(self, texts: Sequence[str]) -> list[int]:
+        return [len(encoding.ids) for encoding in self.tokenizer.encode_batch(list(texts), add_special_tokens=False)]
+
+
+class CalibratedTokenizer(Tokenizer):
+    """
+    Estimates tokens from the number of characters, used when no real tokenizer is available for the model.
+
+    The characters-per-token ratio is adjusted by `observe` from the prompt tokens reported by the provider,
+    so the estimate converges to the model's actual tokenization over time.
+    """
+
+    def __init__(self, chars_per_token: float = 4.0, *, smoothing: float = 0.2) -> None:
+        if chars_per_token <= 0:
+            raise ValueError("'chars_per_token' must be a positive number")
+        if not 0 <= smoothing <= 1:
+            raise ValueError("'smoothing' must be a number in range [0, 1]")
+
+        self.chars_per_token = chars_per_token
+        self.smoothing = smoothing
+
+    def count(self, text: str) -> int:
+        return ceil(len(text) / self.chars_per_token)
+
+    def split(self, text: str, size: int, overlap: int = 0) -> list[str]:
+        self._validate_split(size, overlap)
+        chars = max(int(size * self.chars_per_token), 1)
+        step = max(int((size - overlap) * self.chars_per_token), 1)
+        return [text[i : i + chars] for i in range(0, len(text), step)]
+
+    def clone(self) -> Self:
+        return type(self)(self.chars_per_token, smoothing=self.smoothing)
+
+    def observe(self, messages: Sequence[AnyMessage], prompt_tokens: int) -> None:
+        """Updates the ratio from the number of prompt tokens the provider has reported for the given messages."""
+        parts = [_to_parts(message) for message in messages]
+        chars = sum(len(text) for texts, _ in parts for text in texts)
+        overhead = (
+            len(messages) * self.message_overhead
+            + self.reply_overhead
+            + sum(images for _, images in parts) * self.image_tokens
+        )
+        if chars == 0 or prompt_tokens <= overhead:
+            return
+
+        observed = chars / (prompt_tokens - overhead)
+        self.chars_per_token += self.smoothing * (observed - self.chars_per_token)
+
+
+def _use_bundled_encodings() -> None:
+    # LiteLLM sets TIKTOKEN_CACHE_DIR once its default encoding module is loaded, which may not have happened yet
+    if "TIKTOKEN_CACHE_DIR" not in os.environ:
+        with contextlib.suppress(ImportError):
+            import litellm.litellm_core_utils.default_encoding  # noqa: F401
+
+
+def _to_parts(message: AnyMessage) -> tuple[list[str], int]:
+    texts: list[str] = [str(message.role)]
+    images = 0
+    for content in message.content:
+        if isinstance(content, MessageTextContent):
+            texts.append(content.text)
+        elif isinstance(content, MessageToolCallContent):
+            texts.extend((content.tool_name, content.args))
+        elif isinstance(content, MessageToolResultContent):
+            texts.append(content.result if isinstance(content.result, str) else to_json(content.result))
+        elif isinstance(content, MessageImageContent):
+            images += 1
+        else:
+            texts.append(to_json(content.model_dump(), sort_keys=False))
+    return texts, images
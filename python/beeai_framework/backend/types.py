@@ -1,17 +1,28 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import copy
 from typing import Any, Generic, Literal, Self, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field, InstanceOf
-
-from beeai_framework.backend.message import AnyMessage, AssistantMessage, MessageToolCallContent
+from pydantic import BaseModel, ConfigDict, Field, InstanceOf, ValidationError
+
+from beeai_framework.backend.errors import ChatModelError
+from beeai_framework.backend.message import (
+    AnyMessage,
+    AssistantMessage,
+    MessageTextContent,
+    MessageToolCallContent,
+    MessageToolCallDeltaContent,
+    Role,
+)
 from beeai_framework.cache.base import BaseCache
 from beeai_framework.tools.tool import AnyTool
 from beeai_framework.utils import AbortSignal
 from beeai_framework.utils.lists import flatten
+from beeai_framework.utils.vectors import EmbeddingArray, EmbeddingDType, to_array
 
 T = TypeVar("T", bound=BaseModel)
+TOutput = TypeVar("TOutput", bound="ChatModelOutput")
 ChatModelToolChoice = AnyTool | Literal["required"] | Literal["none"] | Literal["auto"]
 
 
@@ -33,6 +44,7 @@ class ChatModelStructureInput(ChatModelParameters, Generic[T]):
     messages: list[InstanceOf[AnyMessage]] = Field(..., min_length=1)
     abort_signal: AbortSignal | None = None
     max_retries: int | None = None
+    stream: bool | None = None
 
 
 class ChatModelStructureOutput(BaseModel):
@@ -58,32 +70,30 @@ class ChatModelUsage(BaseModel):
     prompt_tokens: int
     completion_tokens: int
     total_tokens: int
+    # parts of the prompt which were read from or written to the provider's prompt cache
+    cached_prompt_tokens: int = 0
+    cache_creation_prompt_tokens: int = 0
 
 
 class ChatModelOutput(BaseModel):
     messages: list[InstanceOf[AnyMessage]]
     usage: InstanceOf[ChatModelUsage] | None = None
     finish_reason: str | None = None
+    # partial tool calls of a streamed chunk, they are assembled into the assistant message by `from_chunks`
+    tool_call_deltas: list[MessageToolCallDeltaContent] = Field(default_factory=list)
 
     @classmethod
     def from_chunks(cls, chunks: list[Self]) -> Self:
-        final = cls(messages=[])
+        accumulator = ChatModelOutputAccumulator()
         for cur in chunks:
-            final.merge(cur)
-        return final
+            accumulator.add(cur)
+        return accumulator.build(cls)
 
     def merge(self, other: Self) -> None:
         self.messages.extend(other.messages)
+        self.tool_call_deltas.extend(other.tool_call_deltas)
         self.finish_reason = other.finish_reason
-        if self.usage and other.usage:
-            merged_usage = self.usage.model_copy()
-            if other.usage.total_tokens:
-                merged_usage.total_tokens = max(self.usage.total_tokens, other.usage.total_tokens)
-                merged_usage.prompt_tokens = max(self.usage.prompt_tokens, other.usage.prompt_tokens)
-                merged_usage.completion_tokens = max(self.usage.completion_tokens, other.usage.completion_tokens)
-            self.usage = merged_usage
-        elif other.usage:
-            self.usage = other.usage.model_copy()
+        self.usage = _merge_usage(self.usage, other.usage)
 
     def get_tool_calls(self) -> list[MessageToolCallContent]:
         assistant_message = [msg for msg in self.messages if isinstance(msg, AssistantMessage)]
@@ -96,6 +106,154 @@ class ChatModelOutput(BaseModel):
         return "".join([x.text for x in list(filter(lambda x: isinstance(x, AssistantMessage), self.messages))])
 
 
+def _merge_usage(current: ChatModelUsage | None, other: ChatModelUsage | None) -> ChatModelUsage | None:
+    if current and other:
+        merged_usage = current.model_copy()
+        if other.total_tokens:
+            merged_usage.total_tokens = max(current.total_tokens, other.total_tokens)
+            merged_usage.prompt_tokens = max(current.prompt_tokens, other.prompt_tokens)
+            merged_usage.completion_tokens = max(current.completion_tokens, other.completion_tokens)
+            merged_usage.cached_prompt_tokens = max(current.cached_prompt_tokens, other.cached_prompt_tokens)
+            merged_usage.cache_creation_prompt_tokens = max(
+                current.cache_creation_prompt_tokens, other.cache_creation_prompt_tokens
+            )
+        return merged_usage
+    elif other:
+        return other.model_copy()
+    return current
+
+
+class _ToolCallBuffer:
+    def __init__(self, delta: MessageToolCallDeltaContent) -> None:
+        self.index = delta.index
+        self.id = delta.id
+        self.tool_name = delta.tool_name or ""
+        self.args: list[str] = []
+
+    def add(self, delta: MessageToolCallDeltaContent) -> None:
+        self.id = self.id or delta.id
+        if delta.tool_name and not self.tool_name:
+            self.tool_name = delta.tool_name
+        if delta.args:
+            self.args.append(delta.args)
+
+    def build(self) -> MessageToolCallContent:
+        args = "".join(self.args).strip() or "{}"
+        try:
+            return MessageToolCallContent(id=self.id or "dummy_id", tool_name=self.tool_name, args=args)
+        except ValidationError as e:
+            raise ChatModelError(
+                f"Streamed arguments of the tool call '{self.tool_name}' are not a valid JSON.\n"
+                "Try to increase max new tokens for your chat model.",
+                cause=e,
+                context={"tool_name": self.tool_name, "args": args},
+            )
+
+
+class _MessageBuffer:
+    def __init__(self, message: AnyMessage) -> None:
+        self.template = message
+        self.meta: dict[str, Any] = {}
+        self.contents: list[Any] = []
+        self.tool_calls: list[_ToolCallBuffer] = []
+        self._text: list[str] | None = None
+
+    def add(self, message: AnyMessage) -> None:
+        self.meta.update(message.meta)
+        for content in message.content:
+            if isinstance(content, MessageTextContent):
+                if self._text is None:
+                    self._text = []
+                    self.contents.append(self._text)
+                self._text.append(content.text)
+            else:
+                self._append(content)
+
+    def _append(self, content: Any) -> None:
+        # any other part closes the current text run so that the original order of parts is preserved
+        self._text = None
+        self.contents.append(content)
+
+    def add_tool_call_delta(self, delta: MessageToolCallDeltaContent) -> None:
+        target = next(
+            (
+                tool_call
+                for tool_call in reversed(self.tool_calls)
+                if (delta.index is not None and tool_call.index == delta.index)
+                or (delta.index is None and delta.id is not None and tool_call.id == delta.id)
+            ),
+            None,
+        )
+        # some providers reuse the same index for multiple complete tool calls
+        if target is not None and delta.id and target.id and delta.id != target.id:
+            target = None
+        if target is None and delta.index is None and delta.id is None and self.tool_calls:
+            target = self.tool_calls[-1]
+
+        if target is None:
+            target = _ToolCallBuffer(delta)
+            self.tool_calls.append(target)
+            self._append(target)
+        target.add(delta)
+
+    def build(self) -> AnyMessage:
+        message = copy.copy(self.template)
+        message.meta = self.meta
+        message.content = [
+            MessageTextContent(text="".join(content))
+            if isinstance(content, list)
+            else content.build()
+            if isinstance(content, _ToolCallBuffer)
+            else content
+            for content in self.contents
+        ]
+        return message
+
+
+class ChatModelOutputAccumulator:
+    """
+    Incrementally assembles streamed chunks into a single output.
+
+    Instead of keeping every chunk's message, the accumulator keeps exactly one message per role and collects
+    each run of streamed text into a buffer which is joined only once when the output is built.
+    Tool call fragments (`ChatModelOutput.tool_call_deltas`) are grouped by their index and id, and a validated
+    `MessageToolCallContent` is appended to the assistant message only once the arguments are complete
+    (when the output is built).
+    """
+
+    def __init__(self) -> None:
+        self._buffers: dict[str, _MessageBuffer] = {}
+        self.usage: ChatModelUsage | None = None
+        self.finish_reason: str | None = None
+
+    def add(self, chunk: ChatModelOutput) -> None:
+        for message in chunk.messages:
+            key = str(message.role)
+            buffer = self._buffers.get(key)
+            if buffer is None:
+                buffer = self._buffers[key] = _MessageBuffer(message)
+            buffer.add(message)
+
+        if chunk.tool_call_deltas:
+            buffer = self._buffers.get(str(Role.ASSISTANT))
+            if buffer is None:
+                message = AssistantMessage([])
+                buffer = self._buffers[str(Role.ASSISTANT)] = _MessageBuffer(message)
+                buffer.add(message)
+            for delta in chunk.tool_call_deltas:
+                buffer.add_tool_call_delta(delta)
+
+        self.finish_reason = chunk.finish_reason
+        self.usage = _merge_usage(self.usage, chunk.usage)
+
+    def build(self, output_cls: type[TOutput]) -> TOutput:
+        return output_cls(
+            messages=[buffer.build() for buffer in self._buffers.values()],
+            usage=self.usage.model_copy() if self.usage else None,
+            finish_reason=self.finish_reason,
+        )
+
+
 ChatModelCache = BaseCache[list[ChatModelOutput]]
 
 
@@ -109,13 +267,25 @@ class EmbeddingModelInput(BaseModel):
     values: list[str]
     abort_signal: AbortSignal | None = None
     max_retries: int | None = None
+    dtype: EmbeddingDType | None = None
 
 
 class EmbeddingModelOutput(BaseModel):
+    """Embeddings are either lists of floats or, when a `dtype` has been requested, a 2D numpy array."""
+
     values: list[str]
-    embeddings: list[list[float]]
+    embeddings: list[list[float]] | EmbeddingArray
     usage: InstanceOf[EmbeddingModelUsage] | None = None
 
+    def to_list(self) -> list[list[float]]:
+        if isinstance(self.embeddings, list):
+            return self.embeddings
+        embeddings: list[list[float]] = self.embeddings.tolist()
+        return embeddings
+
+    def to_array(self, dtype: EmbeddingDType = "float32") -> EmbeddingArray:
+        return to_array(self.embeddings, dtype)
+
 
 class Document(BaseModel):
     content: str
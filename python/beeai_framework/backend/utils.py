@@ -1,13 +1,16 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import copy
+from functools import lru_cache
 from importlib import import_module
-from typing import Any, Literal, TypeVar, Union
+from typing import Annotated, Any, Literal, NamedTuple, TypeVar, Union
+from weakref import WeakKeyDictionary
 
 import json_repair
 import jsonref  # type: ignore
 from openai.lib._pydantic import to_strict_json_schema
-from pydantic import ConfigDict, Field, RootModel, create_model
+from pydantic import BaseModel, ConfigDict, Field, RootModel, TypeAdapter, ValidationError, create_model
 
 from beeai_framework.backend.constants import (
     BackendProviders,
@@ -18,9 +21,10 @@ from beeai_framework.backend.constants import (
     ProviderModuleDef,
     ProviderName,
 )
-from beeai_framework.backend.errors import BackendError
+from beeai_framework.backend.errors import BackendError, ChatModelStructureError
 from beeai_framework.backend.types import ChatModelToolChoice
 from beeai_framework.tools.tool import AnyTool, Tool
+from beeai_framework.utils.json_stream import JSONPath, JSONStreamParser, JSONType, format_json_path
 
 T = TypeVar("T")
 
@@ -115,10 +119,81 @@ def inline_schema_refs(schema: dict[str, Any], *, force: bool = False) -> dict[s
     return schema
 
 
+class _CompiledToolSpec(NamedTuple):
+    name: str
+    description: str
+    input_schema: type[BaseModel]
+    spec: dict[str, Any]
+
+
+_compiled_tool_specs: WeakKeyDictionary[AnyTool, dict[bool, _CompiledToolSpec]] = WeakKeyDictionary()
+# union schemas are owned by the first tool of the union, so they are released together with the tools,
+# only the most recently used unions are kept for each tool (e.g. the allowed tools change between agent steps)
+_compiled_tool_union_schemas: WeakKeyDictionary[AnyTool, dict[tuple[Any, ...], dict[str, Any]]] = WeakKeyDictionary()
+_MAX_TOOL_UNION_SCHEMAS = 16
+
+
+def to_tool_json_schema(schema: type[BaseModel], *, strict: bool) -> dict[str, Any]:
+    return to_strict_json_schema(schema) if strict else schema.model_json_schema()
+
+
+def get_tool_spec(tool: AnyTool, *, strict: bool) -> dict[str, Any]:
+    """
+    Returns the function-calling spec of the given tool.
+
+    Specs are compiled once per tool and strictness and reused across calls. A spec is recompiled whenever the tool's
+    name, description, or input schema changes. The returned spec is shared and must not be mutated, callers that
+    need to modify it (or hand it over to code that does) must copy it first.
+    """
+
+    input_schema = tool.input_schema
+    compiled = _compiled_tool_specs.get(tool, {}).get(strict)
+    if (
+        compiled is None
+        or compiled.input_schema is not input_schema
+        or compiled.name != tool.name
+        or compiled.description != tool.description
+    ):
+        compiled = _CompiledToolSpec(
+            name=tool.name,
+            description=tool.description,
+            input_schema=input_schema,
+            spec={
+                "type": "function",
+                "function": {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": to_tool_json_schema(input_schema, strict=strict),
+                    "strict": strict,
+                },
+            },
+        )
+        _compiled_tool_specs.setdefault(tool, {})[strict] = compiled
+
+    return compiled.spec
+
+
 def generate_tool_union_schema(tools: list[AnyTool], *, strict: bool) -> dict[str, Any]:
+    """
+    Returns a response format which lets the model pick one of the tools and its input.
+
+    Like tool specs (see `get_tool_spec`), the schema is shared between calls and must not be mutated.
+    """
     if not tools:
         raise ValueError("No tools provided!")
 
+    cache_key = (strict, *((id(tool), tool.name, tool.input_schema) for tool in tools))
+    compiled = _compiled_tool_union_schemas.setdefault(tools[0], {})
+    cached = compiled.pop(cache_key, None)
+    if cached is None:
+        cached = _generate_tool_union_schema(tools, strict=strict)
+        if len(compiled) >= _MAX_TOOL_UNION_SCHEMAS:
+            del compiled[next(iter(compiled))]
+    compiled[cache_key] = cached  # the most recently used schemas come last
+    return cached
+
+
+def _generate_tool_union_schema(tools: list[AnyTool], *, strict: bool) -> dict[str, Any]:
     tool_schemas = [
         create_model(  # type: ignore
             tool.name,
@@ -166,3 +241,172 @@ def filter_tools_by_tool_choice(tools: list[AnyTool], value: ChatModelToolChoice
         return tool
 
     raise RuntimeError(f"Unknown tool choice: {value}")
+
+
+def validate_structure(value: Any, schema: type[BaseModel] | dict[str, Any]) -> dict[str, Any]:
+    """Checks that the generated value matches the expected schema and returns it."""
+    if isinstance(schema, type):
+        try:
+            schema.model_validate(value)
+        except ValidationError as e:
+            raise ChatModelStructureError(f"The response does not match the schema.\n{e}", cause=e) from e
+    elif not isinstance(value, dict):
+        raise ChatModelStructureError("The response is not a JSON object.", context={"received": value})
+    return value  # type: ignore[no-any-return]
+
+
+class StructureStreamParser:
+    """
+    Parses a streamed structured response and checks it against the expected schema as it arrives.
+
+    Unknown keys (where the schema forbids additional properties), values of a wrong type and missing required keys
+    are reported via `ChatModelStructureError` as soon as they appear, so the generation can be stopped early.
+    Completed top-level fields of a Pydantic schema are validated individually and exposed as a partial object.
+    """
+
+    def __init__(self, schema: type[BaseModel] | dict[str, Any]) -> None:
+        self._model = schema if isinstance(schema, type) else None
+        self._json_schema = inline_schema_refs(
+            schema.model_json_schema() if isinstance(schema, type) else copy.deepcopy(schema)
+        )
+        self._parser = JSONStreamParser()
+        self._text: list[str] = []
+        self._fields: dict[str, Any] = {}
+
+    @property
+    def partial(self) -> BaseModel | dict[str, Any]:
+        """Completed top-level fields; a Pydantic schema is constructed without validating the missing ones."""
+        return self._model.model_construct(**self._fields) if self._model is not None else dict(self._fields)
+
+    def feed(self, chunk: str) -> list[str]:
+        """Consumes the next chunk of the response and returns names of the top-level fields it completed."""
+        self._text.append(chunk)
+        try:
+            events = self._parser.feed(chunk)
+        except ValueError as e:
+            raise ChatModelStructureError(f"The response is not a valid JSON. {e}", cause=e) from e
+
+        completed: list[str] = []
+        for event in events:
+            if event.kind == "key":
+                self._check_key(event.path)
+            elif event.kind == "start":
+                assert event.type is not None
+                self._check_type(event.path, event.type)
+            else:
+                self._check_value(event.path, event.value)
+                if len(event.path) == 1 and isinstance(event.path[0], str):
+                    field = self._complete_field(event.path[0], event.value)
+                    if field is not None:
+                        completed.append(field)
+        return completed
+
+    def end(self) -> dict[str, Any]:
+        """Returns the whole object once the response has ended; a truncated response gets repaired first."""
+        value = self._parser.value if self._parser.done else parse_broken_json("".join(self._text))
+        return validate_structure(value, self._model or self._json_schema)
+
+    def _complete_field(self, key: str, value: Any) -> str | None:
+        if self._model is None:
+            self._fields[key] = value
+            return key
+
+        name, adapter = _get_field_adapters(self._model).get(key, (key, None))
+        if adapter is None and self._model.model_config.get("extra") != "allow":
+            return None
+
+        try:
+            self._fields[name] = adapter.validate_python(value) if adapter is not None else value
+        except ValidationError as e:
+            raise self._violation((key,), f"Invalid value.\n{e}", cause=e) from e
+        return name
+
+    def _check_key(self, path: JSONPath) -> None:
+        schema = self._resolve(path[:-1])
+        if schema is None or "properties" not in schema or path[-1] in schema["properties"]:
+            return
+
+        # Pydantic only emits `additionalProperties: false` for models with `extra="forbid"`
+        if schema.get("additionalProperties") is False and not schema.get("patternProperties"):
+            raise self._violation(path, "Unknown key.")
+
+    def _check_type(self, path: JSONPath, value_type: JSONType) -> None:
+        allowed = _get_allowed_json_types(self._resolve(path))
+        if allowed is None or value_type in allowed or (value_type == "number" and "integer" in allowed):
+            return
+
+        raise self._violation(path, f"Expected {' or '.join(sorted(allowed))}, got {value_type}.")
+
+    def _check_value(self, path: JSONPath, value: Any) -> None:
+        schema = self._resolve(path)
+        if schema is None:
+            return
+
+        allowed = _get_allowed_json_types(schema)
+        if allowed is not None and "number" not in allowed and isinstance(value, float) and not value.is_integer():
+            raise self._violation(path, f"Expected integer, got {value}.")
+        if "enum" in schema and value not in schema["enum"]:
+            raise self._violation(path, f"Expected one of {schema['enum']}, got {value!r}.")
+        if isinstance(value, dict) and (missing := [k for k in schema.get("required", []) if k not in value]):
+            raise self._violation(path, f"Missing required keys: {', '.join(missing)}.")
+
+    def _resolve(self, path: JSONPath) -> dict[str, Any] | None:
+        schema: dict[str, Any] | None = _narrow_json_schema(self._json_schema)
+        for segment in path:
+            if schema is None:
+                return None
+            elif isinstance(segment, int):
+                items = schema.get("items")
+                schema = _narrow_json_schema(items) if isinstance(items, dict) else None
+            elif segment in schema.get("properties", {}):
+                schema = _narrow_json_schema(schema["properties"][segment])
+            else:
+                additional = schema.get("additionalProperties")
+                schema = _narrow_json_schema(additional) if isinstance(additional, dict) else None
+        return schema
+
+    @staticmethod
+    def _violation(path: JSONPath, message: str, *, cause: Exception | None = None) -> ChatModelStructureError:
+        location = format_json_path(path)
+        return ChatModelStructureError(
+            f"The response does not match the schema at '{location}'. {message}",
+            cause=cause,
+            context={"path": location},
+        )
+
+
+def _narrow_json_schema(schema: dict[str, Any]) -> dict[str, Any] | None:
+    """Unwraps optional values (`anyOf` with `null`); other combinations cannot be followed while streaming."""
+    variants = schema.get("anyOf") or schema.get("oneOf")
+    if variants is None:
+        return None if "allOf" in schema else schema
+
+    non_null = [v for v in variants if v.get("type") != "null"]
+    return _narrow_json_schema(non_null[0]) if len(non_null) == 1 else None
+
+
+def _get_allowed_json_types(schema: dict[str, Any] | None) -> set[str] | None:
+    if schema is None:
+        return None
+    if "type" in schema:
+        return {schema["type"]} if isinstance(schema["type"], str) else set(schema["type"])
+    if "anyOf" in schema or "oneOf" in schema:
+        allowed: set[str] = set()
+        for variant in schema.get("anyOf") or schema.get("oneOf") or []:
+            variant_types = _get_allowed_json_types(variant)
+            if variant_types is None:
+                return None
+            allowed.update(variant_types)
+        return allowed
+    return None
+
+
+@lru_cache(maxsize=128)
+def _get_field_adapters(model: type[BaseModel]) -> dict[str, tuple[str, TypeAdapter[Any]]]:
+    return {
+        (field.alias or name): (
+            name,
+            TypeAdapter(Annotated[field.annotation, *field.metadata] if field.metadata else field.annotation),
+        )
+        for name, field in model.model_fields.items()
+    }
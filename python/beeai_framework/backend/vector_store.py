@@ -3,10 +3,14 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any, Protocol
 
 from beeai_framework.backend.embedding import EmbeddingModel
+from beeai_framework.backend.metadata_filter import MetadataFilterLike
 from beeai_framework.backend.types import Document, DocumentWithScore
 from beeai_framework.backend.utils import load_module, parse_module
 
@@ -15,7 +19,7 @@ class QueryLike(Protocol):
     def __str__(self) -> str: ...
 
 
-__all__ = ["QueryLike", "VectorStore"]
+__all__ = ["QueryLike", "VectorStore", "hash_document"]
 
 
 class VectorStore(ABC):
@@ -67,5 +71,37 @@ class VectorStore(ABC):
         raise NotImplementedError("Implement me")
 
     @abstractmethod
-    async def search(self, query: QueryLike, k: int = 4, **kwargs: Any) -> list[DocumentWithScore]:
+    async def search(
+        self, query: QueryLike, k: int = 4, *, filter: MetadataFilterLike | None = None, **kwargs: Any
+    ) -> list[DocumentWithScore]:
+        """
+        Returns the `k` documents most similar to the query.
+
+        Only documents whose metadata match the `filter` are considered, see `MetadataFilter`.
+        """
         raise NotImplementedError("Implement me")
+
+    async def upsert(self, documents: list[Document], ids: Sequence[str] | None = None) -> list[str]:
+        """
+        Adds documents or replaces the stored documents with the same ids.
+
+        Without `ids`, the ids are hashes of the documents (see `hash_document`),
+        so upserting the same documents again does not create duplicates.
+        Stores which don't override this method don't support upserts.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support upserts, use 'add_documents' instead.")
+
+    async def delete(self, ids: Sequence[str] | None = None, *, filter: MetadataFilterLike | None = None) -> None:
+        """
+        Deletes documents with the given ids or documents matching the filter.
+
+        When both are given, only documents with the given ids which match the filter are deleted.
+        Stores which don't override this method don't support deletions.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support deletions.")
+
+
+def hash_document(document: Document) -> str:
+    """Returns a hash of the document content and metadata, equal documents have equal hashes."""
+    data = json.dumps([document.content, document.metadata], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode()).hexdigest()
@@ -109,10 +109,14 @@ class Run(Generic[R]):
         tasks = self._tasks[:]
         self._tasks.clear()
 
-        for fn, params in tasks:
-            await ensure_async(fn)(*params)
-
         try:
+            try:
+                for fn, params in tasks:
+                    await ensure_async(fn)(*params)
+            except BaseException:
+                self._run_context.destroy()
+                raise
+
             return await self.handler()
         finally:
             await self._events.put(None)
@@ -190,7 +194,6 @@ class RunContext:
             output: R | None = None
 
             start_event = RunContextStartEvent(input=context.run_params, output=output)
-            await emitter.emit("start", start_event)
 
             async def _context_storage_run() -> R:
                 storage.set(context)
@@ -212,10 +215,11 @@ class RunContext:
                 finally:
                     context.signal.remove_event_listener(_on_abort)
 
-            runner_task = asyncio.create_task(_context_storage_run(), name="run-task")
-            abort_task = asyncio.create_task(_context_signal_aborted(), name="abort-task")
-
             try:
+                await emitter.emit("start", start_event)
+
+                runner_task = asyncio.create_task(_context_storage_run(), name="run-task")
+                abort_task = asyncio.create_task(_context_signal_aborted(), name="abort-task")
                 done, pending = await asyncio.wait(
                     [runner_task, abort_task],
                     return_when=asyncio.FIRST_COMPLETED,
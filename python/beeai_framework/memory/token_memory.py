@@ -5,6 +5,7 @@ from math import ceil
 from typing import Any
 
 from beeai_framework.backend.message import AnyMessage
+from beeai_framework.backend.tokenizer import Tokenizer
 from beeai_framework.memory.base_memory import BaseMemory
 
 
@@ -17,7 +18,11 @@ def simple_tokenize(msgs: list[AnyMessage]) -> int:
 
 
 class TokenMemory(BaseMemory):
-    """Memory implementation that respects token limits."""
+    """
+    Memory implementation that respects token limits.
+
+    Tokens are counted by the LLM's tokenizer (if it has one), otherwise they are estimated from the text length.
+    """
 
     def __init__(
         self,
@@ -34,8 +39,14 @@ class TokenMemory(BaseMemory):
         self._sync_threshold = sync_threshold
         self._tokens_by_message: dict[str, Any] = {}
 
+        tokenizer: Tokenizer | None = getattr(llm, "tokenizer", None)
+        default_tokenize = (
+            (lambda msgs: sum(map(tokenizer.count_message, msgs)))
+            if isinstance(tokenizer, Tokenizer)
+            else simple_tokenize
+        )
         self._handlers = {
-            "tokenize": (handlers.get("tokenize", simple_tokenize) if handlers else simple_tokenize),
+            "tokenize": (handlers.get("tokenize", default_tokenize) if handlers else default_tokenize),
             "estimate": (handlers.get("estimate", self._default_estimate) if handlers else self._default_estimate),
             "removal_selector": (
                 handlers.get("removal_selector", lambda msgs: msgs[0]) if handlers else lambda msgs: msgs[0]
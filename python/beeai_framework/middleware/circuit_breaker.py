@@ -0,0 +1,228 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import time
+from collections import deque
+from collections.abc import Callable
+from enum import StrEnum
+from functools import cached_property
+from typing import Any
+
+from pydantic import BaseModel
+
+from beeai_framework.context import RunContext, RunContextFinishEvent, RunContextStartEvent, RunMiddlewareProtocol
+from beeai_framework.emitter import Emitter, EventMeta
+from beeai_framework.errors import AbortError, FrameworkError
+from beeai_framework.logger import Logger
+
+logger = Logger(__name__)
+
+
+class CircuitBreakerState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreakerOpenError(FrameworkError):
+    """Raised when a call is rejected because the circuit is open."""
+
+    def __init__(
+        self,
+        message: str = "Circuit breaker is open",
+        *,
+        cause: BaseException | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(message, is_fatal=False, is_retryable=False, cause=cause, context=context)
+
+
+class CircuitBreakerStateChangeEvent(BaseModel):
+    previous: CircuitBreakerState
+    current: CircuitBreakerState
+    failure_rate: float
+    reason: str
+
+
+circuit_breaker_event_types: dict[str, type] = {
+    "state_change": CircuitBreakerStateChangeEvent,
+}
+
+
+def _default_is_failure(error: FrameworkError) -> bool:
+    return not isinstance(error, AbortError | CircuitBreakerOpenError)
+
+
+class CircuitBreakerMiddleware(RunMiddlewareProtocol):
+    """
+    Fails fast when the wrapped ChatModel, EmbeddingModel or Tool keeps failing or responding too slowly.
+
+    The breaker tracks the outcome of the last `window_size` calls. Once at least `minimum_calls` were recorded
+    and the ratio of failed (or slower than `latency_threshold` seconds) calls reaches `failure_rate_threshold`,
+    the circuit opens and every subsequent call is rejected with `CircuitBreakerOpenError` without touching
+    the provider. After `reset_timeout` seconds, up to `half_open_max_calls` probe calls are let through;
+    the circuit closes once `success_threshold` probes succeed and re-opens on the first failed probe.
+
+    A single instance can be shared by multiple targets, which then share one circuit.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = 0.5,
+        latency_threshold: float | None = None,
+        window_size: int = 20,
+        minimum_calls: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        is_failure: Callable[[FrameworkError], bool] | None = None,
+    ) -> None:
+        super().__init__()
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("'failure_rate_threshold' must be a number in range (0, 1]")
+        if minimum_calls < 1 or window_size < minimum_calls:
+            raise ValueError("'window_size' must be greater than or equal to 'minimum_calls' (at least 1)")
+        if half_open_max_calls < 1 or success_threshold < 1:
+            raise ValueError("'half_open_max_calls' and 'success_threshold' must be positive")
+
+        self.failure_rate_threshold = failure_rate_threshold
+        self.latency_threshold = latency_threshold
+        self.minimum_calls = minimum_calls
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self._is_failure = is_failure or _default_is_failure
+
+        self._state = CircuitBreakerState.CLOSED
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._opened_at: float = 0
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+        self._pending_events: list[tuple[str, Any]] = []
+
+    @cached_property
+    def emitter(self) -> Emitter:
+        return Emitter.root().child(
+            namespace=["middleware", "circuit_breaker"],
+            creator=self,
+            events=circuit_breaker_event_types,
+        )
+
+    @property
+    def state(self) -> CircuitBreakerState:
+        self._refresh_state()
+        return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        return (self._outcomes.count(False) / len(self._outcomes)) if self._outcomes else 0.0
+
+    def reset(self) -> None:
+        """Force the circuit back to the closed state and forget all recorded outcomes."""
+        self._transition(CircuitBreakerState.CLOSED, reason="Manual reset.")
+        self._outcomes.clear()
+
+    def bind(self, ctx: RunContext) -> None:
+        self._refresh_state()
+        if self._state == CircuitBreakerState.OPEN or (
+            self._state == CircuitBreakerState.HALF_OPEN and self._half_open_in_flight >= self.half_open_max_calls
+        ):
+            state = self._state
+            target = type(ctx.instance).__name__
+            ctx.destroy()
+            raise CircuitBreakerOpenError(
+                f"Circuit breaker is {state}. The call to '{target}' has been rejected.",
+                context={"state": state.value, "target": target},
+            )
+
+        is_probe = self._state == CircuitBreakerState.HALF_OPEN
+        if is_probe:
+            self._half_open_in_flight += 1
+
+        released = not is_probe
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                ctx.signal.remove_event_listener(release)
+
+        # the context gets destroyed whenever the run ends, including when it fails before the handler is reached
+        ctx.signal.add_event_listener(release)
+        started_at = time.monotonic()
+
+        async def on_start(_: RunContextStartEvent, __: EventMeta) -> None:
+            nonlocal started_at
+            started_at = time.monotonic()
+            await self._flush_events()
+
+        async def on_finish(data: RunContextFinishEvent, _: EventMeta) -> None:
+            duration = time.monotonic() - started_at
+            try:
+                self._record(data.error, duration, is_probe=is_probe)
+            finally:
+                release()
+            await self._flush_events()
+
+        ctx.emitter.match(lambda e: e.name == "start" and bool(e.context.get("internal")), on_start)
+        ctx.emitter.match(lambda e: e.name == "finish" and bool(e.context.get("internal")), on_finish)
+
+    def _record(self, error: FrameworkError | None, duration: float, *, is_probe: bool) -> None:
+        is_slow = self.latency_threshold is not None and duration > self.latency_threshold
+        if error is not None and not self._is_failure(error):
+            return
+
+        success = error is None and not is_slow
+        if self._state == CircuitBreakerState.HALF_OPEN:
+            if not success:
+                self._transition(CircuitBreakerState.OPEN, reason="Probe call has failed.")
+            else:
+                self._half_open_successes += 1
+                if self._half_open_successes >= self.success_threshold:
+                    self._outcomes.clear()
+                    self._transition(CircuitBreakerState.CLOSED, reason="Probe calls have succeeded.")
+            return
+
+        if self._state == CircuitBreakerState.OPEN:
+            return
+
+        self._outcomes.append(success)
+        if len(self._outcomes) >= self.minimum_calls and self.failure_rate >= self.failure_rate_threshold:
+            self._transition(
+                CircuitBreakerState.OPEN,
+                reason=f"Failure rate {self.failure_rate:.2f} reached the threshold {self.failure_rate_threshold}.",
+            )
+
+    def _refresh_state(self) -> None:
+        if self._state == CircuitBreakerState.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._transition(CircuitBreakerState.HALF_OPEN, reason="Reset timeout has elapsed.")
+
+    def _transition(self, target: CircuitBreakerState, *, reason: str) -> None:
+        previous = self._state
+        if previous == target:
+            return
+
+        self._state = target
+        if target == CircuitBreakerState.OPEN:
+            self._opened_at = time.monotonic()
+        if target != CircuitBreakerState.CLOSED:
+            self._half_open_successes = 0
+            self._half_open_in_flight = 0
+
+        logger.debug(f"Circuit breaker state has changed from '{previous}' to '{target}'. {reason}")
+        self._pending_events.append(
+            (
+                "state_change",
+                CircuitBreakerStateChangeEvent(
+                    previous=previous, current=target, failure_rate=self.failure_rate, reason=reason
+                ),
+            )
+        )
+
+    async def _flush_events(self) -> None:
+        events, self._pending_events = self._pending_events, []
+
+        for name, value in events:
+            await self.emitter.emit(name, value)
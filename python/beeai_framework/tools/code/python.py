@@ -18,6 +18,7 @@ from beeai_framework.tools.code.output import PythonToolOutput
 from beeai_framework.tools.code.storage import PythonFile, PythonStorage
 from beeai_framework.tools.tool import Tool
 from beeai_framework.tools.types import ToolRunOptions
+from beeai_framework.utils.http import HTTPTransport
 
 logger = Logger(__name__)
 
@@ -141,12 +142,12 @@ Do not use this tool multiple times in a row, always write the full code you wan
     @staticmethod
     async def call_code_interpreter(url: str, body: dict[str, Any]) -> Any:
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url, headers={"Accept": "application/json", "Content-Type": "application/json"}, json=body
-                )
-                response.raise_for_status()
-                return response.json()
+            client = HTTPTransport.root().get_client(url)
+            response = await client.post(
+                url, headers={"Accept": "application/json", "Content-Type": "application/json"}, json=body
+            )
+            response.raise_for_status()
+            return response.json()
         except httpx.HTTPStatusError as err:
             raise ToolError.ensure(
                 err, message=f"Request to code interpreter has failed with HTTP status code {response.status_code}."
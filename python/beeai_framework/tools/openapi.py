@@ -12,6 +12,7 @@ from beeai_framework.context import RunContext
 from beeai_framework.emitter import Emitter
 from beeai_framework.tools import StringToolOutput, Tool, ToolError, ToolRunOptions
 from beeai_framework.utils import JSONSchemaModel
+from beeai_framework.utils.http import HTTPTransport
 from beeai_framework.utils.strings import to_safe_word
 
 
@@ -184,15 +185,15 @@ class OpenAPITool(Tool[BaseModel, ToolRunOptions, OpenAPIToolOutput]):
 
         await self.emitter.emit("before_fetch", BeforeFetchEvent(url=str(url), input=input_dict))
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.request(
-                    method=input_dict["method"],
-                    url=str(url),
-                    headers={"Accept": "application/json"}.update(self.headers),
-                    data=input_dict.get("body"),
-                )
-                output = OpenAPIToolOutput(response.status_code, response.text)
-                await self.emitter.emit("after_fetch", AfterFetchEvent(url=str(url), data=output))
-                return output
+            client = HTTPTransport.root().get_client(str(url))
+            response = await client.request(
+                method=input_dict["method"],
+                url=str(url),
+                headers={"Accept": "application/json"}.update(self.headers),
+                data=input_dict.get("body"),
+            )
+            output = OpenAPIToolOutput(response.status_code, response.text)
+            await self.emitter.emit("after_fetch", AfterFetchEvent(url=str(url), data=output))
+            return output
         except httpx.HTTPError as err:
             raise ToolError(f"Request to {url} has failed.", cause=err)
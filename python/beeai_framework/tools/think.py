@@ -16,6 +16,7 @@ class ThinkSchema(BaseModel):
 class ThinkTool(Tool[ThinkSchema]):
     name = "think"
     description = "Use when you want to think through a problem, clarify your assumptions, or break down complex steps before acting or responding."  # noqa: E501
+    side_effect_free = True
 
     def __init__(self, *, extra_instructions: str = "") -> None:
         super().__init__()
@@ -37,6 +37,9 @@ TOutput = TypeVar("TOutput", bound=ToolOutput, default=ToolOutput)
 
 
 class Tool(Generic[TInput, TRunOptions, TOutput], ABC):
+    # tools which only read data (search, lookups, ...) can be safely executed speculatively or repeatedly
+    side_effect_free: bool = False
+
     def __init__(self, options: dict[str, Any] | None = None) -> None:
         self._options: dict[str, Any] | None = options or None
         self._cache = self.options.get("cache", NullCache[TOutput]()) if self.options else NullCache[TOutput]()
@@ -222,6 +225,7 @@ def tool(
     input_schema: type[BaseModel] | None = ...,
     with_context: bool = False,
     emitter: Emitter | None = None,
+    side_effect_free: bool = False,
 ) -> AnyTool: ...
 @typing.overload
 def tool(
@@ -231,6 +235,7 @@ def tool(
     input_schema: type[BaseModel] | None = ...,
     with_context: bool = False,
     emitter: Emitter | None = None,
+    side_effect_free: bool = False,
 ) -> Callable[[TFunction], AnyTool]: ...
 def tool(
     tool_function: TFunction | None = None,
@@ -241,6 +246,7 @@ def tool(
     input_schema: type[BaseModel] | None = None,
     with_context: bool = False,
     emitter: Emitter | None = None,
+    side_effect_free: bool = False,
 ) -> AnyTool | Callable[[TFunction], AnyTool]:
     def create_tool(fn: TFunction) -> AnyTool:
         tool_name = name or fn.__name__
@@ -257,6 +263,7 @@ def tool(
 
             def __init__(self, options: dict[str, Any] | None = None) -> None:
                 super().__init__(options)
+                self.side_effect_free = side_effect_free
 
             def _create_emitter(self) -> Emitter:
                 if emitter is not None:
@@ -6,7 +6,6 @@ from datetime import UTC, date, datetime
 from typing import Any, Literal
 from urllib.parse import urlencode
 
-import httpx
 from pydantic import BaseModel, Field, field_validator
 
 from beeai_framework.context import RunContext
@@ -16,6 +15,7 @@ from beeai_framework.tools import JSONToolOutput
 from beeai_framework.tools.errors import ToolInputValidationError
 from beeai_framework.tools.tool import Tool
 from beeai_framework.tools.types import ToolRunOptions
+from beeai_framework.utils.http import HTTPTransport
 
 logger = Logger(__name__)
 
@@ -45,6 +45,7 @@ class OpenMeteoToolInput(BaseModel):
 class OpenMeteoTool(Tool[OpenMeteoToolInput, ToolRunOptions, JSONToolOutput[dict[str, Any]]]):
     name = "OpenMeteoTool"
     description = "Retrieve current, past, or future weather forecasts for a location."
+    side_effect_free = True
     input_schema = OpenMeteoToolInput
 
     def __init__(self, options: dict[str, Any] | None = None) -> None:
@@ -65,18 +66,16 @@ class OpenMeteoTool(Tool[OpenMeteoToolInput, ToolRunOptions, JSONToolOutput[dict
 
         encoded_params = urlencode(params, doseq=True)
 
-        async with httpx.AsyncClient(proxy=os.environ.get("BEEAI_OPEN_METEO_TOOL_PROXY")) as client:
-            response = await client.get(
-                f"https://geocoding-api.open-meteo.com/v1/search?{encoded_params}",
-                headers={"Content-Type": "application/json", "Accept": "application/json"},
-            )
+        url = f"https://geocoding-api.open-meteo.com/v1/search?{encoded_params}"
+        client = HTTPTransport.root().get_client(url, proxy=os.environ.get("BEEAI_OPEN_METEO_TOOL_PROXY"))
+        response = await client.get(url, headers={"Content-Type": "application/json", "Accept": "application/json"})
 
-            response.raise_for_status()
-            results = response.json().get("results", [])
-            if not results:
-                raise ToolInputValidationError(f"Location '{input.location_name}' was not found.")
-            geocode: dict[str, str] = results[0]
-            return geocode
+        response.raise_for_status()
+        results = response.json().get("results", [])
+        if not results:
+            raise ToolInputValidationError(f"Location '{input.location_name}' was not found.")
+        geocode: dict[str, str] = results[0]
+        return geocode
 
     async def get_params(self, input: OpenMeteoToolInput) -> dict[str, Any]:
         params = {
@@ -107,10 +106,8 @@ class OpenMeteoTool(Tool[OpenMeteoToolInput, ToolRunOptions, JSONToolOutput[dict
         params = urlencode(await self.get_params(input), doseq=True)
         logger.debug(f"Using OpenMeteo URL: https://api.open-meteo.com/v1/forecast?{params}")
 
-        async with httpx.AsyncClient(proxy=os.environ.get("BEEAI_OPEN_METEO_TOOL_PROXY")) as client:
-            response = await client.get(
-                f"https://api.open-meteo.com/v1/forecast?{params}",
-                headers={"Content-Type": "application/json", "Accept": "application/json"},
-            )
-            response.raise_for_status()
-            return JSONToolOutput(response.json())
+        url = f"https://api.open-meteo.com/v1/forecast?{params}"
+        client = HTTPTransport.root().get_client(url, proxy=os.environ.get("BEEAI_OPEN_METEO_TOOL_PROXY"))
+        response = await client.get(url, headers={"Content-Type": "application/json", "Accept": "application/json"})
+        response.raise_for_status()
+        return JSONToolOutput(response.json())
@@ -0,0 +1,106 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from typing import ClassVar, Self
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
+
+import httpx
+from pydantic import BaseModel, ConfigDict
+
+
+class HTTPTransportConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 30.0
+    http2: bool = False
+    timeout: float | None = 5.0
+    connect_timeout: float | None = 5.0
+    retries: int = 0
+    follow_redirects: bool = False
+
+
+_ClientKey = tuple[str, str | None, HTTPTransportConfig]
+
+
+class HTTPTransport:
+    """
+    Registry of pooled `httpx.AsyncClient` instances, one per origin (scheme, host, port), proxy and configuration.
+
+    Reusing a client keeps connections alive between requests, so TLS handshakes are not repeated on the hot path
+    and the number of open sockets is capped by the configured pool limits. Limits can be set globally or per origin.
+    Clients are bound to the event loop they were created in; every running loop gets its own set.
+    """
+
+    _root: ClassVar[Self | None] = None
+
+    def __init__(self, config: HTTPTransportConfig | None = None) -> None:
+        self.config = config or HTTPTransportConfig()
+        self._configs: dict[str, HTTPTransportConfig] = {}
+        self._clients: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_ClientKey, httpx.AsyncClient]] = (
+            WeakKeyDictionary()
+        )
+
+    @classmethod
+    def root(cls) -> Self:
+        if cls._root is None:
+            cls._root = cls()
+        return cls._root
+
+    def configure(self, base_url: str, config: HTTPTransportConfig) -> None:
+        """Sets pool limits for the given origin; clients created before the change are left untouched."""
+        self._configs[self._to_origin(base_url)] = config
+
+    def get_config(self, url: str | None = None) -> HTTPTransportConfig:
+        """Returns the configuration which applies to the origin of the given URL."""
+        return self._configs.get(self._to_origin(url), self.config) if url else self.config
+
+    def get_client(
+        self, url: str | None = None, *, proxy: str | None = None, config: HTTPTransportConfig | None = None
+    ) -> httpx.AsyncClient:
+        """
+        Returns a shared client for the origin of the given URL (any absolute URL can still be requested).
+
+        The `config` overrides the configuration of the origin; clients with different configurations are not shared.
+        """
+        origin = self._to_origin(url) if url else "*"
+        config = config or self.get_config(url)
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get((origin, proxy, config))
+        if client is None or client.is_closed:
+            client = clients[(origin, proxy, config)] = self._create_client(config, proxy=proxy)
+        return client
+
+    async def aclose(self) -> None:
+        """Closes all clients that belong to the running event loop."""
+        clients = self._clients.pop(asyncio.get_running_loop(), {})
+        await asyncio.gather(*(client.aclose() for client in clients.values()))
+
+    @staticmethod
+    def _create_client(config: HTTPTransportConfig, *, proxy: str | None) -> httpx.AsyncClient:
+        if config.http2:
+            try:
+                import h2  # noqa: F401
+            except ModuleNotFoundError as e:
+                raise ModuleNotFoundError(
+                    "Optional module [http2] not found.\nRun 'pip install \"beeai-framework[http2]\"' to install."
+                ) from e
+
+        limits = httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        )
+        return httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(limits=limits, http2=config.http2, retries=config.retries, proxy=proxy),
+            timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+            follow_redirects=config.follow_redirects,
+        )
+
+    @staticmethod
+    def _to_origin(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower() if parts.netloc else url
@@ -0,0 +1,214 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+JSONPath = tuple[str | int, ...]
+JSONType = Literal["object", "array", "string", "number", "boolean", "null"]
+
+_WHITESPACE = frozenset(" \t\r\n")
+_LITERAL_CHARS = frozenset("0123456789+-.eEtrufalsn")
+
+
+def format_json_path(path: JSONPath) -> str:
+    return "$" + "".join(f"[{p}]" if isinstance(p, int) else f".{p}" for p in path)
+
+
+@dataclass(frozen=True)
+class JSONStreamEvent:
+    """
+    A single parsing step.
+
+    `key` is emitted once an object key is read (before its value), `start` when a value begins
+    (its type is already known at that moment) and `end` when the value is complete.
+    """
+
+    kind: Literal["key", "start", "end"]
+    path: JSONPath
+    type: JSONType | None = None
+    value: Any = None
+
+
+@dataclass
+class _Frame:
+    container: dict[str, Any] | list[Any]
+    path: JSONPath
+    state: Literal["key", "colon", "value", "comma"]
+    key: str | None = None
+
+
+@dataclass
+class _Token:
+    kind: Literal["key", "string", "literal"]
+    path: JSONPath
+    parts: list[str] = field(default_factory=list)
+    escape: bool = False
+
+
+class JSONStreamParser:
+    """
+    Incrementally parses a single JSON object or array fed in arbitrary chunks.
+
+    Any text preceding the document (for example a Markdown code fence) and any text following it is ignored.
+    Containers are attached to the partial `value` as soon as they start, scalars once they are complete.
+    """
+
+    def __init__(self) -> None:
+        self._stack: list[_Frame] = []
+        self._token: _Token | None = None
+        self._root: Any = None
+        self._started = False
+        self._done = False
+
+    @property
+    def value(self) -> Any:
+        return self._root
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def feed(self, chunk: str) -> list[JSONStreamEvent]:
+        events: list[JSONStreamEvent] = []
+        i, n = 0, len(chunk)
+        while i < n and not self._done:
+            token = self._token
+            if token is not None and token.kind != "literal":
+                i = self._read_string(token, chunk, i, events)
+                continue
+
+            char = chunk[i]
+            if token is not None:
+                if char in _LITERAL_CHARS:
+                    token.parts.append(char)
+                    i += 1
+                    continue
+                self._token = None
+                self._complete(self._parse_literal(token), token.path, events)
+                continue
+
+            i += 1
+            if char in _WHITESPACE:
+                continue
+
+            if not self._started:
+                if char in "{[":
+                    self._started = True
+                    self._start_container(char, (), events)
+                continue
+
+            self._consume(char, events)
+
+        return events
+
+    def _consume(self, char: str, events: list[JSONStreamEvent]) -> None:
+        frame = self._stack[-1]
+        if frame.state == "key":
+            if char == '"':
+                self._token = _Token(kind="key", path=frame.path)
+            elif char == "}" and isinstance(frame.container, dict) and not frame.container:
+                self._end_container(events)
+            else:
+                raise ValueError(f"Expected an object key at {format_json_path(frame.path)}, got {char!r}.")
+        elif frame.state == "colon":
+            if char != ":":
+                raise ValueError(f"Expected ':' at {format_json_path(frame.path)}, got {char!r}.")
+            frame.state = "value"
+        elif frame.state == "value":
+            if char == "]" and isinstance(frame.container, list) and not frame.container:
+                self._end_container(events)
+                return
+
+            segment = frame.key if isinstance(frame.container, dict) else len(frame.container)
+            assert segment is not None
+            path: JSONPath = (*frame.path, segment)
+            if char in "{[":
+                self._start_container(char, path, events)
+            elif char == '"':
+                events.append(JSONStreamEvent(kind="start", path=path, type="string"))
+                self._token = _Token(kind="string", path=path)
+            elif char in _LITERAL_CHARS:
+                value_type: JSONType = "boolean" if char in "tf" else "null" if char == "n" else "number"
+                events.append(JSONStreamEvent(kind="start", path=path, type=value_type))
+                self._token = _Token(kind="literal", path=path, parts=[char])
+            else:
+                raise ValueError(f"Unexpected character {char!r} at {format_json_path(path)}.")
+        elif char == ",":
+            frame.state = "key" if isinstance(frame.container, dict) else "value"
+        elif char == ("}" if isinstance(frame.container, dict) else "]"):
+            self._end_container(events)
+        else:
+            raise ValueError(f"Expected ',' or the end of the container at {format_json_path(frame.path)}.")
+
+    def _read_string(self, token: _Token, chunk: str, i: int, events: list[JSONStreamEvent]) -> int:
+        n = len(chunk)
+        while i < n:
+            if token.escape:
+                token.parts.append(chunk[i])
+                token.escape = False
+                i += 1
+                continue
+
+            quote, backslash = chunk.find('"', i), chunk.find("\\", i)
+            if backslash != -1 and (quote == -1 or backslash < quote):
+                token.parts.append(chunk[i : backslash + 1])
+                token.escape = True
+                i = backslash + 1
+            elif quote != -1:
+                token.parts.append(chunk[i:quote])
+                self._token = None
+                value: str = json.loads(f'"{"".join(token.parts)}"')
+                if token.kind == "key":
+                    frame = self._stack[-1]
+                    frame.key = value
+                    frame.state = "colon"
+                    events.append(JSONStreamEvent(kind="key", path=(*frame.path, value)))
+                else:
+                    self._complete(value, token.path, events)
+                return quote + 1
+            else:
+                token.parts.append(chunk[i:])
+                return n
+        return n
+
+    def _parse_literal(self, token: _Token) -> Any:
+        raw = "".join(token.parts)
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid literal {raw!r} at {format_json_path(token.path)}.") from e
+
+    def _start_container(self, char: str, path: JSONPath, events: list[JSONStreamEvent]) -> None:
+        container: dict[str, Any] | list[Any] = {} if char == "{" else []
+        events.append(JSONStreamEvent(kind="start", path=path, type="object" if char == "{" else "array"))
+        self._attach(container)
+        self._stack.append(_Frame(container=container, path=path, state="key" if char == "{" else "value"))
+
+    def _end_container(self, events: list[JSONStreamEvent]) -> None:
+        frame = self._stack.pop()
+        self._finish(frame.container, frame.path, events)
+
+    def _complete(self, value: Any, path: JSONPath, events: list[JSONStreamEvent]) -> None:
+        self._attach(value)
+        self._finish(value, path, events)
+
+    def _attach(self, value: Any) -> None:
+        if not self._stack:
+            self._root = value
+            return
+
+        frame = self._stack[-1]
+        if isinstance(frame.container, dict):
+            assert frame.key is not None
+            frame.container[frame.key] = value
+        else:
+            frame.container.append(value)
+
+    def _finish(self, value: Any, path: JSONPath, events: list[JSONStreamEvent]) -> None:
+        events.append(JSONStreamEvent(kind="end", path=path, value=value))
+        if self._stack:
+            self._stack[-1].state = "comma"
+        else:
+            self._done = True
@@ -0,0 +1,122 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import base64
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias, TypeGuard
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    EmbeddingArray: TypeAlias = npt.NDArray[np.floating[Any]]
+else:
+    EmbeddingArray: TypeAlias = Any
+
+EmbeddingDType = Literal["float32", "float16"]
+
+__all__ = [
+    "EmbeddingArray",
+    "EmbeddingDType",
+    "cosine_similarity",
+    "decode_embedding",
+    "dot",
+    "import_numpy",
+    "is_array",
+    "normalize",
+    "to_array",
+    "top_k",
+]
+
+
+def import_numpy() -> Any:
+    try:
+        import numpy
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(
+            "Optional module [numpy] not found.\nRun 'pip install \"beeai-framework[numpy]\"' to install."
+        ) from e
+    return numpy
+
+
+def is_array(value: object) -> TypeGuard[EmbeddingArray]:
+    """Checks whether the value is a numpy array without importing numpy."""
+    return type(value).__module__ == "numpy" and type(value).__name__ == "ndarray"
+
+
+def to_array(
+    embeddings: "Sequence[Sequence[float]] | EmbeddingArray", dtype: EmbeddingDType = "float32"
+) -> EmbeddingArray:
+    """Returns embeddings as a C-contiguous 2D array of the given type, existing arrays are not copied if possible."""
+    np = import_numpy()
+    array: EmbeddingArray = np.ascontiguousarray(embeddings, dtype=dtype)
+    if array.ndim == 1 and array.size == 0:
+        return array.reshape(0, 0)
+    if array.ndim != 2:
+        raise ValueError(f"Embeddings must be a 2D array, got {array.ndim} dimension(s).")
+    return array
+
+
+def decode_embedding(value: str | Sequence[float], dtype: EmbeddingDType = "float32") -> EmbeddingArray:
+    """Decodes a single embedding, either a list of numbers or base64 encoded little-endian float32 values."""
+    np = import_numpy()
+    vector: EmbeddingArray = (
+        np.frombuffer(base64.b64decode(value), dtype="<f4").astype(dtype, copy=False)
+        if isinstance(value, str)
+        else np.asarray(value, dtype=dtype)
+    )
+    return vector
+
+
+def normalize(array: EmbeddingArray) -> EmbeddingArray:
+    """Scales rows (or a single vector) to a unit length, zero vectors are left as they are."""
+    np = import_numpy()
+    norms = np.linalg.norm(array, axis=-1, keepdims=True)
+    normalized: EmbeddingArray = array / np.where(norms == 0, 1, norms)
+    return normalized
+
+
+def cosine_similarity(queries: EmbeddingArray, matrix: EmbeddingArray) -> EmbeddingArray:
+    """
+    Returns similarities between every query and every row of the matrix, shape `(len(queries), len(matrix))`.
+
+    A single query vector gives a 1D result. Half-precision inputs are computed in float32.
+    """
+    np = import_numpy()
+    queries = normalize(np.asarray(queries, dtype=np.float32))
+    matrix = normalize(np.asarray(matrix, dtype=np.float32))
+    similarities: EmbeddingArray = matrix @ queries if queries.ndim == 1 else queries @ matrix.T
+    return similarities
+
+
+def dot(queries: EmbeddingArray, matrix: EmbeddingArray, *, block_size: int = 65536) -> EmbeddingArray:
+    """
+    Returns `queries @ matrix.T` in float32.
+
+    Half-precision matrices are converted block by block, since their matrix products are slow on most CPUs.
+    """
+    np = import_numpy()
+    queries = np.asarray(queries, dtype=np.float32)
+    if matrix.dtype == np.float32:
+        scores: EmbeddingArray = queries @ matrix.T
+        return scores
+
+    scores = np.empty((len(queries), len(matrix)), dtype=np.float32)
+    for start in range(0, len(matrix), block_size):
+        block = matrix[start : start + block_size].astype(np.float32)
+        scores[:, start : start + len(block)] = queries @ block.T
+    return scores
+
+
+def top_k(scores: EmbeddingArray, k: int) -> tuple[Any, EmbeddingArray]:
+    """Returns column indexes and values of the `k` highest scores of every row, in descending order."""
+    np = import_numpy()
+    k = min(k, scores.shape[1])
+    if k <= 0:
+        return np.empty((len(scores), 0), dtype=np.intp), np.empty((len(scores), 0), dtype=scores.dtype)
+
+    # only the best k of every row get sorted
+    candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+    order = np.argsort(-candidate_scores, axis=1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=1), np.take_along_axis(candidate_scores, order, axis=1)
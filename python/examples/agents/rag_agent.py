@@ -4,7 +4,7 @@ import os
 import sys
 import traceback
 
-from beeai_framework.adapters.beeai.backend.document_processor import LLMDocumentReranker
+from beeai_framework.adapters.beeai.backend.document_processor import LLMReranker
 from beeai_framework.adapters.beeai.backend.vector_store import TemporalVectorStore
 from beeai_framework.adapters.langchain.backend.vector_store import LangChainVectorStore
 from beeai_framework.adapters.langchain.mappers.documents import lc_document_to_document
@@ -89,7 +89,7 @@ async def main() -> None:
         )
 
     llm = ChatModel.from_name("ollama:llama3.2")
-    reranker = LLMDocumentReranker(llm)
+    reranker = LLMReranker(llm)
 
     agent = RAGAgent(llm=llm, memory=UnconstrainedMemory(), vector_store=vector_store, reranker=reranker)
 
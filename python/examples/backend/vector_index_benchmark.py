@@ -0,0 +1,64 @@
+import sys
+import time
+import traceback
+from typing import TYPE_CHECKING
+
+from beeai_framework.adapters.beeai import ExactVectorIndex, IVFVectorIndex, VectorIndex
+from beeai_framework.errors import FrameworkError
+from beeai_framework.utils.vectors import normalize
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# increase the size (e.g. to 100_000 vectors) to see where the IVF index pays off
+SIZE = 5_000
+DIMENSION = 64
+QUERIES = 50
+K = 10
+N_PROBES = [1, 4, 8, 16]
+
+
+def create_dataset(size: int, dimension: int, queries: int, seed: int = 42) -> tuple["np.ndarray", "np.ndarray"]:
+    import numpy as np
+
+    # embeddings of real documents are clustered by topic, uniformly random vectors would be the worst case
+    rng = np.random.default_rng(seed)
+    topics = rng.normal(size=(max(size // 500, 1), dimension))
+    data = topics[rng.integers(len(topics), size=size + queries)] + rng.normal(
+        scale=0.75, size=(size + queries, dimension)
+    )
+    vectors = normalize(data.astype(np.float32))
+    return vectors[:size], vectors[size:]
+
+
+def measure(index: VectorIndex, matrix: "np.ndarray", queries: "np.ndarray", k: int) -> tuple[list[set[int]], float]:
+    started_at = time.perf_counter()
+    hits = [index.search(matrix, query[None, :], k)[0] for query in queries]
+    latency = (time.perf_counter() - started_at) / len(queries) * 1000
+    return [{row for row, _ in query_hits} for query_hits in hits], latency
+
+
+def main() -> None:
+    matrix, queries = create_dataset(SIZE, DIMENSION, QUERIES)
+    expected, exact_latency = measure(ExactVectorIndex(), matrix, queries, K)
+    print(f"{SIZE} vectors, {DIMENSION} dimensions, {QUERIES} queries")
+    print(f"exact search: {exact_latency:.2f} ms/query")
+
+    started_at = time.perf_counter()
+    index = IVFVectorIndex(train_threshold=0)
+    index.add(matrix, 0)
+    print(f"IVF index has been built in {time.perf_counter() - started_at:.2f} s")
+
+    for n_probe in N_PROBES:
+        index.n_probe = n_probe
+        found, latency = measure(index, matrix, queries, K)
+        recall = sum(len(hits & truth) / len(truth) for hits, truth in zip(found, expected, strict=True)) / len(found)
+        print(f"n_probe={n_probe:<4} recall@{K}={recall:.3f} {latency:.2f} ms/query")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except FrameworkError as e:
+        traceback.print_exc()
+        sys.exit(e.explain())
@@ -0,0 +1,152 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+
+from beeai_framework.agents import (
+    AgentError,
+    ContextWindowGuard,
+    DropToolResultsPolicy,
+    KeepPinnedMessagesPolicy,
+    SummarizeHistoryPolicy,
+    TruncateToolResultsPolicy,
+)
+from beeai_framework.agents.tool_calling import ToolCallingAgent
+from beeai_framework.backend import (
+    AnyMessage,
+    AssistantMessage,
+    CalibratedTokenizer,
+    ChatModel,
+    ChatModelOutput,
+    MessageToolCallContent,
+    MessageToolResultContent,
+    SystemMessage,
+    ToolMessage,
+    UserMessage,
+)
+from beeai_framework.backend.types import ChatModelInput, ChatModelStructureInput, ChatModelStructureOutput
+from beeai_framework.context import RunContext
+from beeai_framework.memory import UnconstrainedMemory
+from beeai_framework.tools import tool
+
+
+class ScriptedChatModel(ChatModel):
+    """Dummy model that returns predefined responses and records the messages it receives"""
+
+    model_id = "scripted_model"
+    provider_id = "ollama"
+
+    def __init__(self, responses: list[str | MessageToolCallContent]) -> None:
+        super().__init__(tokenizer=CalibratedTokenizer(chars_per_token=1))
+        self.responses = responses
+        self.inputs: list[list[AnyMessage]] = []
+
+    async def _create(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        self.inputs.append(list(input.messages))
+        return ChatModelOutput(messages=[AssistantMessage(self.responses.pop(0))])
+
+    async def _create_stream(self, input: ChatModelInput, run: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        yield await self._create(input, run)
+
+    async def _create_structure(self, input: ChatModelStructureInput[Any], run: RunContext) -> ChatModelStructureOutput:
+        return await super()._create_structure(input, run)
+
+
+def create_turn(index: int, result: str) -> list[AnyMessage]:
+    return [
+        AssistantMessage(MessageToolCallContent(id=f"call_{index}", tool_name="lookup", args="{}")),
+        ToolMessage(MessageToolResultContent(tool_call_id=f"call_{index}", tool_name="lookup", result=result)),
+    ]
+
+
+async def create_memory(*turns: list[AnyMessage]) -> UnconstrainedMemory:
+    memory = UnconstrainedMemory()
+    await memory.add_many([SystemMessage("You are a helpful assistant."), UserMessage("Find the answer.")])
+    for turn in turns:
+        await memory.add_many(turn)
+    return memory
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_context_window_guard_compacts_tool_results() -> None:
+    llm = ScriptedChatModel([])
+    memory = await create_memory(create_turn(1, "a" * 500), create_turn(2, "b" * 500))
+    guard = ContextWindowGuard(
+        context_size=1000,
+        output_reserve=0,
+        policies=[TruncateToolResultsPolicy(max_tokens=300), DropToolResultsPolicy()],
+    )
+
+    assert await guard.apply(memory, llm=llm)
+    assert llm.tokenizer.count_tokens(memory.messages) <= 1000
+    assert [message.role for message in memory.messages] == ["system", "user", "assistant", "tool", "assistant", "tool"]
+
+    first, last = memory.messages[3], memory.messages[5]
+    assert isinstance(first, ToolMessage) and isinstance(last, ToolMessage)
+    assert first.content[0].result.startswith("a" * 300)
+    assert last.content[0].result == "b" * 500
+
+    assert not await guard.apply(memory, llm=llm)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_context_window_guard_keeps_pinned_messages() -> None:
+    llm = ScriptedChatModel([])
+    memory = await create_memory(*(create_turn(i, "x" * 100) for i in range(5)))
+    pinned = memory.messages[:2]
+    guard = ContextWindowGuard(context_size=400, output_reserve=0, policies=[KeepPinnedMessagesPolicy()])
+
+    assert await guard.apply(memory, llm=llm)
+    assert memory.messages[:2] == pinned
+    assert isinstance(memory.messages[2], AssistantMessage)
+    assert isinstance(memory.messages[-1], ToolMessage)
+    assert memory.messages[-1].content[0].tool_call_id == "call_4"
+
+    with pytest.raises(AgentError, match="does not fit"):
+        await ContextWindowGuard(context_size=400, output_reserve=390).apply(memory, llm=llm)
+    assert memory.messages[:2] == pinned
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_context_window_guard_summarizes_history() -> None:
+    llm = ScriptedChatModel(["The answer is 42."])
+    memory = await create_memory(*(create_turn(i, "x" * 100) for i in range(5)))
+    guard = ContextWindowGuard(context_size=500, output_reserve=0, policies=[SummarizeHistoryPolicy(keep_last=2)])
+
+    assert await guard.apply(memory, llm=llm)
+    assert [message.role for message in memory.messages] == ["system", "user", "user", "assistant", "tool"]
+    assert memory.messages[2].meta.get("contextSummary")
+    assert "The answer is 42." in memory.messages[2].text
+    assert "call_0" not in memory.messages[2].text
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_tool_calling_agent_context_guard() -> None:
+    @tool
+    def lookup() -> str:
+        """Returns a long document."""
+        return "z" * 2000
+
+    llm = ScriptedChatModel(
+        [
+            MessageToolCallContent(id="call_1", tool_name="lookup", args="{}"),
+            MessageToolCallContent(id="call_2", tool_name="final_answer", args='{"response": "Done"}'),
+        ]
+    )
+    agent = ToolCallingAgent(
+        llm=llm, tools=[lookup], context_guard=ContextWindowGuard(context_size=2500, output_reserve=0)
+    )
+
+    response = await agent.run("Read the document.")
+
+    assert response.result.text == "Done"
+    results = [message for message in llm.inputs[-1] if isinstance(message, ToolMessage)]
+    assert len(results) == 1
+    assert len(results[0].content[0].result) < 2000
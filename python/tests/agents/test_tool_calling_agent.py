@@ -0,0 +1,120 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+
+from beeai_framework.agents.speculation import SpeculativeToolExecutor
+from beeai_framework.agents.tool_calling import ToolCallingAgent
+from beeai_framework.backend import (
+    ChatModel,
+    ChatModelOutput,
+    MessageToolCallContent,
+    MessageToolCallDeltaContent,
+    ToolMessage,
+)
+from beeai_framework.backend.types import ChatModelInput, ChatModelStructureInput, ChatModelStructureOutput
+from beeai_framework.context import RunContext
+from beeai_framework.tools import AnyTool, tool
+
+
+class ScriptedToolCallsModel(ChatModel):
+    """Dummy model that streams predefined tool call fragments, one response per call"""
+
+    model_id = "scripted_tool_calls_model"
+    provider_id = "ollama"
+
+    def __init__(self, responses: list[list[MessageToolCallDeltaContent]], *, delay: float = 0) -> None:
+        super().__init__()
+        self.responses = responses
+        self.delay = delay
+        self.events: list[str] = []
+
+    async def _create(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        chunks = [chunk async for chunk in self._create_stream(input, run)]
+        return ChatModelOutput.from_chunks(chunks)
+
+    async def _create_stream(self, input: ChatModelInput, run: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        for delta in self.responses.pop(0):
+            await asyncio.sleep(self.delay)
+            yield ChatModelOutput(messages=[], tool_call_deltas=[delta])
+        self.events.append("stream_end")
+
+    async def _create_structure(self, input: ChatModelStructureInput[Any], run: RunContext) -> ChatModelStructureOutput:
+        return await super()._create_structure(input, run)
+
+
+def create_lookup_tool(events: list[str], *, side_effect_free: bool = True) -> AnyTool:
+    @tool(side_effect_free=side_effect_free)
+    async def lookup(query: str) -> str:
+        """Looks up the given query."""
+        events.append(f"lookup_start:{query}")
+        await asyncio.sleep(0.05)
+        events.append(f"lookup_end:{query}")
+        return query.upper()
+
+    return lookup
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.parametrize("side_effect_free", [True, False])
+async def test_tool_calling_agent_speculative_tool_execution(side_effect_free: bool) -> None:
+    llm = ScriptedToolCallsModel(
+        [
+            [
+                MessageToolCallDeltaContent(index=0, id="call_1", tool_name="lookup", args='{"query": '),
+                MessageToolCallDeltaContent(index=0, args='"bees"}'),
+                MessageToolCallDeltaContent(index=1, id="call_2", tool_name="lookup", args='{"query": "wasps"}'),
+                MessageToolCallDeltaContent(index=2, id="call_3", tool_name="lookup", args='{"query": "ants"}'),
+            ],
+            [MessageToolCallDeltaContent(index=0, id="call_4", tool_name="final_answer", args='{"response": "Done"}')],
+        ],
+        delay=0.02,
+    )
+    lookup = create_lookup_tool(llm.events, side_effect_free=side_effect_free)
+    agent = ToolCallingAgent(llm=llm, tools=[lookup], speculative_tool_execution=True)
+
+    response = await agent.run("Look up bees, wasps and ants")
+
+    assert response.result.text == "Done"
+    results = [msg.content[0].result for msg in response.memory.messages if isinstance(msg, ToolMessage)]
+    assert results[:3] == ["BEES", "WASPS", "ANTS"]
+    assert llm.events.count("lookup_start:bees") == 1
+    stream_end = llm.events.index("stream_end")
+    if side_effect_free:
+        assert llm.events.index("lookup_start:bees") < stream_end
+        assert llm.events.index("lookup_start:wasps") < stream_end
+    else:
+        assert llm.events.index("lookup_start:bees") > stream_end
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_speculative_tool_executor_cancels_unmatched_runs() -> None:
+    events: list[str] = []
+    speculation = SpeculativeToolExecutor()
+    await speculation.reset([create_lookup_tool(events)])
+    try:
+        speculation.add(
+            ChatModelOutput(
+                messages=[],
+                tool_call_deltas=[
+                    MessageToolCallDeltaContent(index=0, id="call_1", tool_name="lookup", args='{"query": "a"}'),
+                    MessageToolCallDeltaContent(index=1, id="call_2", tool_name="lookup", args="{"),
+                ],
+            )
+        )
+        await asyncio.sleep(0.01)
+        assert events == ["lookup_start:a"]
+        assert speculation.pop(MessageToolCallContent(id="call_1", tool_name="lookup", args='{"query": "b"}')) is None
+        # the same call under a different id must not reuse the speculative run
+        assert speculation.pop(MessageToolCallContent(id="call_9", tool_name="lookup", args='{"query": "a"}')) is None
+    finally:
+        await speculation.close()
+
+    await asyncio.sleep(0.1)
+    assert events == ["lookup_start:a"]
@@ -0,0 +1,123 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Any
+
+import pytest
+from litellm.types.utils import ModelResponse, Usage
+
+from beeai_framework.adapters.gemini import GeminiChatModel
+from beeai_framework.adapters.ollama import OllamaChatModel
+from beeai_framework.backend import (
+    AnyMessage,
+    AssistantMessage,
+    MessageTextContent,
+    MessageToolCallContent,
+    SystemMessage,
+    UserMessage,
+)
+from beeai_framework.backend.types import ChatModelInput
+from beeai_framework.backend.utils import get_tool_spec
+from beeai_framework.tools import tool
+
+
+@pytest.mark.unit
+def test_transform_input_reuses_message_payloads() -> None:
+    model = OllamaChatModel("llama3.1")
+    user_message = UserMessage("What is the weather in Prague?")
+    messages: list[AnyMessage] = [
+        SystemMessage("You are a helpful assistant."),
+        user_message,
+        AssistantMessage(MessageToolCallContent(id="call_1", tool_name="weather", args='{"city": "Prague"}')),
+    ]
+
+    first = model._transform_input(ChatModelInput(messages=messages))["messages"]
+    second = model._transform_input(ChatModelInput(messages=messages))["messages"]
+    assert first == second
+    assert first[0] is not second[0]  # providers may mutate the payload
+
+    calls = 0
+    original = model._create_message_payload
+
+    def counting_create(message: AnyMessage) -> list[dict[str, Any]]:
+        nonlocal calls
+        calls += 1
+        return original(message)
+
+    model._create_message_payload = counting_create  # type: ignore[method-assign]
+    messages.append(UserMessage("And in Brno?"))
+    user_message.content.append(MessageTextContent(text="Answer briefly."))
+    third = model._transform_input(ChatModelInput(messages=messages))["messages"]
+
+    assert calls == 2  # the changed and the appended message
+    assert third[:1] == first[:1] and third[2] == first[2]
+    assert third[1]["content"][-1]["text"] == "Answer briefly."
+    assert third[-1]["content"][0]["text"] == "And in Brno?"
+
+    messages[-1].content[0].text = "And in Ostrava?"
+    fourth = model._transform_input(ChatModelInput(messages=messages))["messages"]
+    assert calls == 3
+    assert fourth[-1]["content"][0]["text"] == "And in Ostrava?"
+
+
+@pytest.mark.unit
+def test_transform_input_passes_cache_breakpoints() -> None:
+    model = OllamaChatModel("llama3.1")
+    system_message = SystemMessage("You are a helpful assistant.")
+    messages: list[AnyMessage] = [system_message, UserMessage("Hello!")]
+
+    assert "cache_control" not in str(model._transform_input(ChatModelInput(messages=messages)))
+
+    model.supports_prompt_caching = True
+    system_message.mark_cache_breakpoint()
+    system_message.mark_cache_breakpoint()  # marking twice does not change the payload
+    payload = model._transform_input(ChatModelInput(messages=messages))["messages"]
+    assert payload[0]["content"] == [
+        {"type": "text", "text": "You are a helpful assistant.", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert "cache_control" not in str(payload[1])
+
+    del system_message.meta["cacheControl"]
+    payload = model._transform_input(ChatModelInput(messages=messages))["messages"]
+    assert payload[0]["content"] == "You are a helpful assistant."
+
+
+@tool()
+def weather(city: str) -> str:
+    """Returns the weather in the given city"""
+
+    return f"Sunny in {city}"
+
+
+@pytest.mark.unit
+def test_transform_input_copies_tool_specs_only_when_needed() -> None:
+    messages: list[AnyMessage] = [UserMessage("What is the weather in Prague?")]
+    model = OllamaChatModel("llama3.1")
+    tools = model._transform_input(ChatModelInput(messages=messages, tools=[weather]))["tools"]
+    assert tools[0] is get_tool_spec(weather, strict=model.use_strict_tool_schema)
+
+    # LiteLLM adjusts Gemini schemas in place
+    gemini = GeminiChatModel("gemini-2.0-flash", api_key="dummy")
+    spec = get_tool_spec(weather, strict=gemini.use_strict_tool_schema)
+    tools = gemini._transform_input(ChatModelInput(messages=messages, tools=[weather]))["tools"]
+    assert tools[0] == spec and tools[0] is not spec
+
+
+@pytest.mark.unit
+def test_transform_output_reports_cached_tokens() -> None:
+    model = OllamaChatModel("llama3.1")
+    response = ModelResponse(
+        choices=[{"message": {"role": "assistant", "content": "Hi!"}, "finish_reason": "stop"}],
+        usage=Usage(
+            prompt_tokens=1200,
+            completion_tokens=3,
+            total_tokens=1203,
+            prompt_tokens_details={"cached_tokens": 1024},
+        ),
+    )
+
+    output = model._transform_output(response)
+
+    assert output.usage is not None
+    assert output.usage.cached_prompt_tokens == 1024
+    assert output.usage.cache_creation_prompt_tokens == 0
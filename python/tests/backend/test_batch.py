@@ -0,0 +1,82 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from beeai_framework.adapters.ollama import OllamaChatModel
+from beeai_framework.backend import (
+    AssistantMessage,
+    ChatModel,
+    ChatModelBatch,
+    ChatModelBatchSubmitter,
+    ChatModelError,
+    ChatModelOutput,
+    ChatModelStructureOutput,
+    LocalChatModelBatchSubmitter,
+    UserMessage,
+)
+from beeai_framework.backend.types import ChatModelInput, ChatModelStructureInput
+from beeai_framework.context import RunContext
+
+
+class EchoChatModel(ChatModel):
+    model_id = "echo"
+    provider_id = "ollama"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def _create(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        self.calls += 1
+        return ChatModelOutput(messages=[AssistantMessage(f"echo: {input.messages[-1].text}")])
+
+    async def _create_stream(self, input: ChatModelInput, run: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        yield await self._create(input, run)
+
+    async def _create_structure(self, input: ChatModelStructureInput[Any], run: RunContext) -> ChatModelStructureOutput:
+        return await super()._create_structure(input, run)
+
+
+class FailingSubmitter(ChatModelBatchSubmitter):
+    async def submit(self, path: Path) -> str:
+        raise RuntimeError("Quota exceeded")
+
+    async def poll(self, batch_id: str) -> Path | None:
+        return None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_batch(tmp_path: Path) -> None:
+    backend = EchoChatModel()
+    llm = OllamaChatModel("llama3.1")
+
+    async with ChatModelBatch(
+        LocalChatModelBatchSubmitter(backend), directory=tmp_path, window=0.01, poll_interval=0.01
+    ) as batch:
+        assert ChatModelBatch.current() is batch
+        responses = await asyncio.gather(*(llm.create(messages=[UserMessage(f"Hello {i}")]) for i in range(3)))
+
+    assert ChatModelBatch.current() is None
+    assert [response.get_text_content() for response in responses] == [f"echo: Hello {i}" for i in range(3)]
+    assert backend.calls == 3
+    assert len(list(tmp_path.glob("*.results.jsonl"))) == 1
+    assert len([path for path in tmp_path.glob("*.jsonl") if not path.name.endswith(".results.jsonl")]) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_batch_error(tmp_path: Path) -> None:
+    llm = OllamaChatModel("llama3.1")
+
+    with pytest.raises(ChatModelError) as exc_info:
+        async with ChatModelBatch(FailingSubmitter(), directory=tmp_path, window=0.01):
+            await llm.create(messages=[UserMessage("Hello")])
+
+    assert "Quota exceeded" in str(exc_info.value.get_cause())
@@ -0,0 +1,134 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from beeai_framework.backend import (
+    AssistantMessage,
+    CascadeChatModel,
+    CascadeChatModelAcceptEvent,
+    CascadeChatModelEscalateEvent,
+    ChatModel,
+    ChatModelOutput,
+    ChatModelStructureOutput,
+    MessageToolCallContent,
+    UserMessage,
+)
+from beeai_framework.backend.types import ChatModelInput, ChatModelStructureInput
+from beeai_framework.context import RunContext
+from beeai_framework.emitter import EventMeta
+from beeai_framework.tools import tool
+
+
+class ScriptedChatModel(ChatModel):
+    provider_id = "ollama"
+
+    def __init__(self, model_id: str, response: str | MessageToolCallContent) -> None:
+        super().__init__()
+        self._model_id = model_id
+        self.response = response
+        self.calls = 0
+
+    @property
+    def model_id(self) -> str:
+        return self._model_id
+
+    async def _create(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        self.calls += 1
+        return ChatModelOutput(messages=[AssistantMessage(self.response)])
+
+    async def _create_stream(self, input: ChatModelInput, run: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        yield await self._create(input, run)
+
+    async def _create_structure(self, input: ChatModelStructureInput[Any], run: RunContext) -> ChatModelStructureOutput:
+        return await super()._create_structure(input, run)
+
+
+@tool
+def get_weather(city: str) -> str:
+    """Returns the weather in the given city."""
+    return "sunny"
+
+
+def collect_tiers(events: list[str]) -> Any:
+    async def on_event(data: CascadeChatModelAcceptEvent | CascadeChatModelEscalateEvent, meta: EventMeta) -> None:
+        events.append(f"{meta.name}:{data.tier}")
+
+    return on_event
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cascade_chat_model_accepts_first_tier() -> None:
+    small = ScriptedChatModel("small", MessageToolCallContent(id="1", tool_name="get_weather", args='{"city": "Oslo"}'))
+    large = ScriptedChatModel("large", "Never called")
+    llm = CascadeChatModel([small, large])
+    events: list[str] = []
+
+    response = await llm.create(
+        messages=[UserMessage("What is the weather in Oslo?")], tools=[get_weather], tool_choice="required"
+    ).on("accept", collect_tiers(events))
+
+    assert response.get_tool_calls()[0].tool_name == "get_weather"
+    assert events == ["accept:0"]
+    assert (small.calls, large.calls) == (1, 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cascade_chat_model_escalates_invalid_tool_call() -> None:
+    small = ScriptedChatModel("small", MessageToolCallContent(id="1", tool_name="get_weather", args='{"town": 1}'))
+    large = ScriptedChatModel("large", MessageToolCallContent(id="2", tool_name="get_weather", args='{"city": "Oslo"}'))
+    llm = CascadeChatModel([small, large])
+    events: list[str] = []
+
+    response = await llm.create(
+        messages=[UserMessage("What is the weather in Oslo?")], tools=[get_weather], tool_choice="required"
+    ).on(lambda event: event.name in {"accept", "escalate"}, collect_tiers(events))
+
+    assert response.get_tool_calls()[0].id == "2"
+    assert events == ["escalate:0", "accept:1"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cascade_chat_model_custom_acceptor_and_stream() -> None:
+    llm = CascadeChatModel(
+        [ScriptedChatModel("small", "I don't know"), ScriptedChatModel("large", "Paris")],
+        acceptors=[lambda data: "don't know" not in data.output.get_text_content()],
+    )
+
+    response = await llm.create(messages=[UserMessage("What is the capital of France?")], stream=True)
+
+    assert response.get_text_content() == "Paris"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cascade_chat_model_structure_escalates_on_schema_violation() -> None:
+    class Answer(BaseModel):
+        answer: str
+
+    small = ScriptedChatModel("small", '{"response": "Paris"}')
+    large = ScriptedChatModel("large", '{"answer": "Paris"}')
+    llm = CascadeChatModel([small, large])
+    events: list[str] = []
+
+    response = await llm.create_structure(schema=Answer, messages=[UserMessage("What is the capital of France?")]).on(
+        lambda event: event.name in {"accept", "escalate"}, collect_tiers(events)
+    )
+
+    assert response.object == {"answer": "Paris"}
+    assert events == ["escalate:0", "accept:1"]
+
+
+@pytest.mark.unit
+def test_cascade_chat_model_from_name() -> None:
+    llm = ChatModel.from_name("cascade:ollama:granite3.3:8b,ollama:llama3.1")
+
+    assert isinstance(llm, CascadeChatModel)
+    assert [model.model_id for model in llm.models] == ["granite3.3:8b", "llama3.1"]
@@ -2,12 +2,13 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import json
 from collections.abc import AsyncGenerator
 from typing import Any
 
 import pytest
 import pytest_asyncio
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from beeai_framework.adapters.amazon_bedrock import AmazonBedrockChatModel
 from beeai_framework.adapters.anthropic import AnthropicChatModel
@@ -22,13 +23,20 @@ from beeai_framework.backend import (
     AnyMessage,
     AssistantMessage,
     ChatModel,
+    ChatModelError,
     ChatModelOutput,
+    ChatModelPartialStructureEvent,
+    ChatModelStructureError,
     ChatModelStructureOutput,
     CustomMessage,
+    MessageTextContent,
+    MessageToolCallContent,
+    MessageToolCallDeltaContent,
     UserMessage,
 )
-from beeai_framework.backend.types import ChatModelInput, ChatModelStructureInput
+from beeai_framework.backend.types import ChatModelInput, ChatModelStructureInput, ChatModelUsage
 from beeai_framework.context import RunContext
+from beeai_framework.emitter import EventMeta
 from beeai_framework.errors import AbortError
 from beeai_framework.utils import AbortSignal
 
@@ -71,6 +79,29 @@ class ReverseWordsDummyModel(ChatModel):
         return ChatModelStructureOutput(object=response_object)
 
 
+class JSONChunksDummyModel(ChatModel):
+    """Dummy model that streams a predefined response in small chunks"""
+
+    model_id = "json_chunks_model"
+    provider_id = "ollama"
+
+    def __init__(self, response: str) -> None:
+        super().__init__()
+        self.response = response
+        self.yielded_chunks = 0
+
+    async def _create(self, input: ChatModelInput, _: RunContext) -> ChatModelOutput:
+        return ChatModelOutput(messages=[AssistantMessage(self.response)])
+
+    async def _create_stream(self, input: ChatModelInput, context: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        for i in range(0, len(self.response), 4):
+            self.yielded_chunks += 1
+            yield ChatModelOutput(messages=[AssistantMessage(self.response[i : i + 4])])
+
+    async def _create_structure(self, input: ChatModelStructureInput[Any], run: RunContext) -> ChatModelStructureOutput:
+        return await super()._create_structure(input, run)
+
+
 @pytest_asyncio.fixture
 def reverse_words_chat() -> ChatModel:
     return ReverseWordsDummyModel()
@@ -110,14 +141,162 @@ async def test_chat_model_structure(reverse_words_chat: ChatModel, chat_messages
     ReverseWordsSchema.model_validate(response.object)
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_structure_stream(chat_messages_list: list[AnyMessage]) -> None:
+    class PersonSchema(BaseModel):
+        name: str
+        age: int
+        hobbies: list[str]
+
+    model = JSONChunksDummyModel('```json\n{"name": "Alice", "age": 31, "hobbies": ["chess", "go"]}\n```')
+    updates: list[tuple[str, Any]] = []
+
+    def on_partial(data: ChatModelPartialStructureEvent, _: EventMeta) -> None:
+        assert isinstance(data.object, PersonSchema)
+        updates.append((data.field, data.value))
+
+    response = await model.create_structure(schema=PersonSchema, messages=chat_messages_list, stream=True).on(
+        "partial_structure", on_partial
+    )
+
+    assert response.object == {"name": "Alice", "age": 31, "hobbies": ["chess", "go"]}
+    assert updates == [("name", "Alice"), ("age", 31), ("hobbies", ["chess", "go"])]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_structure_stream_violation(chat_messages_list: list[AnyMessage]) -> None:
+    class PersonSchema(BaseModel):
+        name: str
+        age: int
+
+    model = JSONChunksDummyModel('{"name": "Alice", "age": "thirty one", "city": "Prague", "country": "Czechia"}')
+
+    with pytest.raises(ChatModelStructureError, match=r"\$\.age"):
+        await model.create_structure(schema=PersonSchema, messages=chat_messages_list, stream=True, max_retries=0)
+
+    assert model.yielded_chunks < len(model.response) // 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_structure_stream_extra_keys(chat_messages_list: list[AnyMessage]) -> None:
+    class PersonSchema(BaseModel):
+        name: str
+
+    class StrictPersonSchema(PersonSchema):
+        model_config = ConfigDict(extra="forbid")
+
+    model = JSONChunksDummyModel('{"name": "Alice", "city": "Prague"}')
+    updates: list[str] = []
+
+    def on_partial(data: ChatModelPartialStructureEvent, _: EventMeta) -> None:
+        updates.append(data.field)
+
+    response = await model.create_structure(schema=PersonSchema, messages=chat_messages_list, stream=True).on(
+        "partial_structure", on_partial
+    )
+    assert response.object["name"] == "Alice"
+    assert updates == ["name"]
+
+    with pytest.raises(ChatModelStructureError, match=r"\$\.city"):
+        await model.create_structure(schema=StrictPersonSchema, messages=chat_messages_list, stream=True, max_retries=0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_structure_violation(chat_messages_list: list[AnyMessage]) -> None:
+    class PersonSchema(BaseModel):
+        name: str
+        age: int
+
+    model = JSONChunksDummyModel('{"name": "Alice", "age": "thirty one"}')
+
+    with pytest.raises(ChatModelStructureError, match="does not match the schema"):
+        await model.create_structure(schema=PersonSchema, messages=chat_messages_list, max_retries=0)
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_chat_model_stream(reverse_words_chat: ChatModel, chat_messages_list: list[AnyMessage]) -> None:
     response = await reverse_words_chat.create(messages=chat_messages_list, stream=True)
 
-    assert len(response.messages) == 4
-    assert all(isinstance(message, AssistantMessage) for message in response.messages)
-    assert "".join([m.get_texts()[0].text for m in response.messages]) == "llet em gnihtemos gnitseretni"
+    assert len(response.messages) == 1
+    assert isinstance(response.messages[0], AssistantMessage)
+    assert len(response.messages[0].content) == 1
+    assert response.messages[0].text == "llet em gnihtemos gnitseretni"
+
+
+@pytest.mark.unit
+def test_chat_model_output_from_chunks() -> None:
+    chunks = [
+        ChatModelOutput(messages=[AssistantMessage("Hello")]),
+        ChatModelOutput(messages=[AssistantMessage(" world")]),
+        ChatModelOutput(
+            messages=[AssistantMessage(MessageToolCallContent(id="call_1", tool_name="search", args="{}"))],
+            usage=ChatModelUsage(prompt_tokens=5, completion_tokens=3, total_tokens=8),
+            finish_reason="tool_calls",
+        ),
+    ]
+
+    output = ChatModelOutput.from_chunks(chunks)
+
+    assert len(output.messages) == 1
+    assert output.get_text_content() == "Hello world"
+    assert [call.id for call in output.get_tool_calls()] == ["call_1"]
+    assert output.finish_reason == "tool_calls"
+    assert output.usage and output.usage.total_tokens == 8
+    assert len(chunks[0].messages[0].content) == 1
+
+
+@pytest.mark.unit
+def test_chat_model_output_from_chunks_preserves_part_order() -> None:
+    chunks = [
+        ChatModelOutput(messages=[AssistantMessage("Let me")]),
+        ChatModelOutput(messages=[AssistantMessage(" search.")]),
+        ChatModelOutput(
+            messages=[AssistantMessage(MessageToolCallContent(id="call_1", tool_name="search", args="{}"))],
+        ),
+        ChatModelOutput(messages=[AssistantMessage("Done")]),
+    ]
+
+    output = ChatModelOutput.from_chunks(chunks)
+
+    content = output.messages[0].content
+    assert [type(part) for part in content] == [MessageTextContent, MessageToolCallContent, MessageTextContent]
+    assert [part.text for part in content if isinstance(part, MessageTextContent)] == ["Let me search.", "Done"]
+
+
+@pytest.mark.unit
+def test_chat_model_output_from_tool_call_deltas() -> None:
+    deltas = [
+        MessageToolCallDeltaContent(index=0, id="call_1", tool_name="search", args='{"qu'),
+        MessageToolCallDeltaContent(index=0, args='ery": "bee'),
+        MessageToolCallDeltaContent(index=1, id="call_2", tool_name="weather", args=""),
+        MessageToolCallDeltaContent(index=0, args='s"}'),
+        MessageToolCallDeltaContent(index=1, args='{"city": "Prague"}'),
+    ]
+
+    output = ChatModelOutput.from_chunks(
+        [ChatModelOutput(messages=[AssistantMessage("Searching.")])]
+        + [ChatModelOutput(messages=[], tool_call_deltas=[delta]) for delta in deltas]
+    )
+
+    assert len(output.messages) == 1
+    assert output.get_text_content() == "Searching."
+    tool_calls = output.get_tool_calls()
+    assert [(call.id, call.tool_name) for call in tool_calls] == [("call_1", "search"), ("call_2", "weather")]
+    assert json.loads(tool_calls[0].args) == {"query": "bees"}
+    assert json.loads(tool_calls[1].args) == {"city": "Prague"}
+
+
+@pytest.mark.unit
+def test_chat_model_output_from_truncated_tool_call_deltas() -> None:
+    delta = MessageToolCallDeltaContent(index=0, id="call_1", tool_name="search", args='{"query": "be')
+
+    with pytest.raises(ChatModelError):
+        ChatModelOutput.from_chunks([ChatModelOutput(messages=[], tool_call_deltas=[delta])])
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,93 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+from typing_extensions import Unpack
+
+from beeai_framework.backend import CalibratedTokenizer, EmbeddingModel, EmbeddingModelOutput
+from beeai_framework.backend.constants import ProviderName
+from beeai_framework.backend.embedding import EmbeddingModelKwargs
+from beeai_framework.backend.types import EmbeddingModelInput, EmbeddingModelUsage
+from beeai_framework.context import RunContext
+
+
+class CountingEmbeddingModel(EmbeddingModel):
+    """Dummy model that embeds each value as its length and records the received batches"""
+
+    def __init__(self, *, failures: int = 0, **kwargs: Unpack[EmbeddingModelKwargs]) -> None:
+        kwargs.setdefault("tokenizer", CalibratedTokenizer(chars_per_token=1))
+        super().__init__(**kwargs)
+        self.batches: list[list[str]] = []
+        self.failures = failures
+        self.running = 0
+        self.max_running = 0
+
+    @property
+    def model_id(self) -> str:
+        return "counting"
+
+    @property
+    def provider_id(self) -> ProviderName:
+        return "ollama"
+
+    async def _create(self, input: EmbeddingModelInput, run: RunContext) -> EmbeddingModelOutput:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.01 * (len(self.batches) % 3))
+            self.batches.append(input.values)
+            if self.failures > 0:
+                self.failures -= 1
+                raise ConnectionError("Connection reset")
+
+            tokens = len("".join(input.values))
+            return EmbeddingModelOutput(
+                values=input.values,
+                embeddings=[[float(len(value))] for value in input.values],
+                usage=EmbeddingModelUsage(prompt_tokens=tokens, completion_tokens=0, total_tokens=tokens),
+            )
+        finally:
+            self.running -= 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_embedding_model_splits_batches() -> None:
+    values = [str(i) * (i % 7 + 1) for i in range(50)]
+    model = CountingEmbeddingModel(max_batch_size=8, max_batch_tokens=20, max_concurrency=2)
+
+    response = await model.create(values)
+
+    assert response.values == values
+    assert response.embeddings == [[float(len(value))] for value in values]
+    assert response.usage is not None and response.usage.total_tokens == len("".join(values))
+    assert all(len(batch) <= 8 and len("".join(batch)) <= 20 for batch in model.batches)
+    assert sorted(value for batch in model.batches for value in batch) == sorted(values)
+    assert model.max_running == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_embedding_model_retries_failed_batch() -> None:
+    model = CountingEmbeddingModel(failures=1, max_batch_size=2)
+
+    response = await model.create(["a", "b", "c"], max_retries=1)
+
+    assert response.embeddings == [[1.0], [1.0], [1.0]]
+    assert len(model.batches) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_embedding_model_returns_array() -> None:
+    np = pytest.importorskip("numpy")
+    model = CountingEmbeddingModel(max_batch_size=2)
+
+    response = await model.create(["a", "bb", "ccc"], dtype="float16")
+
+    assert isinstance(response.embeddings, np.ndarray)
+    assert response.embeddings.dtype == np.float16
+    assert response.embeddings.shape == (3, 1)
+    assert response.to_list() == [[1.0], [2.0], [3.0]]
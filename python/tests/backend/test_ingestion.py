@@ -0,0 +1,219 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import time
+import zlib
+from collections.abc import AsyncIterator, Sequence
+from pathlib import Path
+
+import pytest
+
+from beeai_framework.adapters.beeai import HybridRetriever, LocalVectorStore
+from beeai_framework.backend import CalibratedTokenizer, EmbeddingModel, EmbeddingModelOutput, Tokenizer
+from beeai_framework.backend.constants import ProviderName
+from beeai_framework.backend.ingestion import (
+    FileIngestionCheckpoint,
+    IngestionPipeline,
+    InMemoryIngestionCheckpoint,
+    TextFileLoader,
+    TokenTextSplitter,
+)
+from beeai_framework.backend.types import Document, EmbeddingModelInput
+from beeai_framework.context import RunContext
+from beeai_framework.errors import FrameworkError
+
+np = pytest.importorskip("numpy")
+
+
+class HashingEmbeddingModel(EmbeddingModel):
+    """Dummy model that embeds texts as hashed word counts and records the received batches"""
+
+    def __init__(self, *, fail_on: str | None = None) -> None:
+        super().__init__(tokenizer=CalibratedTokenizer(chars_per_token=1))
+        self.fail_on = fail_on
+        self.batches: list[list[str]] = []
+        self.running = 0
+        self.max_running = 0
+
+    @property
+    def model_id(self) -> str:
+        return "hashing"
+
+    @property
+    def provider_id(self) -> ProviderName:
+        return "ollama"
+
+    async def _create(self, input: EmbeddingModelInput, run: RunContext) -> EmbeddingModelOutput:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail_on and any(self.fail_on in value for value in input.values):
+                raise ValueError("Invalid input")
+            self.batches.append(input.values)
+
+            embeddings = np.zeros((len(input.values), 256), dtype=np.float32)
+            for row, value in enumerate(input.values):
+                for word in value.lower().split():
+                    embeddings[row, zlib.crc32(word.encode()) % 256] += 1
+            return EmbeddingModelOutput(values=input.values, embeddings=embeddings)
+        finally:
+            self.running -= 1
+
+
+async def generate_documents(count: int) -> AsyncIterator[Document]:
+    for i in range(count):
+        yield Document(content=f"topic {i} " * 10, metadata={"source": f"doc-{i}"})
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_ingestion_pipeline() -> None:
+    model = HashingEmbeddingModel()
+    store = LocalVectorStore(model)
+    pipeline = IngestionPipeline(
+        store,
+        splitter=TokenTextSplitter(model.tokenizer, chunk_size=25, chunk_overlap=0),
+        batch_size=8,
+        queue_size=4,
+        embedding_concurrency=3,
+    )
+
+    # every document has 2 chunks, the last two documents repeat the first two
+    documents = [
+        Document(content=f"document {i:02d} begins here. document {i:02d} ends here.", metadata={"source": f"doc-{i}"})
+        for i in range(20)
+    ]
+    documents += [Document(content=document.content, metadata={"source": "copy"}) for document in documents[:2]]
+    stats = await pipeline.run(documents)
+
+    assert stats.sources == 22
+    assert stats.chunks == 44
+    assert stats.duplicates == 4
+    assert stats.written == len(store) == 40
+    assert all(len(batch) <= 8 for batch in model.batches)
+    assert 1 < model.max_running <= 3
+
+    results = await store.search("document 07 begins", k=1)
+    assert results[0].document.metadata == {"source": "doc-7", "chunk": 0}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_ingestion_pipeline_resumes_from_checkpoint(tmp_path: Path) -> None:
+    checkpoint_path = tmp_path / "checkpoint.txt"
+    store = LocalVectorStore(HashingEmbeddingModel(fail_on="topic 15 "))
+    pipeline = IngestionPipeline(store, checkpoint=FileIngestionCheckpoint(checkpoint_path), batch_size=1)
+
+    with pytest.raises(FrameworkError):
+        await pipeline.run(generate_documents(30))
+
+    committed = checkpoint_path.read_text().splitlines()
+    assert "doc-0" in committed
+    assert "doc-15" not in committed
+
+    store = LocalVectorStore(HashingEmbeddingModel())
+    pipeline = IngestionPipeline(store, checkpoint=FileIngestionCheckpoint(checkpoint_path), batch_size=4)
+    stats = await pipeline.run(generate_documents(30))
+    assert stats.skipped_sources == len(committed)
+    assert stats.sources == 30 - len(committed)
+    assert sorted(checkpoint_path.read_text().splitlines()) == sorted(f"doc-{i}" for i in range(30))
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_ingestion_pipeline_commits_shared_source_once_complete() -> None:
+    store = LocalVectorStore(HashingEmbeddingModel())
+    pipeline = IngestionPipeline(store, batch_size=1)
+    documents = [Document(content=f"page {i} " * 10, metadata={"source": "book"}) for i in range(3)]
+
+    stats = await pipeline.run(documents)
+
+    assert stats.sources == 3
+    assert stats.written == len(store) == 3
+    assert await pipeline.checkpoint.contains("book")
+
+
+class SlowSplitter(TokenTextSplitter):
+    """Splitter that takes a while for documents containing the given text"""
+
+    def __init__(self, tokenizer: Tokenizer, *, slow_on: str) -> None:
+        super().__init__(tokenizer)
+        self.slow_on = slow_on
+
+    def split(self, document: Document) -> list[Document]:
+        if self.slow_on in document.content:
+            time.sleep(0.2)
+        return super().split(document)
+
+
+class RecordingCheckpoint(InMemoryIngestionCheckpoint):
+    """Checkpoint that records the size of the store at each commit"""
+
+    def __init__(self, store: LocalVectorStore) -> None:
+        super().__init__()
+        self.store = store
+        self.commits: list[tuple[str, int]] = []
+
+    async def commit(self, source_ids: Sequence[str]) -> None:
+        self.commits.extend((source_id, len(self.store)) for source_id in source_ids)
+        await super().commit(source_ids)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_ingestion_pipeline_commits_shared_source_after_its_last_document() -> None:
+    model = HashingEmbeddingModel()
+    store = LocalVectorStore(model)
+    checkpoint = RecordingCheckpoint(store)
+    pipeline = IngestionPipeline(
+        store, splitter=SlowSplitter(model.tokenizer, slow_on="page 2"), checkpoint=checkpoint, batch_size=1
+    )
+    # the first page is a duplicate, it is done before the second page is split
+    documents = [
+        Document(content="intro " * 10, metadata={"source": "intro"}),
+        Document(content="intro " * 10, metadata={"source": "book"}),
+        Document(content="page 2 " * 10, metadata={"source": "book"}),
+    ]
+
+    await pipeline.run(documents)
+    assert checkpoint.commits == [("intro", 1), ("book", 2)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_ingestion_pipeline_loads_files_into_any_store(tmp_path: Path) -> None:
+    for name in ["a", "b", "c"]:
+        (tmp_path / f"{name}.txt").write_text(f"file {name} mentions error E-{name.upper()}42")
+
+    model = HashingEmbeddingModel()
+    retriever = HybridRetriever(LocalVectorStore(model))
+    pipeline = IngestionPipeline(retriever, embedding_model=model)
+    stats = await pipeline.run(TextFileLoader(tmp_path, pattern="*.txt"))
+
+    assert stats.written == len(retriever.lexical_index) == 3
+    results = await retriever.search("e-b42", k=1)
+    assert results[0].document.metadata["source"] == str(tmp_path / "b.txt")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_ingestion_pipeline_skips_stored_chunks() -> None:
+    model = HashingEmbeddingModel()
+    store = LocalVectorStore(model)
+    pipeline = IngestionPipeline(store, batch_size=4)
+    await pipeline.run(generate_documents(10))
+    model.batches.clear()
+
+    # a new run (without a checkpoint) over an updated corpus embeds only new chunks
+    documents = [document async for document in generate_documents(12)]
+    documents[3] = Document(content="changed content", metadata={"source": "doc-3"})
+    stats = await IngestionPipeline(store, batch_size=4).run(documents)
+
+    assert stats.unchanged == 9
+    assert stats.written == 3
+    assert sorted(value for batch in model.batches for value in batch) == sorted(
+        [documents[3].content, documents[10].content, documents[11].content]
+    )
+    assert len(store) == 13
@@ -4,11 +4,13 @@
 import json
 
 import pytest
+from pydantic import ValidationError
 
 from beeai_framework.backend import (
     AssistantMessage,
     CustomMessage,
     MessageTextContent,
+    MessageToolCallContent,
     SystemMessage,
     ToolMessage,
     UserMessage,
@@ -75,3 +77,18 @@ def test_custom_message() -> None:
     assert len(content) == 1
     assert content[0].model_dump()["text"] == text
     assert message.role == "custom"
+
+
+@pytest.mark.unit
+def test_tool_call_parsed_args() -> None:
+    tool_call = MessageToolCallContent(id="call_1", tool_name="search", args='{"query": "bees"}')
+    assert tool_call.parsed_args == {"query": "bees"}
+    assert tool_call.parsed_args is tool_call.parsed_args
+    assert tool_call.model_copy().parsed_args is tool_call.parsed_args
+    assert "_parsed_args" not in tool_call.model_dump()
+
+    tool_call.args = '{"query": "wasps"}'
+    assert tool_call.parsed_args == {"query": "wasps"}
+
+    with pytest.raises(ValidationError):
+        MessageToolCallContent(id="call_2", tool_name="search", args='{"query": ')
@@ -0,0 +1,52 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from beeai_framework.backend.metadata_filter import (
+    AndFilter,
+    EqFilter,
+    InFilter,
+    MetadataFilter,
+    OrFilter,
+    RangeFilter,
+    to_metadata_filter,
+)
+
+
+@pytest.mark.unit
+def test_metadata_filter_from_dict() -> None:
+    parsed = MetadataFilter.from_dict(
+        {
+            "tenant": "acme",
+            "year": {"$gte": 2020, "$lt": 2024},
+            "$or": [{"source": {"$in": ["a", "b"]}}, {"pinned": True}],
+        }
+    )
+
+    assert parsed == AndFilter(
+        filters=[
+            EqFilter(field="tenant", value="acme"),
+            RangeFilter(field="year", gte=2020, lt=2024),
+            OrFilter(filters=[InFilter(field="source", values=["a", "b"]), EqFilter(field="pinned", value=True)]),
+        ]
+    )
+    assert MetadataFilter.from_dict(parsed.to_dict()) == parsed
+    assert to_metadata_filter({"tenant": "acme"}) == EqFilter(field="tenant", value="acme")
+    assert to_metadata_filter(None) is None
+
+    with pytest.raises(ValueError, match="Unsupported operator"):
+        MetadataFilter.from_dict({"year": {"$ne": 2020}})
+    with pytest.raises(ValueError):
+        RangeFilter(field="year")
+
+
+@pytest.mark.unit
+def test_metadata_filter_matches() -> None:
+    metadata = {"tenant": "acme", "year": 2022, "source": "b", "pinned": False}
+
+    assert (EqFilter(field="tenant", value="acme") & RangeFilter(field="year", gt=2021)).matches(metadata)
+    assert not (EqFilter(field="tenant", value="other") | InFilter(field="source", values=["a"])).matches(metadata)
+    assert (EqFilter(field="tenant", value="other") | InFilter(field="source", values=["a", "b"])).matches(metadata)
+    assert not RangeFilter(field="tenant", gte=10).matches(metadata)
+    assert not EqFilter(field="missing", value="x").matches(metadata)
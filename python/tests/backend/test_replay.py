@@ -0,0 +1,134 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from beeai_framework.adapters.replay import (
+    ReplayCassette,
+    ReplayChatModel,
+    ReplayEmbeddingModel,
+    ReplaySimulation,
+)
+from beeai_framework.backend import (
+    AssistantMessage,
+    BackendError,
+    ChatModel,
+    ChatModelOutput,
+    ChatModelStructureOutput,
+    EmbeddingModel,
+    MessageToolResultContent,
+    ToolMessage,
+    UserMessage,
+)
+from beeai_framework.backend.types import (
+    ChatModelInput,
+    ChatModelStructureInput,
+    EmbeddingModelInput,
+    EmbeddingModelOutput,
+)
+from beeai_framework.context import RunContext
+from beeai_framework.errors import FrameworkError
+
+
+class EchoChatModel(ChatModel):
+    model_id = "echo"
+    provider_id = "ollama"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def _create(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        self.calls += 1
+        return ChatModelOutput(messages=[AssistantMessage(f"echo: {input.messages[-1].text}")])
+
+    async def _create_stream(self, input: ChatModelInput, run: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        self.calls += 1
+        for word in ["echo:", " ", input.messages[-1].text]:
+            yield ChatModelOutput(messages=[AssistantMessage(word)])
+
+    async def _create_structure(self, input: ChatModelStructureInput[Any], run: RunContext) -> ChatModelStructureOutput:
+        return await super()._create_structure(input, run)
+
+
+class LengthEmbeddingModel(EmbeddingModel):
+    model_id = "length"
+    provider_id = "ollama"
+
+    async def _create(self, input: EmbeddingModelInput, run: RunContext) -> EmbeddingModelOutput:
+        return EmbeddingModelOutput(values=input.values, embeddings=[[float(len(v)), 1.0] for v in input.values])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_replay_chat_model(tmp_path: Path) -> None:
+    path = tmp_path / "cassette.jsonl"
+    target = EchoChatModel()
+    recorder = ReplayChatModel(path, target=target)
+    await recorder.create(messages=[UserMessage("Hello")])
+    await recorder.create(messages=[UserMessage("Bye")], stream=True)
+    assert target.calls == 2
+
+    replay = ReplayChatModel(path, simulation=ReplaySimulation(time_scale=0))
+    assert len(replay.cassette) == 2
+
+    response = await replay.create(messages=[UserMessage("Hello")], stream=True)
+    assert response.get_text_content() == "echo: Hello"
+    response = await replay.create(messages=[UserMessage("Bye")])
+    assert response.get_text_content() == "echo: Bye"
+
+    with pytest.raises(BackendError, match="No recorded response") as exc_info:
+        await replay.create(messages=[UserMessage("Unknown")])
+    assert not FrameworkError.is_retryable(exc_info.value)
+
+    cloned = await replay.clone()
+    assert cloned.tokenizer is not replay.tokenizer
+    assert type(cloned.tokenizer) is type(replay.tokenizer)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_replay_chat_model_keeps_roles(tmp_path: Path) -> None:
+    class ToolResultChatModel(EchoChatModel):
+        async def _create(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+            result = MessageToolResultContent(result="42", tool_name="answer", tool_call_id="call_1")
+            return ChatModelOutput(messages=[AssistantMessage("Done"), ToolMessage(result)])
+
+    path = tmp_path / "cassette.jsonl"
+    await ReplayChatModel(path, target=ToolResultChatModel()).create(messages=[UserMessage("Hello")])
+
+    response = await ReplayChatModel(path).create(messages=[UserMessage("Hello")])
+    assert [type(message) for message in response.messages] == [AssistantMessage, ToolMessage]
+    assert isinstance(response.messages[1], ToolMessage)
+    assert response.messages[1].get_tool_results()[0].result == "42"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_replay_simulated_errors(tmp_path: Path) -> None:
+    path = tmp_path / "cassette.jsonl"
+    await ReplayChatModel(path, target=EchoChatModel()).create(messages=[UserMessage("Hello")])
+
+    replay = ReplayChatModel(ReplayCassette(path), simulation=ReplaySimulation(rate_limit_probability=1))
+    with pytest.raises(BackendError) as exc_info:
+        await replay.create(messages=[UserMessage("Hello")])
+    assert exc_info.value.context["status_code"] == 429
+    assert FrameworkError.is_retryable(exc_info.value)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_replay_embedding_model(tmp_path: Path) -> None:
+    path = tmp_path / "cassette.jsonl"
+    recorded = await ReplayEmbeddingModel(path, target=LengthEmbeddingModel()).create(["a", "bee"])
+
+    replayed = await EmbeddingModel.from_name(f"replay:{path}", simulation=ReplaySimulation(time_scale=0)).create(
+        ["a", "bee"]
+    )
+    assert replayed.embeddings == recorded.embeddings
+    replayed = await ReplayEmbeddingModel(path, simulation=ReplaySimulation(time_scale=0)).create(["a", "bee"])
+    assert replayed.embeddings == recorded.embeddings == [[1.0, 1.0], [3.0, 1.0]]
@@ -0,0 +1,161 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import re
+import zlib
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+
+from beeai_framework.adapters.beeai import BM25Reranker, LLMReranker, MMRReranker
+from beeai_framework.backend import (
+    AssistantMessage,
+    ChatModel,
+    ChatModelOutput,
+    ChatModelStructureOutput,
+    EmbeddingModel,
+    EmbeddingModelOutput,
+)
+from beeai_framework.backend.constants import ProviderName
+from beeai_framework.backend.types import (
+    ChatModelInput,
+    ChatModelStructureInput,
+    Document,
+    DocumentWithScore,
+    EmbeddingModelInput,
+)
+from beeai_framework.context import RunContext
+
+
+class KeywordChatModel(ChatModel):
+    """Dummy model that rates documents containing the keyword as the most relevant ones"""
+
+    provider_id = "ollama"
+
+    def __init__(self, keyword: str) -> None:
+        super().__init__()
+        self.keyword = keyword
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+
+    @property
+    def model_id(self) -> str:
+        return "keyword"
+
+    async def _create(self, input: ChatModelInput, run: RunContext) -> ChatModelOutput:
+        return ChatModelOutput(messages=[AssistantMessage("")])
+
+    async def _create_stream(self, input: ChatModelInput, run: RunContext) -> AsyncGenerator[ChatModelOutput]:
+        yield await self._create(input, run)
+
+    async def _create_structure(self, input: ChatModelStructureInput[Any], run: RunContext) -> ChatModelStructureOutput:
+        self.calls += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            documents = re.findall(r"Document (\d+):\n(.*)", input.messages[-1].text)
+            scores = [
+                {"document": int(number), "relevance": 10 if self.keyword in content else 2}
+                for number, content in documents
+            ]
+            return ChatModelStructureOutput(object={"scores": scores})
+        finally:
+            self.running -= 1
+
+
+class BagOfWordsEmbeddingModel(EmbeddingModel):
+    """Dummy model that embeds texts as hashed word counts"""
+
+    @property
+    def model_id(self) -> str:
+        return "bag_of_words"
+
+    @property
+    def provider_id(self) -> ProviderName:
+        return "ollama"
+
+    async def _create(self, input: EmbeddingModelInput, run: RunContext) -> EmbeddingModelOutput:
+        embeddings = [[0.0] * 64 for _ in input.values]
+        for row, value in enumerate(input.values):
+            for word in value.lower().split():
+                embeddings[row][zlib.crc32(word.encode()) % 64] += 1
+        return EmbeddingModelOutput(values=input.values, embeddings=embeddings)
+
+
+def with_scores(documents: list[Document]) -> list[DocumentWithScore]:
+    return [DocumentWithScore(document=document, score=1 - i / 100) for i, document in enumerate(documents)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_llm_reranker() -> None:
+    llm = KeywordChatModel("bees")
+    reranker = LLMReranker(llm, batch_size=3, max_concurrency=2, top_n=2)
+    documents = [Document(content=f"document {i}", metadata={}) for i in range(12)]
+    documents[1] = Document(content="bees make honey", metadata={})
+    documents[2] = Document(content="bees pollinate flowers", metadata={})
+
+    results = await reranker.postprocess_documents(with_scores(documents), query="What do bees do?")
+    assert [result.document for result in results] == [documents[1], documents[2]]
+    assert [result.score for result in results] == [1.0, 1.0]
+    assert llm.max_running == 2
+
+    # batches waiting for a slot are skipped once the top documents got the maximal relevance
+    assert llm.calls == 2
+
+    with pytest.raises(ValueError, match="query"):
+        await reranker.postprocess_documents(with_scores(documents))
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_bm25_reranker() -> None:
+    documents = [
+        Document(content="Steps to rotate credentials", metadata={"title": "Security"}),
+        Document(content="The ERR-42 code means an expired token", metadata={"title": "Error codes"}),
+        Document(content="Overview of the platform", metadata={"title": "Introduction"}),
+        Document(content="How to handle error responses", metadata={"title": "ERR-42 troubleshooting"}),
+    ]
+    reranker = BM25Reranker(fields={"content": 1.0, "title": 2.0}, top_n=3)
+
+    results = await reranker.rerank("ERR-42", with_scores(documents))
+    assert [result.document for result in results] == [documents[3], documents[1], documents[0]]
+    assert results[0].score > results[1].score > results[2].score == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_mmr_reranker() -> None:
+    pytest.importorskip("numpy")
+    documents = [
+        Document(content="bees make honey in hives", metadata={}),
+        Document(content="bees make honey in their hives", metadata={}),
+        Document(content="bees pollinate flowers", metadata={}),
+    ]
+    relevance_only = MMRReranker(BagOfWordsEmbeddingModel(), lambda_mult=1, top_n=2)
+    diverse = MMRReranker(BagOfWordsEmbeddingModel(), lambda_mult=0.5, top_n=2)
+
+    results = await relevance_only.rerank("bees make honey", with_scores(documents))
+    assert [result.document for result in results] == documents[:2]
+    results = await diverse.rerank("bees make honey", with_scores(documents))
+    assert [result.document for result in results] == [documents[0], documents[2]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_reranker_skips_separated_scores() -> None:
+    llm = KeywordChatModel("bees")
+    reranker = LLMReranker(llm, top_n=2, separation=0.5)
+    documents = [Document(content=f"document {i}", metadata={}) for i in range(5)]
+    scores = [0.9, 0.85, 0.3, 0.25, 0.2]
+
+    results = await reranker.rerank(
+        "bees",
+        [DocumentWithScore(document=document, score=score) for document, score in zip(documents, scores, strict=True)],
+    )
+    assert [result.document for result in results] == documents[:2]
+    assert llm.calls == 0
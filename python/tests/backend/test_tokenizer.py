@@ -0,0 +1,97 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from beeai_framework.adapters.openai import OpenAIChatModel
+from beeai_framework.backend import (
+    AnyMessage,
+    AssistantMessage,
+    CalibratedTokenizer,
+    MessageToolCallContent,
+    SystemMessage,
+    TiktokenTokenizer,
+    UserMessage,
+)
+from beeai_framework.memory import TokenMemory
+
+
+@pytest.mark.unit
+def test_tiktoken_tokenizer_counts_messages() -> None:
+    tokenizer = TiktokenTokenizer("cl100k_base")
+    messages: list[AnyMessage] = [
+        SystemMessage("You are a helpful assistant."),
+        UserMessage("What is the weather in Oslo?"),
+        AssistantMessage(MessageToolCallContent(id="call_1", tool_name="get_weather", args='{"city": "Oslo"}')),
+    ]
+
+    expected = sum(tokenizer.count_message(message) for message in messages) + tokenizer.reply_overhead
+    assert tokenizer.count_tokens(messages) == expected
+    assert tokenizer.count_message(messages[0]) == tokenizer.count("system") + 6 + tokenizer.message_overhead
+    assert tokenizer.count_tokens([]) == 0
+
+
+@pytest.mark.unit
+def test_tiktoken_tokenizer_split_and_truncate() -> None:
+    tokenizer = TiktokenTokenizer("cl100k_base")
+    text = " ".join(f"word{i}" for i in range(100))
+
+    chunks = tokenizer.split(text, 20, overlap=5)
+    assert all(tokenizer.count(chunk) <= 20 for chunk in chunks)
+    assert chunks[0] == tokenizer.truncate(text, 20)
+    assert text.startswith(tokenizer.truncate(text, 20))
+    assert tokenizer.truncate("short", 20) == "short"
+
+
+@pytest.mark.unit
+def test_calibrated_tokenizer_observe() -> None:
+    tokenizer = CalibratedTokenizer(chars_per_token=4, smoothing=1)
+    messages = [UserMessage("a" * 100)]
+    assert tokenizer.count("a" * 100) == 25
+
+    tokenizer.observe(messages, prompt_tokens=60)
+    assert tokenizer.chars_per_token < 4
+    assert abs(tokenizer.count_tokens(messages) - 60) <= 1
+
+
+@pytest.mark.unit
+def test_chat_model_tokenizer() -> None:
+    assert isinstance(OpenAIChatModel("gpt-4o", api_key="test").tokenizer, TiktokenTokenizer)
+    assert isinstance(OpenAIChatModel("unknown-model", api_key="test").tokenizer, CalibratedTokenizer)
+
+    tokenizer = CalibratedTokenizer()
+    assert OpenAIChatModel("gpt-4o", api_key="test", tokenizer=tokenizer).tokenizer is tokenizer
+
+
+@pytest.mark.unit
+def test_chat_model_tokenizer_falls_back_when_encoding_is_unavailable(monkeypatch: pytest.MonkeyPatch) -> None:
+    def load_encoding(model_id: str) -> TiktokenTokenizer:
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(TiktokenTokenizer, "for_model", load_encoding)
+    assert isinstance(OpenAIChatModel("gpt-4o", api_key="test").tokenizer, CalibratedTokenizer)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_chat_model_clone_does_not_share_calibration() -> None:
+    llm = OpenAIChatModel("unknown-model", api_key="test")
+    cloned = await llm.clone()
+
+    assert isinstance(llm.tokenizer, CalibratedTokenizer)
+    llm.tokenizer.observe([UserMessage("a" * 100)], prompt_tokens=60)
+    assert isinstance(cloned.tokenizer, CalibratedTokenizer)
+    assert cloned.tokenizer.chars_per_token == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_token_memory_uses_tokenizer() -> None:
+    llm = OpenAIChatModel("gpt-4o", api_key="test")
+    memory = TokenMemory(llm, max_tokens=40, sync_threshold=0)
+
+    for i in range(5):
+        await memory.add(UserMessage(f"This is the message number {i}."))
+
+    assert len(memory.messages) == 5
+    assert memory.tokens_used == sum(llm.tokenizer.count_message(message) for message in memory.messages)
@@ -2,8 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
+from pydantic import BaseModel
 
-from beeai_framework.backend.utils import generate_tool_union_schema
+from beeai_framework.backend.utils import _compiled_tool_union_schemas, generate_tool_union_schema, get_tool_spec
 from beeai_framework.tools import AnyTool, tool
 
 
@@ -100,3 +101,53 @@ def test_generate_tool_union_schema_non_strict(strict: bool) -> None:
             "type": "object",
         },
     }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("strict", [True, False])
+def test_get_tool_spec_is_cached(strict: bool) -> None:
+    spec = get_tool_spec(tool_sum, strict=strict)
+    assert spec["function"]["name"] == "tool_sum"
+    assert spec["function"]["strict"] is strict
+    assert set(spec["function"]["parameters"]["properties"]) == {"a", "b"}
+    assert get_tool_spec(tool_sum, strict=strict) is spec
+
+
+@pytest.mark.unit
+def test_get_tool_spec_invalidation() -> None:
+    class CustomSchema(BaseModel):
+        query: str
+
+    @tool()
+    def search(a: int) -> int:
+        """Search tool"""
+
+        return a
+
+    assert set(get_tool_spec(search, strict=True)["function"]["parameters"]["properties"]) == {"a"}
+    type(search).input_schema = CustomSchema  # type: ignore[assignment]
+    assert set(get_tool_spec(search, strict=True)["function"]["parameters"]["properties"]) == {"query"}
+
+
+@pytest.mark.unit
+def test_generate_tool_union_schema_is_cached() -> None:
+    @tool()
+    def echo(text: str) -> str:
+        """Echo tool"""
+
+        return text
+
+    schema = generate_tool_union_schema([echo, tool_sum], strict=True)
+    assert generate_tool_union_schema([echo, tool_sum], strict=True) is schema
+
+    # unions with short-lived tools do not accumulate
+    for _ in range(100):
+
+        @tool()
+        def greet(name: str) -> str:
+            """Greet tool"""
+
+            return f"Hello {name}!"
+
+        generate_tool_union_schema([echo, greet], strict=True)
+    assert len(_compiled_tool_union_schemas[echo]) <= 16
@@ -0,0 +1,514 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import zlib
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from beeai_framework.adapters.beeai import (
+    BM25Index,
+    ExactVectorIndex,
+    HybridRetriever,
+    IVFVectorIndex,
+    LocalVectorStore,
+    VectorIndex,
+)
+from beeai_framework.adapters.beeai.backend.lexical_index import tokenize
+from beeai_framework.backend import EmbeddingModel, EmbeddingModelOutput
+from beeai_framework.backend.constants import ProviderName
+from beeai_framework.backend.metadata_filter import EqFilter
+from beeai_framework.backend.types import Document, DocumentWithScore, EmbeddingModelInput
+from beeai_framework.backend.vector_store import QueryLike, VectorStore, hash_document
+from beeai_framework.context import RunContext
+
+np = pytest.importorskip("numpy")
+
+
+class BagOfWordsEmbeddingModel(EmbeddingModel):
+    """Dummy model that embeds texts as hashed word counts"""
+
+    @property
+    def model_id(self) -> str:
+        return "bag_of_words"
+
+    @property
+    def provider_id(self) -> ProviderName:
+        return "ollama"
+
+    async def _create(self, input: EmbeddingModelInput, run: RunContext) -> EmbeddingModelOutput:
+        embeddings = np.zeros((len(input.values), 1024), dtype=np.float32)
+        for row, value in enumerate(input.values):
+            for word in value.lower().split():
+                embeddings[row, zlib.crc32(word.encode()) % 1024] += 1
+        return EmbeddingModelOutput(values=input.values, embeddings=embeddings)
+
+
+def create_documents(count: int) -> list[Document]:
+    return [Document(content=f"document {i}", metadata={"index": i}) for i in range(count)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_local_vector_store_search() -> None:
+    store = VectorStore.from_name("beeai:LocalVectorStore", embedding_model=BagOfWordsEmbeddingModel())
+    assert isinstance(store, LocalVectorStore)
+    assert await store.search("bees") == []
+
+    ids = await store.add_documents(
+        [
+            Document(content="Bees make honey", metadata={"topic": "bees"}),
+            Document(content="Ants live in colonies", metadata={"topic": "ants"}),
+            Document(content="Wasps and bees can sting", metadata={"topic": "wasps"}),
+        ]
+    )
+
+    results = await store.search("honey bees", k=2)
+    assert len(set(ids)) == 3
+    assert [result.document.metadata["topic"] for result in results] == ["bees", "wasps"]
+    assert results[0].score > results[1].score > 0
+
+    batched = await store.search_many(["ants colonies", "honey bees"], k=5)
+    assert [len(results) for results in batched] == [3, 3]
+    assert batched[0][0].document.metadata["topic"] == "ants"
+    assert [result.score for result in batched[1]] == pytest.approx([result.score for result in results] + [0.0])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("dtype", ["float32", "float16"])
+def test_local_vector_store_exact_top_k(dtype: str) -> None:
+    rng = np.random.default_rng(42)
+    embeddings = rng.normal(size=(300, 16)).astype(np.float32)
+    queries = rng.normal(size=(4, 16)).astype(np.float32)
+    store = LocalVectorStore(BagOfWordsEmbeddingModel(), dtype=dtype, initial_capacity=8)  # type: ignore[arg-type]
+
+    store.add_embeddings(create_documents(100), embeddings[:100])
+    store.add_embeddings(create_documents(300)[100:], embeddings[100:])
+
+    assert len(store) == 300
+    assert store.embeddings.dtype == np.dtype(dtype)
+    assert np.allclose(np.linalg.norm(store.embeddings.astype(np.float32), axis=1), 1, atol=1e-2)
+
+    normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    expected = np.argsort(-(queries / np.linalg.norm(queries, axis=1, keepdims=True)) @ normalized.T, axis=1)[:, :10]
+    for results, expected_indexes in zip(store.search_by_vectors(queries, k=10), expected, strict=True):
+        found = [result.document.metadata["index"] for result in results]
+        overlap = len(set(found) & set(expected_indexes.tolist()))
+        assert overlap == 10 if dtype == "float32" else overlap >= 9
+
+    with pytest.raises(ValueError, match="dimension"):
+        store.add_embeddings(create_documents(1), np.ones((1, 8)))
+
+
+@pytest.mark.unit
+def test_local_vector_store_ivf_index() -> None:
+    rng = np.random.default_rng(7)
+    topics = rng.normal(size=(20, 32))
+    embeddings = (topics[rng.integers(20, size=2100)] + rng.normal(scale=0.5, size=(2100, 32))).astype(np.float32)
+    documents = create_documents(2100)
+    index = IVFVectorIndex(n_lists=16, n_probe=4, train_threshold=1000)
+    store = LocalVectorStore(BagOfWordsEmbeddingModel(), index=index)
+
+    store.add_embeddings(documents[:500], embeddings[:500])
+    assert not index.is_trained
+    store.add_embeddings(documents[500:2000], embeddings[500:2000])
+    assert index.is_trained
+    store.add_embeddings(documents[2000:], embeddings[2000:])  # assigned to the existing lists
+
+    queries = embeddings[2000:2020] / np.linalg.norm(embeddings[2000:2020], axis=1, keepdims=True)
+    expected = ExactVectorIndex().search(store.embeddings, queries, 10)
+    found = index.search(store.embeddings, queries, 10)
+    overlaps = [
+        {row for row, _ in hits} & {row for row, _ in truth} for hits, truth in zip(found, expected, strict=True)
+    ]
+    assert np.mean([len(overlap) / 10 for overlap in overlaps]) >= 0.9
+    assert all(hits[0][0] == 2000 + i for i, hits in enumerate(found))
+
+    index.n_probe = 16
+    assert [[row for row, _ in hits] for hits in index.search(store.embeddings, queries, 10)] == [
+        [row for row, _ in hits] for hits in expected
+    ]
+
+
+class WordsOnlyEmbeddingModel(BagOfWordsEmbeddingModel):
+    """Ignores identifiers (tokens with digits), like embeddings which blur them"""
+
+    async def _create(self, input: EmbeddingModelInput, run: RunContext) -> EmbeddingModelOutput:
+        values = [" ".join(word for word in value.split() if word.isalpha()) for value in input.values]
+        return await super()._create(input.model_copy(update={"values": values}), run)
+
+
+@pytest.mark.unit
+def test_bm25_index() -> None:
+    index = BM25Index()
+    assert index.search("anything") == []
+
+    index.add(
+        [
+            Document(content="Request failed with ERR-404 while loading the page", metadata={"id": 1}),
+            Document(content="Loading the page failed with ERR-500", metadata={"id": 2}),
+            Document(content="The page has been loaded", metadata={"id": 3}),
+        ],
+        ids=["a", "b", "c"],
+    )
+
+    assert "err-404" in tokenize("see ERR-404") and "404" in tokenize("see ERR-404")
+    results = index.search("err-404 page", k=5)
+    assert [result.document.metadata["id"] for result in results] == [1, 2, 3]
+    assert results[0].score > results[1].score > results[2].score > 0
+    assert index.rank("err-404 page", k=2) == [(0, results[0].score), (1, results[1].score)]
+    assert index.search("unknown") == []
+
+
+@pytest.mark.unit
+def test_bm25_index_compaction() -> None:
+    index = BM25Index(compaction_threshold=0.3)
+    documents = create_documents(10)
+    index.add(documents, [str(i) for i in range(10)])
+    expected = index.search("document 7", k=3)
+
+    index.delete(["0", "1", "2"])
+    assert len(index) == 7 and max(row for row, _ in index.rank("document", k=10)) == 9
+
+    # more than 30 % of the rows are deleted, they get dropped and the rows renumbered
+    index.add([Document(content="document 3 revised", metadata={"index": 3})], ["3"])
+    assert len(index) == 7 and sorted(row for row, _ in index.rank("document", k=10)) == list(range(7))
+    assert index.search("document 7", k=1)[0].document == expected[0].document
+    assert index.search("revised", k=1)[0].document.content == "document 3 revised"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.parametrize("fusion", ["rrf", "weighted"])
+async def test_hybrid_retriever(fusion: str) -> None:
+    store = LocalVectorStore(WordsOnlyEmbeddingModel())
+    retriever = HybridRetriever(store, fusion=fusion, vector_weight=0.4)  # type: ignore[arg-type]
+    documents = [
+        Document(content="Connection refused by the server", metadata={"code": "none"}),
+        Document(
+            content="The payment service returned E1042 connection refused after retries", metadata={"code": "E1042"}
+        ),
+        Document(content="The service returned E2001 timeout", metadata={"code": "E2001"}),
+    ]
+    ids = await retriever.add_documents(documents)
+    assert len(ids) == 3 and len(retriever.lexical_index) == 3
+
+    query = "E1042 connection refused"
+    dense = await store.search(query, k=1)
+    assert dense[0].document.metadata["code"] == "none"
+
+    results = await retriever.search(query, k=2)
+    assert [result.document.metadata["code"] for result in results] == ["E1042", "none"]
+    assert results[0].score > results[1].score
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_hybrid_retriever_from_name() -> None:
+    retriever = VectorStore.from_name("beeai:HybridRetriever", embedding_model=BagOfWordsEmbeddingModel())
+    assert isinstance(retriever, HybridRetriever)
+    assert isinstance(retriever.vector_store, LocalVectorStore)
+
+    await retriever.add_documents(create_documents(10))
+    results = await retriever.search("document 7", k=3)
+    assert len(results) == 3
+    assert results[0].document.metadata["index"] == 7
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.parametrize("index", [ExactVectorIndex(), IVFVectorIndex(n_lists=8, n_probe=2, train_threshold=0)])
+async def test_local_vector_store_filter(index: VectorIndex) -> None:
+    rng = np.random.default_rng(3)
+    store = LocalVectorStore(BagOfWordsEmbeddingModel(), index=index)
+    documents = [
+        Document(content=f"document {i}", metadata={"tenant": f"t{i % 4}", "year": 2000 + i % 25}) for i in range(400)
+    ]
+    embeddings = rng.normal(size=(400, 16)).astype(np.float32)
+    store.add_embeddings(documents, embeddings)
+
+    query = embeddings[5]  # document 5 belongs to the tenant t1
+    results = store.search_by_vectors(query, k=5, filter={"tenant": "t1", "year": {"$gte": 2005}})[0]
+    assert len(results) == 5
+    assert all(r.document.metadata["tenant"] == "t1" and int(r.document.metadata["year"]) >= 2005 for r in results)
+    assert results[0].document.content == "document 5"
+
+    # the selective filter leaves fewer documents than requested
+    selective = EqFilter(field="tenant", value="t1") & EqFilter(field="year", value=2005)
+    results = store.search_by_vectors(query, k=50, filter=selective)[0]
+    assert results[0].document.content == "document 5"
+    assert sorted(r.document.content for r in results) == [f"document {i}" for i in (105, 205, 305, 5)]
+
+    assert store.search_by_vectors(query, k=5, filter={"tenant": "unknown"}) == [[]]
+    results = store.search_by_vectors(query, k=400, filter={"$or": [{"tenant": "t0"}, {"year": {"$lt": 2001}}]})[0]
+    assert all(r.document.metadata["tenant"] == "t0" or r.document.metadata["year"] == 2000 for r in results)
+    assert len(results) == 100 + 12 if isinstance(index, ExactVectorIndex) else len(results) < 112  # approximate
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_hybrid_retriever_filter() -> None:
+    retriever = HybridRetriever(embedding_model=BagOfWordsEmbeddingModel())
+    await retriever.add_documents(
+        [Document(content=f"error E1042 in service {i}", metadata={"tenant": f"t{i % 2}"}) for i in range(6)]
+    )
+
+    results = await retriever.search("E1042", k=6, filter={"tenant": "t1"})
+    assert len(results) == 3
+    assert all(result.document.metadata["tenant"] == "t1" for result in results)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_local_vector_store_persistence(tmp_path: Path) -> None:
+    rng = np.random.default_rng(11)
+    embeddings = rng.normal(size=(60, 16)).astype(np.float32)
+    documents = [Document(content=f"document {i}", metadata={"index": i, "even": i % 2 == 0}) for i in range(60)]
+    store = LocalVectorStore(BagOfWordsEmbeddingModel(), dtype="float16")
+    ids = store.add_embeddings(documents[:40], embeddings[:40])
+    expected = store.search_by_vectors(embeddings[:5], k=3)
+    store.dump(tmp_path)
+
+    loaded = LocalVectorStore.load(tmp_path, BagOfWordsEmbeddingModel())
+    assert isinstance(loaded.embeddings.base, np.memmap)
+    assert len(loaded) == 40 and loaded.dtype == "float16"
+    assert loaded.search_by_vectors(embeddings[:5], k=3) == expected
+
+    # additions are appended to the write-ahead segment, a partially written row is dropped on load
+    loaded.add_embeddings(documents[40:], embeddings[40:])
+    [segment] = tmp_path.glob("*.wal")
+    with segment.open("ab") as file:
+        file.write(b"\x00\x01\x02")
+
+    reloaded = LocalVectorStore.load(tmp_path, BagOfWordsEmbeddingModel())
+    assert len(reloaded) == 60
+    results = reloaded.search_by_vectors(embeddings[55], k=2, filter={"even": False})[0]
+    assert results[0].document == documents[55]
+    assert all(not result.document.metadata["even"] for result in results)
+
+    expected = reloaded.search_by_vectors(embeddings[:5], k=3)
+    reloaded.dump(tmp_path)
+    assert [path.name for path in tmp_path.glob("*.wal")] == []
+    final = LocalVectorStore.load(tmp_path, BagOfWordsEmbeddingModel())
+    assert len(final) == 60 and isinstance(final.embeddings.base, np.memmap)
+    assert final.search_by_vectors(embeddings[:5], k=3) == expected
+    assert len(set(ids)) == 40
+
+
+class CountingEmbeddingModel(BagOfWordsEmbeddingModel):
+    """Dummy model that records embedded texts"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.embedded: list[str] = []
+
+    async def _create(self, input: EmbeddingModelInput, run: RunContext) -> EmbeddingModelOutput:
+        self.embedded.extend(input.values)
+        return await super()._create(input, run)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_local_vector_store_upsert_and_delete() -> None:
+    model = CountingEmbeddingModel()
+    store = LocalVectorStore(model, compaction_threshold=None)
+    documents = create_documents(10)
+    ids = await store.add_documents(documents)
+    assert ids == [hash_document(document) for document in documents]
+    assert await store.add_documents(documents[:5]) == ids[:5]
+    assert len(store) == 10 and len(model.embedded) == 10
+    assert store.lookup([documents[3], Document(content="unknown", metadata={})]) == [ids[3], None]
+
+    # only new content gets embedded, a change of metadata reuses the stored embedding
+    model.embedded.clear()
+    updates = [
+        documents[2],
+        Document(content="bees make honey", metadata={"index": 3}),
+        Document(content="document 4", metadata={"index": 4, "reviewed": True}),
+        Document(content="document 10", metadata={"index": 10}),
+    ]
+    assert await store.upsert(updates, ids=[*ids[2:5], "new"]) == [*ids[2:5], "new"]
+    assert model.embedded == ["bees make honey", "document 10"]
+    assert len(store) == 11
+
+    results = await store.search("document 3", k=11)
+    assert "document 3" not in [result.document.content for result in results]
+    assert (await store.search("honey", k=1))[0].document.metadata == {"index": 3}
+    assert (await store.search("document 4", k=1))[0].document.metadata == {"index": 4, "reviewed": True}
+
+    await store.delete(ids[:2])
+    await store.delete(filter={"index": {"$gte": 8}})
+    await store.delete(ids[5:7], filter={"index": 6})
+    expected = await store.search("document", k=20)
+    assert sorted(int(result.document.metadata["index"]) for result in expected) == [2, 3, 4, 5, 7]
+
+    rows = len(store.embeddings)
+    store.compact()
+    assert len(store.embeddings) == len(store) == 5 < rows
+    assert await store.search("document", k=20) == expected
+    assert await store.upsert([documents[5]]) == [ids[5]]
+    assert (await store.search("document 7", k=1, filter={"index": 7}))[0].document == documents[7]
+
+
+class BlockingEmbeddingModel(BagOfWordsEmbeddingModel):
+    """Dummy model that waits until it is released"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.started = asyncio.Event()
+        self.released = asyncio.Event()
+
+    async def _create(self, input: EmbeddingModelInput, run: RunContext) -> EmbeddingModelOutput:
+        self.started.set()
+        await self.released.wait()
+        return await super()._create(input, run)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_local_vector_store_compacts_while_embedding() -> None:
+    store = LocalVectorStore(BagOfWordsEmbeddingModel())
+    documents = create_documents(10)
+    ids = await store.add_documents(documents)
+
+    model = BlockingEmbeddingModel()
+    store.embedding_model = model
+    updates = [Document(content="document 9", metadata={"index": 9, "reviewed": True}), create_documents(11)[10]]
+    upsert = asyncio.create_task(store.upsert(updates, ids=[ids[9], "new"]))
+    await model.started.wait()
+    await store.delete(ids[:5])  # compacts the store, rows get renumbered
+    model.released.set()
+
+    assert await upsert == [ids[9], "new"]
+    assert len(store) == 6
+    assert (await store.search("document 9", k=1))[0].document == updates[0]
+    for i in range(5, 11):  # every document kept its own embedding
+        assert (await store.search(f"document {i}", k=1))[0].document.content == f"document {i}"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_hybrid_retriever_searches_lexical_index_while_embedding() -> None:
+    model = BlockingEmbeddingModel()
+
+    class RecordingBM25Index(BM25Index):
+        def __init__(self) -> None:
+            super().__init__()
+            self.embedded_before_search: list[bool] = []
+
+        def search(self, query: str, k: int = 4, **kwargs: Any) -> list[DocumentWithScore]:
+            self.embedded_before_search.append(model.released.is_set())
+            return super().search(query, k, **kwargs)
+
+    store = LocalVectorStore(BagOfWordsEmbeddingModel())
+    lexical_index = RecordingBM25Index()
+    retriever = HybridRetriever(store, lexical_index=lexical_index)
+    await retriever.add_documents(create_documents(10))
+
+    store.embedding_model = model
+    search = asyncio.create_task(retriever.search("document 7", k=1))
+    await model.started.wait()
+    model.released.set()
+    assert (await search)[0].document.metadata["index"] == 7
+    assert lexical_index.embedded_before_search == [False]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_local_vector_store_keeps_duplicates_without_deduplication() -> None:
+    store = LocalVectorStore(BagOfWordsEmbeddingModel(), deduplicate=False)
+    document = create_documents(1)[0]
+    ids = await store.add_documents([document, document])
+    ids += await store.add_documents([document])
+    assert ids[0] == hash_document(document) and len(set(ids)) == len(store) == 3
+    assert all(id.startswith(ids[0]) for id in ids)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_local_vector_store_compacts_persisted_files(tmp_path: Path) -> None:
+    store = LocalVectorStore(BagOfWordsEmbeddingModel(), compaction_threshold=0.5)
+    ids = await store.add_documents(create_documents(10))
+    store.dump(tmp_path)
+
+    await store.delete(ids[:4])
+    loaded = LocalVectorStore.load(tmp_path, BagOfWordsEmbeddingModel(), compaction_threshold=0.5)
+    assert len(loaded) == 6
+    assert len(loaded.embeddings) == 10
+
+    # the threshold is exceeded, the matrix and the database get rewritten
+    await loaded.delete(ids[4:6])
+    assert len(loaded.embeddings) == 4
+    assert len(list(tmp_path.glob("embeddings-*.npy"))) == len(list(tmp_path.glob("documents-*.sqlite"))) == 1
+
+    reloaded = LocalVectorStore.load(tmp_path, BagOfWordsEmbeddingModel())
+    results = await reloaded.search("document", k=10)
+    assert sorted(int(result.document.metadata["index"]) for result in results) == [6, 7, 8, 9]
+    assert reloaded.lookup(create_documents(10)) == [None] * 6 + ids[6:]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_local_vector_store_concurrent_persisted_writes(tmp_path: Path) -> None:
+    store = LocalVectorStore(BagOfWordsEmbeddingModel())
+    store.dump(tmp_path)
+
+    documents = create_documents(30)
+    batches = await asyncio.gather(*(store.add_documents(documents[i : i + 5]) for i in range(0, 30, 5)))
+    ids = [id for batch in batches for id in batch]
+    assert len(set(ids)) == 30
+
+    more = create_documents(35)[30:]
+    response = await store.embedding_model.create([document.content for document in more], dtype="float32")
+    ids += await store.aadd_embeddings(more, response.to_array())
+
+    reloaded = LocalVectorStore.load(tmp_path, BagOfWordsEmbeddingModel())
+    assert reloaded.lookup([*documents, *more]) == ids
+    assert np.allclose(reloaded.embeddings, store.embeddings, atol=1e-3)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_hybrid_retriever_upsert_and_delete() -> None:
+    retriever = HybridRetriever(embedding_model=BagOfWordsEmbeddingModel())
+    ids = await retriever.upsert(
+        [Document(content=f"error E10{i} in service {i}", metadata={"tenant": f"t{i % 2}"}) for i in range(4)]
+    )
+    assert await retriever.add_documents([Document(content="error E100 in service 0", metadata={"tenant": "t0"})]) == [
+        ids[0]
+    ]
+    assert len(retriever.lexical_index) == 4
+
+    await retriever.upsert([Document(content="warning W7 in service 1", metadata={"tenant": "t1"})], ids=[ids[1]])
+    await retriever.delete(filter={"tenant": "t0"})
+    assert len(retriever.lexical_index) == 2
+    assert retriever.lexical_index.search("E101") == []
+
+    results = await retriever.search("service", k=4)
+    assert sorted(result.document.content for result in results) == [
+        "error E103 in service 3",
+        "warning W7 in service 1",
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_vector_store_without_upserts() -> None:
+    class AppendOnlyVectorStore(VectorStore):
+        @classmethod
+        def _class_from_name(cls, class_name: str, embedding_model: EmbeddingModel, **kwargs: Any) -> VectorStore:
+            return cls()
+
+        async def add_documents(self, documents: list[Document]) -> list[str]:
+            return []
+
+        async def search(self, query: QueryLike, k: int = 4, **kwargs: Any) -> list[DocumentWithScore]:
+            return []
+
+    store = AppendOnlyVectorStore()
+    with pytest.raises(NotImplementedError, match="does not support upserts"):
+        await store.upsert(create_documents(1))
+    with pytest.raises(NotImplementedError, match="does not support deletions"):
+        await store.delete(["a"])
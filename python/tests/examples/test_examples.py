@@ -1,3 +1,4 @@
+import importlib.util
 import os
 import pathlib
 import runpy
@@ -54,6 +55,7 @@ exclude = list(
             "integrations/langgraph_example.py" if os.getenv("OLLAMA_API_BASE") else None,
             "agents/rag_agent.py",
             "backend/module_loading.py",
+            "backend/vector_index_benchmark.py" if importlib.util.find_spec("numpy") is None else None,
             # Interactive example
             "agents/experimental/requirement/multi_agent.py",
         ],
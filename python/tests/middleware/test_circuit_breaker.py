@@ -0,0 +1,120 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from beeai_framework.emitter import EventMeta
+from beeai_framework.middleware.circuit_breaker import (
+    CircuitBreakerMiddleware,
+    CircuitBreakerOpenError,
+    CircuitBreakerState,
+    CircuitBreakerStateChangeEvent,
+)
+from beeai_framework.tools import AnyTool, StringToolOutput, ToolError, tool
+
+"""
+Utility functions and classes
+"""
+
+
+def create_flaky_tool(outcomes: list[bool]) -> tuple[AnyTool, list[int]]:
+    calls: list[int] = []
+
+    @tool
+    def flaky_tool(query: str) -> StringToolOutput:
+        """Echoes the query unless the provider is degraded."""
+        calls.append(len(calls))
+        if not outcomes.pop(0):
+            raise ToolError("Provider is degraded.")
+        return StringToolOutput(query)
+
+    return flaky_tool, calls
+
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_circuit_breaker_opens_and_recovers() -> None:
+    breaker = CircuitBreakerMiddleware(failure_rate_threshold=0.5, window_size=4, minimum_calls=2, reset_timeout=0.1)
+    changes: list[tuple[str, str]] = []
+
+    def on_change(data: CircuitBreakerStateChangeEvent, _: EventMeta) -> None:
+        changes.append((data.previous, data.current))
+
+    breaker.emitter.on("state_change", on_change)
+
+    flaky_tool, calls = create_flaky_tool([False, False, True])
+    flaky_tool.middlewares.append(breaker)
+
+    for _ in range(2):
+        with pytest.raises(ToolError):
+            await flaky_tool.run({"query": "hello"})
+
+    assert breaker.state.value == "open"
+    with pytest.raises(CircuitBreakerOpenError):
+        await flaky_tool.run({"query": "hello"})
+    assert len(calls) == 2
+
+    await asyncio.sleep(0.15)
+    result = await flaky_tool.run({"query": "hello"})
+    assert result.get_text_content() == "hello"
+    assert breaker.state == CircuitBreakerState.CLOSED
+    assert changes == [
+        (CircuitBreakerState.CLOSED, CircuitBreakerState.OPEN),
+        (CircuitBreakerState.OPEN, CircuitBreakerState.HALF_OPEN),
+        (CircuitBreakerState.HALF_OPEN, CircuitBreakerState.CLOSED),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_circuit_breaker_latency_threshold() -> None:
+    breaker = CircuitBreakerMiddleware(latency_threshold=0.01, window_size=1, minimum_calls=1, reset_timeout=60)
+
+    @tool
+    async def slow_tool(**kwargs: Any) -> str:
+        """Responds slowly."""
+        await asyncio.sleep(0.05)
+        return "done"
+
+    slow_tool.middlewares.append(breaker)
+    assert (await slow_tool.run({})).get_text_content() == "done"
+    assert breaker.state.value == "open"
+
+    with pytest.raises(CircuitBreakerOpenError):
+        await slow_tool.run({})
+
+    breaker.reset()
+    assert breaker.state == CircuitBreakerState.CLOSED
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_circuit_breaker_releases_probe_when_run_fails_early() -> None:
+    breaker = CircuitBreakerMiddleware(window_size=1, minimum_calls=1, reset_timeout=0.05)
+    flaky_tool, calls = create_flaky_tool([False, True])
+    flaky_tool.middlewares.append(breaker)
+
+    with pytest.raises(ToolError):
+        await flaky_tool.run({"query": "hello"})
+    await asyncio.sleep(0.1)
+    assert breaker.state.value == "half_open"
+
+    def failing_middleware(_: Any) -> None:
+        raise ValueError("Middleware has failed.")
+
+    with pytest.raises(ValueError):
+        await flaky_tool.run({"query": "hello"}).middleware(failing_middleware)
+    assert breaker.state.value == "half_open"
+
+    result = await flaky_tool.run({"query": "hello"})
+    assert result.get_text_content() == "hello"
+    assert breaker.state == CircuitBreakerState.CLOSED
+    assert len(calls) == 2
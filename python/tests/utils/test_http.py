@@ -0,0 +1,74 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import httpx
+import pytest
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+from openai import AsyncOpenAI
+
+from beeai_framework.adapters.azure_openai import AzureOpenAIChatModel
+from beeai_framework.adapters.groq import GroqChatModel
+from beeai_framework.adapters.ollama import OllamaChatModel
+from beeai_framework.adapters.openai import OpenAIChatModel
+from beeai_framework.utils.http import HTTPTransport, HTTPTransportConfig
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_http_transport_pools_clients_per_origin() -> None:
+    transport = HTTPTransport()
+    transport.configure("https://api.example.com", HTTPTransportConfig(max_connections=2))
+
+    client = transport.get_client("https://api.example.com/v1/chat")
+    assert transport.get_client("https://API.example.com/v1/embeddings") is client
+    assert transport.get_client("https://other.example.com") is not client
+    assert transport.get_client("https://api.example.com", proxy="http://proxy:8080") is not client
+    assert client._transport._pool._max_connections == 2  # type: ignore[attr-defined]
+    assert client.follow_redirects is False
+    assert client.timeout.read == 5.0
+
+    await transport.aclose()
+    assert client.is_closed
+    assert transport.get_client("https://api.example.com") is not client
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_http_transport_http2() -> None:
+    pytest.importorskip("h2")
+    transport = HTTPTransport()
+    transport.configure("https://api.example.com", HTTPTransportConfig(http2=True))
+
+    client = transport.get_client("https://api.example.com")
+    assert client._transport._pool._http2 is True  # type: ignore[attr-defined]
+    await transport.aclose()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_litellm_models_use_pooled_clients() -> None:
+    transport = HTTPTransport()
+    groq = GroqChatModel("llama-3.1-8b-instant", api_key="test")
+    groq.http_transport = transport
+
+    client = groq._get_client_params()["client"]
+    assert isinstance(client, AsyncHTTPHandler)
+    assert isinstance(client.client, httpx.AsyncClient)
+    assert client.client.timeout.read is None  # LiteLLM sets timeouts per request
+    assert client is groq._get_client_params()["client"]
+
+    groq.http_transport = None
+    assert groq._get_client_params() == {}
+
+    openai = OpenAIChatModel("gpt-4o", api_key="test")
+    openai.http_transport = transport
+    assert isinstance(openai._get_client_params()["client"], AsyncOpenAI)
+
+    ollama = OllamaChatModel("llama3.1")
+    ollama.http_transport = transport
+    assert isinstance(ollama._get_client_params()["client"], AsyncOpenAI)
+
+    azure = AzureOpenAIChatModel("gpt-4o", settings={"api_key": "k", "base_url": "b", "api_version": "v"})
+    azure.http_transport = transport
+    assert azure._get_client_params() == {}  # left to LiteLLM
+    await transport.aclose()
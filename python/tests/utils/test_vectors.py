@@ -0,0 +1,36 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import base64
+
+import pytest
+
+from beeai_framework.utils.vectors import cosine_similarity, decode_embedding, to_array
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.unit
+def test_to_array() -> None:
+    array = to_array([[1, 2], [3, 4]], "float16")
+    assert array.dtype == np.float16 and array.flags.c_contiguous
+    assert to_array(array, "float16") is array
+    assert to_array([]).shape == (0, 0)
+
+    with pytest.raises(ValueError, match="2D"):
+        to_array(np.array([1.0, 2.0]))
+
+
+@pytest.mark.unit
+def test_decode_embedding() -> None:
+    vector = np.array([0.25, -1.5], dtype="<f4")
+    assert decode_embedding(base64.b64encode(vector.tobytes()).decode()).tolist() == [0.25, -1.5]
+    assert decode_embedding([0.25, -1.5], "float16").dtype == np.float16
+
+
+@pytest.mark.unit
+def test_cosine_similarity() -> None:
+    matrix = np.array([[1, 0], [0, 2], [0, 0]], dtype=np.float16)
+
+    assert cosine_similarity(np.array([3, 0]), matrix).tolist() == [1.0, 0.0, 0.0]
+    assert cosine_similarity(np.array([[0, 1], [1, 1]]), matrix).shape == (2, 3)